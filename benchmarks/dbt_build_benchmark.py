@@ -0,0 +1,223 @@
+"""Benchmark the dbt bronze and silver builds against synthetic raw trees.
+
+Each scale gets its own generated raw tree and scratch DuckDB file. Every
+model runs in its own ``dbt run --select`` so the child's peak RSS can be
+attributed to that model; wall time comes from dbt's run_results.json.
+
+Usage:
+    python benchmarks/dbt_build_benchmark.py --scales 1 10 100 \
+        --output bench.json --baseline previous.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import duckdb
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.synthetic_raw import RawScale, generate_raw_tree  # noqa: E402
+
+DBT_DIR = project_root / "dbt"
+
+# Build order matters: silver models read the bronze tables built before them
+MODELS: List[Tuple[str, str]] = [
+    ("contracts", "main_bronze.contracts"),
+    ("wr_season", "main_bronze.wr_season"),
+    ("wr_game", "main_bronze.wr_game"),
+    ("fact_contracts", "main_silver.fact_contracts"),
+    ("qb_contracts", "main_silver.qb_contracts"),
+]
+
+
+@dataclass
+class ModelTiming:
+    """One model's build measurements at one scale."""
+
+    scale: int
+    model: str
+    status: str
+    wall_time_s: float
+    rows: int
+    rows_per_sec: float
+    peak_rss_mb: float
+
+
+def run_dbt(args: List[str], env: Dict[str, str]) -> Tuple[int, float, str]:
+    """Run a dbt command and return (returncode, peak RSS in MB, output)."""
+    proc = subprocess.Popen(
+        ["dbt", *args, "--profiles-dir", str(DBT_DIR)],
+        cwd=DBT_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    output = proc.stdout.read()
+    # wait4 gives the rusage of this child alone, unlike RUSAGE_CHILDREN
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return proc.returncode, rusage.ru_maxrss / divisor, output
+
+
+def read_run_result(target_path: Path, model: str) -> Tuple[str, float]:
+    """Return (status, execution_time) for a model from run_results.json."""
+    with open(target_path / "run_results.json") as f:
+        results = json.load(f)["results"]
+    for result in results:
+        if result["unique_id"].endswith(f".{model}"):
+            return result["status"], result["execution_time"]
+    return "missing", 0.0
+
+
+def benchmark_scale(scale: RawScale, workdir: Path) -> List[ModelTiming]:
+    """Generate a raw tree at one scale and time every model build."""
+    raw_root = workdir / "raw"
+    db_path = workdir / "bench.duckdb"
+    target_path = workdir / "target"
+
+    print(f"\n📦 Generating scale {scale.scale}x raw tree in {raw_root}")
+    source_rows = generate_raw_tree(raw_root, scale)
+    print(f"   Source rows: {source_rows}")
+
+    env = {**os.environ, "NFL_WAREHOUSE_PATH": str(db_path)}
+    common = [
+        "--target-path",
+        str(target_path),
+        "--log-path",
+        str(workdir / "logs"),
+        "--vars",
+        json.dumps({"raw_data_root": str(raw_root)}),
+    ]
+
+    code, _, output = run_dbt(["seed", *common], env)
+    if code != 0:
+        raise RuntimeError(f"dbt seed failed:\n{output}")
+
+    timings = []
+    for model, relation in MODELS:
+        code, peak_mb, output = run_dbt(["run", "--select", model, *common], env)
+        status, seconds = read_run_result(target_path, model)
+        rows = 0
+        if code == 0:
+            with duckdb.connect(str(db_path), read_only=True) as conn:
+                rows = conn.execute(f"SELECT COUNT(*) FROM {relation}").fetchone()[0]
+        else:
+            print(output)
+        timing = ModelTiming(
+            scale=scale.scale,
+            model=model,
+            status=status,
+            wall_time_s=round(seconds, 4),
+            rows=rows,
+            rows_per_sec=round(rows / seconds, 1) if seconds > 0 else 0.0,
+            peak_rss_mb=round(peak_mb, 1),
+        )
+        print(
+            f"   {model:<16} {timing.status:<8} {timing.wall_time_s:>8.3f}s "
+            f"{timing.rows:>10,} rows {timing.rows_per_sec:>12,.0f} rows/s "
+            f"{timing.peak_rss_mb:>8.1f} MB"
+        )
+        timings.append(timing)
+    return timings
+
+
+def find_regressions(
+    current: List[ModelTiming],
+    baseline: List[dict],
+    max_regression: float,
+    min_time: float = 0.5,
+) -> List[str]:
+    """Compare rows/sec and peak memory against a previous benchmark run.
+
+    Builds faster than ``min_time`` seconds in the baseline are dominated by
+    dbt's fixed startup cost, so their throughput is not compared.
+    """
+    previous = {(b["scale"], b["model"]): b for b in baseline}
+    problems = []
+    for t in current:
+        base = previous.get((t.scale, t.model))
+        if base is None or base["wall_time_s"] < min_time:
+            continue
+        if t.rows_per_sec < base["rows_per_sec"] * (1 - max_regression):
+            problems.append(
+                f"{t.model} @ {t.scale}x: {t.rows_per_sec:,.0f} rows/s "
+                f"vs baseline {base['rows_per_sec']:,.0f}"
+            )
+        if t.peak_rss_mb > base["peak_rss_mb"] * (1 + max_regression):
+            problems.append(
+                f"{t.model} @ {t.scale}x: {t.peak_rss_mb:.1f} MB peak "
+                f"vs baseline {base['peak_rss_mb']:.1f}"
+            )
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and return a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--seasons", type=int, default=RawScale.seasons)
+    parser.add_argument("--players", type=int, default=RawScale.players)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed fractional slowdown or memory growth vs the baseline",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="Skip throughput checks for baseline builds faster than this (s)",
+    )
+    parser.add_argument(
+        "--workdir", type=Path, help="Keep generated trees here instead of a tmpdir"
+    )
+    args = parser.parse_args(argv)
+
+    results: List[ModelTiming] = []
+    for factor in args.scales:
+        scale = RawScale(seasons=args.seasons, players=args.players, scale=factor)
+        if args.workdir:
+            workdir = args.workdir / f"scale_{factor}"
+            workdir.mkdir(parents=True, exist_ok=True)
+            results.extend(benchmark_scale(scale, workdir))
+        else:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                results.extend(benchmark_scale(scale, Path(tmpdir)))
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        print(f"\n✅ Results saved to {args.output}")
+
+    if args.baseline:
+        problems = find_regressions(
+            results,
+            json.loads(args.baseline.read_text()),
+            args.max_regression,
+            args.min_time,
+        )
+        if problems:
+            print("\n❌ Ingest regressions:")
+            for p in problems:
+                print(f"   {p}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
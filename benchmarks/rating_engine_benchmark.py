@@ -0,0 +1,308 @@
+"""Benchmark the opponent-adjusted rating engine (eda/adj.py) on synthetic leagues.
+
+Each scale gets a generated league with known ratings. The pipeline is
+timed stage by stage: WRModel.prepare_data, compute_game_weights, fit,
+fit_with_quality_weighting and batch scoring with predict_many. The fits
+also report how well they recover the true player and defense ratings.
+Peak memory per stage is traced with tracemalloc in a second pass, so the
+tracing overhead never shows up in the wall times.
+
+Usage:
+    python benchmarks/rating_engine_benchmark.py --scales 1 4 16 \
+        --output bench.json --baseline previous.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add project root (benchmarks package) and eda/ (the rating engine) to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "eda"))
+
+from benchmarks.synthetic_league import (  # noqa: E402
+    League,
+    LeagueScale,
+    generate_league,
+    recovery_error,
+)
+
+with open(os.devnull, "w") as _quiet, contextlib.redirect_stdout(_quiet):
+    import adj  # noqa: E402  (prints its own progress on import)
+
+STAGES = [
+    "prepare_data",
+    "compute_game_weights",
+    "fit",
+    "fit_with_quality_weighting",
+    "predict_many",
+]
+
+
+@dataclass
+class StageResult:
+    """One pipeline stage's measurements at one scale."""
+
+    scale: int
+    stage: str
+    rows: int
+    wall_time_s: float
+    rows_per_sec: float
+    peak_mb: Optional[float] = None
+    n_iter: Optional[int] = None
+    converged: Optional[bool] = None
+    n_components: Optional[int] = None
+    player_rmse: Optional[float] = None
+    player_corr: Optional[float] = None
+    defense_rmse: Optional[float] = None
+
+
+def run_pipeline(
+    league: League, solver: Dict, trace_memory: bool = False
+) -> Dict[str, dict]:
+    """Run every stage once on a fresh copy of the league.
+
+    Returns:
+        Per stage: seconds, peak MB (when tracing) and, for the fits,
+        solver diagnostics and recovery errors
+
+    """
+    out: Dict[str, dict] = {}
+
+    def stage(name: str, fn: Callable):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        # The engine prints per row; send it to devnull, not to a buffer
+        with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+            result = fn()
+        out[name] = {"seconds": time.perf_counter() - start}
+        if trace_memory:
+            out[name]["peak_mb"] = (tracemalloc.get_traced_memory()[1] - base) / 2**20
+        return result
+
+    def diagnostics(model) -> dict:
+        player_rmse, player_corr = recovery_error(
+            model.player_ratings, league.player_skill, model.player_components
+        )
+        defense_rmse, _ = recovery_error(
+            model.opponent_ratings, league.defense_strength, model.opponent_components
+        )
+        return {
+            "n_iter": model.n_iter,
+            "converged": model.converged,
+            "n_components": model.n_components,
+            "player_rmse": player_rmse,
+            "player_corr": player_corr,
+            "defense_rmse": defense_rmse,
+        }
+
+    with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+        model = adj.ModelFactory.create_model("WR")
+        quality_model = adj.ModelFactory.create_model("WR")
+
+    matchups = stage(
+        "prepare_data", lambda: model.position.prepare_data(league.raw_data)
+    )
+    stage("compute_game_weights", lambda: model.compute_game_weights(matchups))
+    stage("fit", lambda: model.fit(matchups, **solver))
+    out["fit"].update(diagnostics(model))
+    stage(
+        "fit_with_quality_weighting",
+        lambda: quality_model.fit_with_quality_weighting(matchups, **solver),
+    )
+    out["fit_with_quality_weighting"].update(diagnostics(quality_model))
+
+    players = [m.player_id for m in matchups]
+    opponents = [m.opponent_id for m in matchups]
+    stage("predict_many", lambda: model.predict_many(players, opponents))
+    return out
+
+
+def benchmark_scale(
+    scale: LeagueScale, solver: Dict, trace_memory: bool
+) -> List[StageResult]:
+    """Generate a league at one scale and measure every stage."""
+    print(
+        f"\n🏈 Scale {scale.scale}x: {scale.n_players:,} players, "
+        f"{scale.defenses} defenses, {scale.n_seasons} season(s), "
+        f"{scale.n_games:,} games, connectivity {scale.connectivity}"
+    )
+    league = generate_league(scale)
+    timed = run_pipeline(league, solver)
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            traced = run_pipeline(league, solver, trace_memory=True)
+        finally:
+            tracemalloc.stop()
+
+    results = []
+    for name in STAGES:
+        seconds = timed[name]["seconds"]
+        extra = {
+            k: v for k, v in timed[name].items() if k not in ("seconds", "peak_mb")
+        }
+        result = StageResult(
+            scale=scale.scale,
+            stage=name,
+            rows=scale.n_games,
+            wall_time_s=round(seconds, 4),
+            rows_per_sec=round(scale.n_games / seconds, 1) if seconds > 0 else 0.0,
+            peak_mb=round(traced[name]["peak_mb"], 1) if trace_memory else None,
+            **extra,
+        )
+        memory = f"{result.peak_mb:>8.1f} MB" if trace_memory else ""
+        accuracy = (
+            f"  {result.n_iter:>4} iters  rmse {result.player_rmse:.4f}"
+            f"  r {result.player_corr:.3f}"
+            if result.player_rmse is not None
+            else ""
+        )
+        print(
+            f"   {name:<28} {result.wall_time_s:>8.3f}s "
+            f"{result.rows_per_sec:>12,.0f} rows/s {memory}{accuracy}"
+        )
+        results.append(result)
+    return results
+
+
+def find_regressions(
+    current: List[StageResult],
+    baseline: List[dict],
+    max_regression: float,
+    max_error_regression: float,
+    min_time: float = 0.05,
+) -> List[str]:
+    """Compare throughput, peak memory and recovery error against a previous run.
+
+    Stages faster than ``min_time`` seconds in the baseline are too noisy
+    for throughput checks; their memory and accuracy are still compared.
+    """
+    previous = {(b["scale"], b["stage"]): b for b in baseline}
+    problems = []
+    for r in current:
+        base = previous.get((r.scale, r.stage))
+        if base is None:
+            continue
+        where = f"{r.stage} @ {r.scale}x"
+        if base["wall_time_s"] >= min_time and r.rows_per_sec < base["rows_per_sec"] * (
+            1 - max_regression
+        ):
+            problems.append(
+                f"{where}: {r.rows_per_sec:,.0f} rows/s "
+                f"vs baseline {base['rows_per_sec']:,.0f}"
+            )
+        if (
+            r.peak_mb is not None
+            and base.get("peak_mb") is not None
+            and r.peak_mb > base["peak_mb"] * (1 + max_regression)
+        ):
+            problems.append(
+                f"{where}: {r.peak_mb:.1f} MB peak vs baseline {base['peak_mb']:.1f}"
+            )
+        if base.get("converged") and r.converged is False:
+            problems.append(f"{where}: no longer converges")
+        if (
+            r.player_rmse is not None
+            and base.get("player_rmse") is not None
+            and r.player_rmse > base["player_rmse"] * (1 + max_error_regression)
+        ):
+            problems.append(
+                f"{where}: player RMSE {r.player_rmse:.4f} "
+                f"vs baseline {base['player_rmse']:.4f}"
+            )
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and return a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--players", type=int, default=LeagueScale.players)
+    parser.add_argument("--defenses", type=int, default=LeagueScale.defenses)
+    parser.add_argument("--seasons", type=int, default=LeagueScale.seasons)
+    parser.add_argument("--weeks", type=int, default=LeagueScale.weeks)
+    parser.add_argument(
+        "--games-per-week", type=int, default=LeagueScale.games_per_week
+    )
+    parser.add_argument(
+        "--connectivity",
+        type=float,
+        default=LeagueScale.connectivity,
+        help="Chance a game is against a defense outside the player's block",
+    )
+    parser.add_argument("--seed", type=int, default=LeagueScale.seed)
+    parser.add_argument("--omega", type=float, default=1.0)
+    parser.add_argument("--anderson", type=int, default=0)
+    parser.add_argument("--n-jobs", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed fractional slowdown or memory growth vs the baseline",
+    )
+    parser.add_argument(
+        "--max-error-regression",
+        type=float,
+        default=0.05,
+        help="Allowed fractional growth of the player rating RMSE",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Skip throughput checks for baseline stages faster than this (s)",
+    )
+    args = parser.parse_args(argv)
+
+    solver = {"omega": args.omega, "anderson": args.anderson, "n_jobs": args.n_jobs}
+    results: List[StageResult] = []
+    for factor in args.scales:
+        scale = LeagueScale(
+            players=args.players,
+            defenses=args.defenses,
+            seasons=args.seasons,
+            weeks=args.weeks,
+            games_per_week=args.games_per_week,
+            connectivity=args.connectivity,
+            seed=args.seed,
+            scale=factor,
+        )
+        results.extend(benchmark_scale(scale, solver, not args.no_memory))
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        print(f"\n✅ Results saved to {args.output}")
+
+    if args.baseline:
+        problems = find_regressions(
+            results,
+            json.loads(args.baseline.read_text()),
+            args.max_regression,
+            args.max_error_regression,
+            args.min_time,
+        )
+        if problems:
+            print("\n❌ Rating engine regressions:")
+            for p in problems:
+                print(f"   {p}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
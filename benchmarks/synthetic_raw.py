@@ -0,0 +1,218 @@
+"""Synthetic raw data trees for benchmarking the dbt ingest.
+
+Writes files shaped like the real ``data/raw`` layout:
+
+    <root>/NFL_Contracts.csv
+    <root>/<year>/WR_season.csv
+    <root>/<year>/<week>/WR.csv
+"""
+
+import csv
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+CONTRACT_HEADER = [
+    "Rank",
+    "Player",
+    "Pos",
+    "Team",
+    "Age",
+    "Start",
+    "End",
+    "Yrs",
+    "Value",
+    "APY",
+    "APY as % Of Cap At Signing",
+    "Signing Bonus",
+    "Guaranteed at Signing",
+    "Practical Guarantee",
+    "2yr Cash",
+    "3yr Cash",
+]
+
+WR_HEADER = [
+    "PlayerName",
+    "PlayerId",
+    "Pos",
+    "Team",
+    "PlayerOpponent",
+    "PassingYDS",
+    "PassingTD",
+    "PassingInt",
+    "RushingYDS",
+    "RushingTD",
+    "ReceivingRec",
+    "ReceivingYDS",
+    "ReceivingTD",
+    "RetTD",
+    "FumTD",
+    "2PT",
+    "Fum",
+    "FanPtsAgainst-pts",
+    "TouchCarries",
+    "TouchReceptions",
+    "Touches",
+    "TargetsReceptions",
+    "Targets",
+    "ReceptionPercentage",
+    "RzTarget",
+    "RzTouch",
+    "RzG2G",
+    "Rank",
+    "TotalPoints",
+]
+
+POSITIONS = ["QB", "WR", "RB", "TE", "CB", "S", "ED", "IDL", "LB", "LT", "RT", "C"]
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+    "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+    "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]  # fmt: skip
+
+
+@dataclass(frozen=True)
+class RawScale:
+    """Size of a synthetic raw tree at 1x; ``scale`` multiplies every axis."""
+
+    seasons: int = 3
+    players: int = 120
+    weeks: int = 18
+    contracts_per_player: int = 4
+    first_season: int = 2015
+    scale: int = 1
+
+    @property
+    def n_seasons(self) -> int:
+        """Number of seasons written at this scale."""
+        return self.seasons * self.scale
+
+    @property
+    def n_players(self) -> int:
+        """Number of distinct WRs written at this scale."""
+        return self.players * self.scale
+
+
+def _money(value: int) -> str:
+    return f"${value:,}"
+
+
+def write_contracts(path: Path, scale: RawScale, rng: random.Random) -> int:
+    """Write an NFL_Contracts.csv with a title row and repeated header rows."""
+    n_rows = scale.n_players * scale.contracts_per_player
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Active Contracts"])
+        writer.writerow(CONTRACT_HEADER)
+        for i in range(n_rows):
+            # The source export repeats its header every few hundred rows
+            if i and i % 500 == 0:
+                writer.writerow(CONTRACT_HEADER)
+            start = scale.first_season + rng.randrange(scale.n_seasons)
+            years = rng.randint(1, 5)
+            value = rng.randint(1, 250) * 1_000_000
+            writer.writerow(
+                [
+                    i + 1,
+                    f"Player {i % scale.n_players}",
+                    rng.choice(POSITIONS),
+                    rng.choice(TEAMS),
+                    rng.randint(21, 35),
+                    start,
+                    start + years - 1,
+                    years,
+                    _money(value),
+                    _money(value // years),
+                    f"{rng.uniform(0.5, 20):.2f}%",
+                    _money(value // 5),
+                    _money(value // 3),
+                    _money(value // 2),
+                    _money(int(value * 0.4)),
+                    _money(int(value * 0.55)),
+                ]
+            )
+    return n_rows
+
+
+def _wr_row(player: int, opponent: str, rng: random.Random, games: int = 1) -> list:
+    targets = rng.randint(1, 12) * games
+    receptions = rng.randint(0, targets)
+    yards = receptions * rng.randint(5, 15)
+    return [
+        f"Player {player}",
+        10_000 + player,
+        "WR",
+        TEAMS[player % len(TEAMS)],
+        opponent,
+        0,
+        0,
+        0,
+        rng.randint(0, 20),
+        0,
+        receptions,
+        yards,
+        rng.randint(0, 2) * games,
+        0,
+        0,
+        0,
+        rng.randint(0, 1),
+        round(rng.uniform(0, 30), 1),
+        rng.randint(0, 2),
+        receptions,
+        receptions,
+        receptions,
+        targets,
+        round(100 * receptions / targets, 1),
+        rng.randint(0, 3),
+        rng.randint(0, 3),
+        rng.randint(0, 1),
+        player + 1,
+        round(yards / 10, 1),
+    ]
+
+
+def write_wr_tree(root: Path, scale: RawScale, rng: random.Random) -> dict:
+    """Write per-season and per-week WR files; return row counts per file kind."""
+    counts = {"wr_season": 0, "wr_game": 0}
+    for s in range(scale.n_seasons):
+        season_dir = root / str(scale.first_season + s)
+        season_dir.mkdir(parents=True, exist_ok=True)
+        with open(season_dir / "WR_season.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(WR_HEADER)
+            for p in range(scale.n_players):
+                writer.writerow(_wr_row(p, "", rng, games=17))
+        counts["wr_season"] += scale.n_players
+
+        for week in range(1, scale.weeks + 1):
+            week_dir = season_dir / str(week)
+            week_dir.mkdir(exist_ok=True)
+            with open(week_dir / "WR.csv", "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(WR_HEADER)
+                for p in range(scale.n_players):
+                    opponent = TEAMS[(p + week + s) % len(TEAMS)]
+                    writer.writerow(_wr_row(p, opponent, rng))
+            counts["wr_game"] += scale.n_players
+    return counts
+
+
+def generate_raw_tree(root: Path, scale: RawScale, seed: int = 0) -> dict:
+    """Generate a full synthetic raw tree under ``root``.
+
+    Args:
+        root: Directory to write into (created if missing)
+        scale: Tree dimensions
+        seed: Random seed so runs at the same scale are comparable
+
+    Returns:
+        Source row counts keyed by the bronze model that ingests them
+
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    counts = write_wr_tree(root, scale, rng)
+    counts["contracts"] = write_contracts(root / "NFL_Contracts.csv", scale, rng)
+    return counts
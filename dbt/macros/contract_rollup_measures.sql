@@ -0,0 +1,22 @@
+{% macro contract_rollup_measures() %}
+    {#- Additive measures for contract rollups. Averages are stored as
+        sum/count pairs so callers can re-aggregate across groups exactly; money
+        sums stay in integer cents. -#}
+    COUNT(*) AS contract_count,
+    COUNT(total_value_cents) AS n_total_value,
+    SUM(total_value_cents) AS sum_total_value_cents,
+    MIN(total_value_cents) AS min_total_value_cents,
+    MAX(total_value_cents) AS max_total_value_cents,
+    COUNT(average_salary_cents) AS n_average_salary,
+    SUM(average_salary_cents) AS sum_average_salary_cents,
+    COUNT(years) AS n_years,
+    SUM(years) AS sum_years,
+    COUNT(guarantee_at_signing_cents) AS n_guarantee_at_signing,
+    SUM(guarantee_at_signing_cents) AS sum_guarantee_at_signing_cents,
+    COUNT(avg_percent_of_cap) AS n_avg_percent_of_cap,
+    SUM(avg_percent_of_cap) AS sum_avg_percent_of_cap,
+    COUNT(aav_pct_of_cap) AS n_aav_pct_of_cap,
+    SUM(aav_pct_of_cap) AS sum_aav_pct_of_cap,
+    COUNT(pct_guaranteed_at_signing) AS n_pct_guaranteed_at_signing,
+    SUM(pct_guaranteed_at_signing) AS sum_pct_guaranteed_at_signing
+{% endmacro %}
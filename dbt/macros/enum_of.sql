@@ -0,0 +1,21 @@
+{% macro enum_of(relation, column_name, where=none) %}
+    {#- Build an ENUM type literal from the distinct values of a column so the
+        model stores it dictionary-encoded without a persistent CREATE TYPE. -#}
+    {% set query %}
+        SELECT DISTINCT {{ column_name }}
+        FROM {{ relation }}
+        WHERE {{ column_name }} IS NOT NULL
+        {% if where %}AND {{ where }}{% endif %}
+        ORDER BY 1
+    {% endset %}
+    {% if execute %}
+        {% set values = run_query(query).columns[0].values() %}
+    {% else %}
+        {% set values = [] %}
+    {% endif %}
+    {%- if values | length > 0 -%}
+        ENUM({% for v in values %}'{{ v | replace("'", "''") }}'{% if not loop.last %}, {% endif %}{% endfor %})
+    {%- else -%}
+        VARCHAR
+    {%- endif -%}
+{% endmacro %}
@@ -0,0 +1,5 @@
+{% macro parse_money_cents(column_name) %}
+    {#- '$1,234,567.89' -> 123456789 as BIGINT cents in a single regex pass.
+        Parsed through DECIMAL so the cents are exact; NULL if unparseable. -#}
+    TRY_CAST(TRY_CAST(REGEXP_REPLACE({{ column_name }}, '[$,\s]', '', 'g') AS DECIMAL(18,2)) * 100 AS BIGINT)
+{% endmacro %}
@@ -0,0 +1,4 @@
+{% macro parse_percent(column_name) %}
+    {#- '12.34%' -> 0.1234 as a DOUBLE fraction; NULL if unparseable. -#}
+    TRY_CAST(REGEXP_REPLACE({{ column_name }}, '[%\s]', '', 'g') AS DOUBLE) / 100
+{% endmacro %}
@@ -1,48 +1,54 @@
 {{ config(materialized='table') }}
 
+-- Contract ingest. The file has a title row and a header row (skipped), and
+-- the export repeats its header inside the body: those rows are filtered out
+-- by name. Every column is read as VARCHAR and cast with TRY_CAST, so a
+-- malformed cell becomes NULL instead of dropping its contract.
+-- Money is parsed once into BIGINT cents so downstream sums stay integer.
+
 WITH source AS (
-    SELECT * FROM read_csv_auto('{{ var("data_path", "../data/raw/NFL_Contracts.csv") }}', 
-                                 header=False, 
-                                 skip=2,
-                                 delim=',',
-                                 -- Name the columns explicitly to avoid confusion
-                                 columns={
-                                     'column00': 'VARCHAR',
-                                     'column01': 'VARCHAR', 
-                                     'column02': 'VARCHAR',
-                                     'column03': 'VARCHAR',
-                                     'column04': 'VARCHAR',
-                                     'column05': 'VARCHAR',
-                                     'column06': 'VARCHAR',
-                                     'column07': 'VARCHAR',
-                                     'column08': 'VARCHAR',
-                                     'column09': 'VARCHAR',
-                                     'column010': 'VARCHAR',
-                                     'column011': 'VARCHAR',
-                                     'column012': 'VARCHAR',
-                                     'column013': 'VARCHAR',
-                                     'column014': 'VARCHAR',
-                                     'column015': 'VARCHAR'
-                                 })
+    SELECT * FROM read_csv('{{ var("data_path", var("raw_data_root", "../data/raw") ~ "/NFL_Contracts.csv") }}',
+                           header=false,
+                           skip=2,
+                           delim=',',
+                           quote='"',
+                           columns={
+                               'rank': 'VARCHAR',
+                               'player_name': 'VARCHAR',
+                               'position': 'VARCHAR',
+                               'team_signed_with': 'VARCHAR',
+                               'age_at_signing': 'VARCHAR',
+                               'start_year': 'VARCHAR',
+                               'end_year': 'VARCHAR',
+                               'years': 'VARCHAR',
+                               'total_value': 'VARCHAR',
+                               'average_salary': 'VARCHAR',
+                               'avg_percent_of_cap': 'VARCHAR',
+                               'signing_bonus': 'VARCHAR',
+                               'guarantee_at_signing': 'VARCHAR',
+                               'practical_guarantee': 'VARCHAR',
+                               'two_year_cash_total': 'VARCHAR',
+                               'three_year_cash_total': 'VARCHAR'
+                           })
 )
 
 SELECT
-    column00 AS rank,
-    column01 AS player_name,
-    column02 AS position,
-    TRIM(column03) AS team_signed_with,
-    TRY_CAST(column04 AS INTEGER) AS age_at_signing,
-    TRY_CAST(column05 AS INTEGER) AS start_year,
-    TRY_CAST(column06 AS INTEGER) AS end_year,
-    TRY_CAST(column07 AS INTEGER) AS years,
-    TRY_CAST(REPLACE(REPLACE(column08, '$', ''), ',', '') AS DECIMAL(18,2)) AS total_value,
-    TRY_CAST(REPLACE(REPLACE(column09, '$', ''), ',', '') AS DECIMAL(18,2)) AS average_salary,
-    TRY_CAST(REPLACE(column010, '%', '') AS DECIMAL(5,2)) / 100 AS avg_percent_of_cap,
-    TRY_CAST(REPLACE(REPLACE(column011, '$', ''), ',', '') AS DECIMAL(18,2)) AS signing_bonus,
-    TRY_CAST(REPLACE(REPLACE(column012, '$', ''), ',', '') AS DECIMAL(18,2)) AS guarantee_at_signing,
-    TRY_CAST(REPLACE(REPLACE(column013, '$', ''), ',', '') AS DECIMAL(18,2)) AS practical_guarantee,
-    TRY_CAST(REPLACE(REPLACE(column014, '$', ''), ',', '') AS DECIMAL(18,2)) AS two_year_cash_total,
-    TRY_CAST(REPLACE(REPLACE(column015, '$', ''), ',', '') AS DECIMAL(18,2)) AS three_year_cash_total
+    TRY_CAST(rank AS INTEGER) AS rank,
+    player_name,
+    position,
+    TRIM(team_signed_with) AS team_signed_with,
+    TRY_CAST(age_at_signing AS INTEGER) AS age_at_signing,
+    TRY_CAST(start_year AS INTEGER) AS start_year,
+    TRY_CAST(end_year AS INTEGER) AS end_year,
+    TRY_CAST(years AS INTEGER) AS years,
+    {{ parse_money_cents('total_value') }} AS total_value_cents,
+    {{ parse_money_cents('average_salary') }} AS average_salary_cents,
+    {{ parse_percent('avg_percent_of_cap') }} AS avg_percent_of_cap,
+    {{ parse_money_cents('signing_bonus') }} AS signing_bonus_cents,
+    {{ parse_money_cents('guarantee_at_signing') }} AS guarantee_at_signing_cents,
+    {{ parse_money_cents('practical_guarantee') }} AS practical_guarantee_cents,
+    {{ parse_money_cents('two_year_cash_total') }} AS two_year_cash_total_cents,
+    {{ parse_money_cents('three_year_cash_total') }} AS three_year_cash_total_cents
 FROM source
-WHERE column01 IS NOT NULL 
-  AND column01 != 'Player'
\ No newline at end of file
+WHERE player_name IS NOT NULL
+  AND player_name <> 'Player'  -- repeated header rows
@@ -2,15 +2,16 @@
 
 WITH source AS (
     -- Read all game-level WR data from 2021-2025 (including week folders)
-    {{ read_csv_pattern('../data/raw/*/*/WR.csv') }}
+    {{ read_csv_pattern(var("raw_data_root", "../data/raw") ~ '/*/*/WR.csv') }}
 )
 
 SELECT
     filename as source_file,
     
     -- Extract season and week from path
-    REGEXP_EXTRACT(filename, '.*/(\\d{4})/\\d+/(.*)', 1) as season_year,
-    REGEXP_EXTRACT(filename, '.*/\\d{4}/(\\d+)/.*', 1) as week_number,
+    -- (<root>/<year>/<week>/WR.csv)
+    TRY_CAST(REGEXP_EXTRACT(filename, '(\d{4})/\d+/[^/]+$', 1) AS INTEGER) as season_year,
+    TRY_CAST(REGEXP_EXTRACT(filename, '\d{4}/(\d+)/[^/]+$', 1) AS INTEGER) as week_number,
     
     -- Player info
     TRIM(PlayerName) as player_name,
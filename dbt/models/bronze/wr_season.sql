@@ -2,13 +2,13 @@
 
 WITH source AS (
     -- Read ALL seasonal WR data from 2015-2025
-    {{ read_csv_pattern('../data/raw/*/WR_season.csv') }}
+    {{ read_csv_pattern(var("raw_data_root", "../data/raw") ~ '/*/WR_season.csv') }}
 )
 
 SELECT
     filename as source_file,
-    -- Extract year from filename path
-    REGEXP_EXTRACT(filename, '.*/(\\d{4})/.*', 1) as season_year,
+    -- Extract year from filename path (<root>/<year>/WR_season.csv)
+    TRY_CAST(REGEXP_EXTRACT(filename, '(\d{4})/[^/]+$', 1) AS INTEGER) as season_year,
     
     -- Player info
     TRIM(PlayerName) as player_name,
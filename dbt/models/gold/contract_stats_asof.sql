@@ -0,0 +1,77 @@
+{{ config(materialized='table') }}
+
+-- Training rows for the contract models: every contract joined to its
+-- player's stats as of signing. The ASOF join takes the latest season
+-- strictly before start_year, so no row sees stats from the contract's own
+-- seasons. Trailing 1/2/3-season windows are calendar ranges ending at that
+-- season and share one partition/order, so they are computed in one pass.
+--
+-- Contracts carry only player_name, so stats are matched by name within
+-- position. When two players share a name in a season the busier one wins.
+
+{% set metrics = ['targets', 'receptions', 'receiving_yards', 'receiving_td', 'total_points'] %}
+
+WITH position_seasons AS (
+    -- One row per player per season; add a UNION ALL branch per position
+    -- table as it lands.
+    SELECT
+        'WR' AS position,
+        player_id,
+        player_name,
+        season_year,
+        {{ metrics | join(', ') }}
+    FROM {{ ref('wr_careers') }}
+),
+
+named AS (
+    SELECT *
+    FROM position_seasons
+    WHERE player_name IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (
+        PARTITION BY position, player_name, season_year
+        ORDER BY targets DESC NULLS LAST, player_id
+    ) = 1
+),
+
+windowed AS (
+    SELECT
+        position,
+        player_name,
+        player_id,
+        season_year,
+        {% for n in [1, 2, 3] %}
+        COUNT(*) OVER last_{{ n }} AS seasons_last_{{ n }},
+        {% for m in metrics %}
+        SUM({{ m }}) OVER last_{{ n }} AS {{ m }}_last_{{ n }}{{ ',' if not (loop.last and n == 3) }}
+        {% endfor %}
+        {% endfor %}
+    FROM named
+    WINDOW
+        {% for n in [1, 2, 3] %}
+        last_{{ n }} AS (
+            PARTITION BY position, player_name
+            ORDER BY season_year
+            RANGE BETWEEN {{ n - 1 }} PRECEDING AND CURRENT ROW
+        ){{ ',' if not loop.last }}
+        {% endfor %}
+)
+
+SELECT
+    c.rank,
+    c.player_name,
+    c.position,
+    c.team_signed_with,
+    c.age_at_signing,
+    c.start_year,
+    c.years,
+    c.avg_percent_of_cap,
+    t.player_id,
+    t.season_year AS stats_season,
+    c.start_year - t.season_year AS seasons_since_stats,
+    t.* EXCLUDE (position, player_name, player_id, season_year)
+FROM {{ ref('contracts') }} AS c
+ASOF LEFT JOIN windowed AS t
+    ON c.position = t.position
+    AND c.player_name = t.player_name
+    AND c.start_year > t.season_year
+ORDER BY c.position, c.start_year, c.rank
@@ -0,0 +1,11 @@
+{{ config(materialized='table') }}
+
+-- Position x team rollup across all signing years.
+
+SELECT
+    position,
+    team_signed_with AS team,
+    {{ contract_rollup_measures() }}
+FROM {{ ref('fact_contracts') }}
+GROUP BY position, team_signed_with
+ORDER BY position, team
@@ -0,0 +1,13 @@
+{{ config(materialized='table') }}
+
+-- Position x signing-year rollup. has_total_value is part of the grain so
+-- market-trend queries that require a contract value stay exact.
+
+SELECT
+    position,
+    start_year,
+    total_value_cents IS NOT NULL AS has_total_value,
+    {{ contract_rollup_measures() }}
+FROM {{ ref('fact_contracts') }}
+GROUP BY position, start_year, has_total_value
+ORDER BY position, start_year
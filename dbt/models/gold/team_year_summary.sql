@@ -0,0 +1,14 @@
+{{ config(materialized='table') }}
+
+-- Team x signing-year rollup. position_mask has one bit per position enum
+-- code so distinct positions signed can be re-counted across years with
+-- BIT_COUNT(BIT_OR(position_mask)).
+
+SELECT
+    team_signed_with AS team,
+    start_year,
+    BIT_OR(CAST(1 AS UBIGINT) << ENUM_CODE(position)) AS position_mask,
+    {{ contract_rollup_measures() }}
+FROM {{ ref('fact_contracts') }}
+GROUP BY team_signed_with, start_year
+ORDER BY team, start_year
@@ -0,0 +1,63 @@
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='player_id',
+    post_hook="CREATE INDEX IF NOT EXISTS wr_careers_player_id_idx ON {{ this }} (player_id)"
+) }}
+
+-- One row per WR per season with running career totals, keyed on player_id
+-- (not display name, which players can share). The row with
+-- is_latest_season holds the player's career totals.
+--
+-- Incremental runs only rebuild players who appear in the newest season
+-- already loaded or later, so a new (or re-landed) season file touches just
+-- those players' histories.
+
+WITH seasons AS (
+    SELECT
+        player_id,
+        season_year,
+        ARG_MAX(player_name, receiving_yards) AS player_name,
+        STRING_AGG(DISTINCT team, '/' ORDER BY team) AS team,
+        SUM(receptions) AS receptions,
+        SUM(receiving_yards) AS receiving_yards,
+        SUM(receiving_td) AS receiving_td,
+        SUM(targets) AS targets,
+        SUM(total_points) AS total_points
+    FROM {{ ref('wr_season') }}
+    WHERE player_id IS NOT NULL
+      AND season_year IS NOT NULL
+    {% if is_incremental() %}
+      AND player_id IN (
+          SELECT player_id
+          FROM {{ ref('wr_season') }}
+          WHERE season_year >= (SELECT COALESCE(MAX(season_year), 0) FROM {{ this }})
+      )
+    {% endif %}
+    GROUP BY player_id, season_year
+)
+
+SELECT
+    player_id,
+    season_year,
+    player_name,
+    team,
+    receptions,
+    receiving_yards,
+    receiving_td,
+    targets,
+    total_points,
+    CAST(ROW_NUMBER() OVER career AS INTEGER) AS seasons_played,
+    MIN(season_year) OVER (PARTITION BY player_id) AS first_season,
+    season_year = MAX(season_year) OVER (PARTITION BY player_id) AS is_latest_season,
+    SUM(receptions) OVER career AS career_receptions,
+    SUM(receiving_yards) OVER career AS career_receiving_yards,
+    SUM(receiving_td) OVER career AS career_receiving_td,
+    SUM(targets) OVER career AS career_targets,
+    SUM(total_points) OVER career AS career_total_points
+FROM seasons
+WINDOW career AS (
+    PARTITION BY player_id ORDER BY season_year
+    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+)
+ORDER BY player_id, season_year
@@ -0,0 +1,50 @@
+{{ config(materialized='table') }}
+
+-- Typed contract facts for every position with the ratios dashboards need
+-- precomputed once at build time. Money stays in BIGINT cents from bronze.
+-- Sorted by (position, start_year) so range filters on either column prune
+-- row groups instead of scanning the table.
+
+{% set valid_position = "position IS NOT NULL AND position NOT IN ('', 'Pos')" %}
+
+WITH contracts AS (
+    SELECT * FROM {{ ref('contracts') }}
+    WHERE {{ valid_position }}
+),
+
+salary_cap AS (
+    SELECT season_year, salary_cap FROM {{ ref('salary_cap') }}
+)
+
+SELECT
+    c.rank,
+    c.player_name,
+    CAST(c.position AS {{ enum_of(ref('contracts'), 'position', valid_position) }}) AS position,
+    c.team_signed_with,
+    c.age_at_signing,
+    CAST(c.start_year AS SMALLINT) AS start_year,
+    CAST(c.end_year AS SMALLINT) AS end_year,
+    c.years,
+    c.total_value_cents,
+    c.average_salary_cents,
+    c.avg_percent_of_cap,
+    c.signing_bonus_cents,
+    c.guarantee_at_signing_cents,
+    c.practical_guarantee_cents,
+    c.two_year_cash_total_cents,
+    c.three_year_cash_total_cents,
+    -- Guaranteed percentages
+    ROUND(c.guarantee_at_signing_cents * 100.0 / NULLIF(c.total_value_cents, 0), 2) AS pct_guaranteed_at_signing,
+    ROUND(c.practical_guarantee_cents * 100.0 / NULLIF(c.total_value_cents, 0), 2) AS pct_practical_guarantee,
+    ROUND(c.signing_bonus_cents * 100.0 / NULLIF(c.total_value_cents, 0), 2) AS pct_signing_bonus,
+    -- Cash flow ratios
+    ROUND(c.two_year_cash_total_cents * 100.0 / NULLIF(c.total_value_cents, 0), 2) AS pct_paid_in_2_years,
+    ROUND(c.three_year_cash_total_cents * 100.0 / NULLIF(c.total_value_cents, 0), 2) AS pct_paid_in_3_years,
+    -- Cap-share normalization against the league cap in the signing year
+    cap.salary_cap AS salary_cap_at_signing,
+    ROUND(c.average_salary_cents / cap.salary_cap, 4) AS aav_pct_of_cap,
+    ROUND(c.guarantee_at_signing_cents / cap.salary_cap, 4) AS guarantee_pct_of_cap
+FROM contracts AS c
+LEFT JOIN salary_cap AS cap
+    ON c.start_year = cap.season_year
+ORDER BY position, start_year
@@ -1,7 +1,7 @@
 {{ config(materialized='table') }}
 
 WITH qb_contracts AS (
-    SELECT * FROM {{ ref('contracts') }}
+    SELECT * FROM {{ ref('fact_contracts') }}
     WHERE position = 'QB'
 )
 
@@ -13,19 +13,18 @@ SELECT
     start_year,
     end_year,
     years,
-    total_value,
-    average_salary,
+    total_value_cents,
+    average_salary_cents,
     avg_percent_of_cap,
-    signing_bonus,
-    guarantee_at_signing,
-    practical_guarantee,
-    two_year_cash_total,
-    three_year_cash_total,
-    -- Calculate guaranteed percentage
-    ROUND(guarantee_at_signing / total_value * 100, 2) AS pct_guaranteed_at_signing,
-    ROUND(practical_guarantee / total_value * 100, 2) AS pct_practical_guarantee,
-    -- Calculate cash flow ratios
-    ROUND(two_year_cash_total / total_value * 100, 2) AS pct_paid_in_2_years,
-    ROUND(three_year_cash_total / total_value * 100, 2) AS pct_paid_in_3_years
+    signing_bonus_cents,
+    guarantee_at_signing_cents,
+    practical_guarantee_cents,
+    two_year_cash_total_cents,
+    three_year_cash_total_cents,
+    pct_guaranteed_at_signing,
+    pct_practical_guarantee,
+    pct_paid_in_2_years,
+    pct_paid_in_3_years,
+    aav_pct_of_cap
 FROM qb_contracts
-ORDER BY rank
\ No newline at end of file
+ORDER BY rank
@@ -0,0 +1,43 @@
+{{ config(materialized='table') }}
+
+-- Sufficient statistics for the opponent-adjusted WR ratings (eda/adj.py).
+-- The rating sweeps only read per-(player, defense) sums of weight and
+-- weight * metric, so all of a player's games against one defense in a
+-- season collapse to one row and the solver input stops growing with the
+-- number of weeks replayed. Defenses are rated per season (team_season).
+--
+-- Metric: receiving yards per target, weighted by targets. Recency
+-- weighting applies at the row's last_week.
+
+WITH games AS (
+    SELECT
+        player_id,
+        player_name,
+        season_year,
+        week_number,
+        opponent || '_' || season_year AS defense_id,
+        CAST(targets AS DOUBLE) AS weight,
+        receiving_yards / targets AS metric
+    FROM {{ ref('wr_game') }}
+    WHERE targets > 0
+      AND receiving_yards IS NOT NULL
+      AND player_id IS NOT NULL
+      AND opponent IS NOT NULL
+      AND season_year IS NOT NULL
+      AND week_number IS NOT NULL
+)
+
+SELECT
+    player_id,
+    defense_id,
+    season_year,
+    ARG_MAX(player_name, week_number) AS player_name,
+    COUNT(*) AS games,
+    MIN(week_number) AS first_week,
+    MAX(week_number) AS last_week,
+    SUM(weight) AS weight,
+    SUM(weight * metric) AS weighted_metric,
+    SUM(weight * metric * metric) AS weighted_metric_sq
+FROM games
+GROUP BY player_id, defense_id, season_year
+ORDER BY season_year, player_id, defense_id
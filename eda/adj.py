@@ -3,14 +3,29 @@ Mutual Opponent Adjustment Model for NFL Player Valuation
 Implements Open-Closed Principle for position-agnostic player rating
 """
 
+import contextlib
+import hashlib
+import io
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 from scipy import stats
 
+# Add project root to path for the shared solver utilities
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.acceleration import AndersonAccelerator, relax  # noqa: E402
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+from src.utils.rating_artifacts import RatingArtifact, write_artifact  # noqa: E402
+
 print("=== Loading Mutual Opponent Adjustment Model ===\n")
 
 
@@ -24,6 +39,8 @@ class Matchup:
     base_metric: float
     volume: float  # routes for WR, carries for RB, etc.
     weight: float = 1.0
+    season_year: Optional[int] = None
+    week_number: Optional[int] = None
 
     def __repr__(self):
         return (
@@ -31,6 +48,47 @@ class Matchup:
         )
 
 
+# Week slots per season: 18 regular-season weeks plus the playoff weeks
+# (19-22). The index has no offseason gap of its own: week 1 follows the
+# Super Bowl (week 22) by one slot and week 18 by five, so recency decay
+# treats the months between seasons as about 1-5 weeks.
+WEEKS_PER_SEASON = 22
+
+
+def absolute_week(
+    season_year, week_number, weeks_per_season: int = WEEKS_PER_SEASON
+) -> np.ndarray:
+    """Week index that keeps counting across seasons"""
+    return np.asarray(season_year) * weeks_per_season + np.asarray(week_number)
+
+
+def matchup_week_index(
+    matchups: List[Matchup], weeks_per_season: int = WEEKS_PER_SEASON
+) -> np.ndarray:
+    """Absolute week index of every matchup
+
+    Raises:
+        ValueError: If any matchup lacks season_year or week_number
+
+    """
+    seasons = np.array([m.season_year for m in matchups], dtype=float)
+    weeks = np.array([m.week_number for m in matchups], dtype=float)
+    missing = int((np.isnan(seasons) | np.isnan(weeks)).sum())
+    if missing:
+        raise ValueError(f"{missing} matchups have no season_year/week_number")
+    return absolute_week(seasons, weeks, weeks_per_season).astype(np.int64)
+
+
+def recency_weights(
+    week_index: np.ndarray, decay: float, reference: Optional[int] = None
+) -> np.ndarray:
+    """decay ** (weeks before the reference week); latest week if None"""
+    week_index = np.asarray(week_index)
+    if reference is None:
+        reference = week_index.max(initial=0)
+    return decay ** (reference - week_index).astype(float)
+
+
 print("✓ Defined Matchup dataclass")
 
 
@@ -57,6 +115,14 @@ class PositionModel(ABC):
         """How to weight observations based on volume"""
         pass
 
+    def get_settings(self) -> dict:
+        """Constructor keyword arguments that rebuild this position model
+
+        Defaults to the instance attributes, which is how WRModel and
+        RBModel keep theirs; override if the constructor differs.
+        """
+        return dict(vars(self))
+
 
 print("✓ Defined PositionModel abstract base class\n")
 
@@ -64,6 +130,9 @@ print("✓ Defined PositionModel abstract base class\n")
 class WRModel(PositionModel):
     """Concrete implementation for Wide Receivers"""
 
+    def __init__(self, prior_strength: float = 200):
+        self.prior_strength = prior_strength  # k for Bayesian shrinkage
+
     def prepare_data(self, raw_data) -> List[Matchup]:
         print(f"  Preparing WR data: {len(raw_data)} games")
         matchups = []
@@ -72,6 +141,8 @@ class WRModel(PositionModel):
                 player_id=game["wr_id"],
                 opponent_id=game["defense_id"],
                 game_id=game["game_id"],
+                season_year=game.get("season_year"),
+                week_number=game.get("week_number"),
                 base_metric=self.compute_base_metric(game),
                 volume=game["routes"],
                 weight=self.get_weight_function(game["routes"]),
@@ -94,8 +165,8 @@ class WRModel(PositionModel):
         return 0.0
 
     def get_prior_strength(self) -> float:
-        print("  WR prior strength (k) = 200")
-        return 200  # k for Bayesian shrinkage
+        print(f"  WR prior strength (k) = {self.prior_strength}")
+        return self.prior_strength
 
     def get_weight_function(self, volume: float) -> float:
         # Diminishing returns for routes
@@ -107,6 +178,10 @@ class WRModel(PositionModel):
 class RBModel(PositionModel):
     """Concrete implementation for Running Backs"""
 
+    def __init__(self, prior_strength: float = 150):
+        # RBs need less stabilization (more carries per game)
+        self.prior_strength = prior_strength
+
     def prepare_data(self, raw_data) -> List[Matchup]:
         print(f"  Preparing RB data: {len(raw_data)} games")
         matchups = []
@@ -115,6 +190,8 @@ class RBModel(PositionModel):
                 player_id=game["rb_id"],
                 opponent_id=game["run_defense_id"],
                 game_id=game["game_id"],
+                season_year=game.get("season_year"),
+                week_number=game.get("week_number"),
                 base_metric=self.compute_base_metric(game),
                 volume=game["carries"],
                 weight=self.get_weight_function(game["carries"]),
@@ -134,8 +211,8 @@ class RBModel(PositionModel):
         return epa_per_carry
 
     def get_prior_strength(self) -> float:
-        print("  RB prior strength (k) = 150")
-        return 150  # RBs need less stabilization (more carries per game)
+        print(f"  RB prior strength (k) = {self.prior_strength}")
+        return self.prior_strength
 
     def get_weight_function(self, volume: float) -> float:
         weight = min(volume, 25) / 25  # Different scaling for carries
@@ -146,170 +223,935 @@ class RBModel(PositionModel):
 print("✓ Defined WRModel and RBModel concrete implementations\n")
 
 
+class UnionFind:
+    """Disjoint sets over integer slots (path halving, union by size)"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def labels(self) -> np.ndarray:
+        """Component label per slot, numbered in order of first slot"""
+        roots = [self.find(x) for x in range(len(self.parent))]
+        return pd.factorize(np.array(roots, dtype=np.int64))[0]
+
+
+def connected_components(
+    player_idx: np.ndarray,
+    opponent_idx: np.ndarray,
+    n_players: int,
+    n_opponents: int,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Label the connected components of the player-opponent graph
+
+    Players and opponents share one union-find (opponents after players)
+    and every distinct (player, opponent) pair is one edge.
+
+    Returns:
+        (component per player, component per opponent, component count)
+    """
+    pairs = np.unique(player_idx.astype(np.int64) * n_opponents + opponent_idx)
+    uf = UnionFind(n_players + n_opponents)
+    for p, o in zip(
+        (pairs // n_opponents).tolist(), (pairs % n_opponents + n_players).tolist()
+    ):
+        uf.union(p, o)
+    labels = uf.labels()
+    n_components = int(labels.max()) + 1 if len(labels) else 0
+    return labels[:n_players], labels[n_players:], n_components
+
+
+def bridge_rows(
+    player_idx: np.ndarray,
+    opponent_idx: np.ndarray,
+    n_players: int,
+    n_opponents: int,
+) -> np.ndarray:
+    """Mask of matchups whose removal splits their component (bridges)
+
+    Every matchup is one edge (opponents numbered after players), so a
+    player's or opponent's only matchup is a bridge and repeated matchups
+    between the same pair never are. Iterative Tarjan, O(matchups).
+    """
+    n, m = n_players + n_opponents, len(player_idx)
+    ends = np.concatenate([player_idx, opponent_idx + n_players])
+    others = np.concatenate([opponent_idx + n_players, player_idx])
+    order = np.argsort(ends, kind="stable")
+    start = np.searchsorted(ends[order], np.arange(n + 1)).tolist()
+    neighbor = others[order].tolist()
+    edge = np.tile(np.arange(m), 2)[order].tolist()
+
+    disc, low = [-1] * n, [0] * n
+    bridge = np.zeros(m, dtype=bool)
+    clock = 0
+    for root in range(n):
+        if disc[root] >= 0:
+            continue
+        disc[root] = low[root] = clock
+        clock += 1
+        stack = [(root, -1, start[root])]
+        while stack:
+            node, via, pos = stack[-1]
+            if pos < start[node + 1]:
+                stack[-1] = (node, via, pos + 1)
+                nxt = neighbor[pos]
+                if edge[pos] == via:
+                    continue
+                if disc[nxt] < 0:
+                    disc[nxt] = low[nxt] = clock
+                    clock += 1
+                    stack.append((nxt, edge[pos], start[nxt]))
+                else:
+                    low[node] = min(low[node], disc[nxt])
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                    if low[node] > disc[parent]:
+                        bridge[via] = True
+    return bridge
+
+
+def _subclasses(base: type) -> Dict[str, type]:
+    """Every class derived from base, at any depth, by name"""
+    found, stack = {}, [base]
+    while stack:
+        for sub in stack.pop().__subclasses__():
+            found.setdefault(sub.__name__, sub)
+            stack.append(sub)
+    return found
+
+
+def _group_slots(labels: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Order slots by group; return (order, group boundaries into order)"""
+    order = np.argsort(labels, kind="stable")
+    bounds = np.r_[0, np.cumsum(np.bincount(labels, minlength=n_groups))]
+    return order, bounds
+
+
+@dataclass
+class ComponentFit:
+    """Solution of one connected component, in its local slot order"""
+
+    player: np.ndarray
+    opponent: np.ndarray
+    league_avg: float
+    weights: np.ndarray
+    player_w: np.ndarray
+    trace: List[float]
+    converged: bool
+
+
+print("✓ Defined connected-component helpers")
+
+
+class ConvergenceWarning(RuntimeWarning):
+    """A fit stopped at max_iter before its ratings converged"""
+
+
 class MutualOpponentModel:
     """Closed for modification, open for extension via PositionModel"""
 
-    def __init__(self, position_model: PositionModel):
+    def __init__(
+        self, position_model: PositionModel, opponent_prior_ratio: float = 1.5
+    ):
         print(
             f"\n=== Initializing MutualOpponentModel for {position_model.__class__.__name__} ==="
         )
         self.position = position_model
+        # Opponent shrinkage k relative to the position's player k
+        self.opponent_prior_ratio = opponent_prior_ratio
         self.player_ratings: Dict[str, float] = {}
         self.opponent_ratings: Dict[str, float] = {}
         self.league_avg: float = 0.0
+        self.player_weights: Dict[str, float] = {}
+        self.opponent_weights: Dict[str, float] = {}
+        self.fingerprint: Optional[str] = None  # digest of the fitted matchups
         self.matchups: List[Matchup] = []
-
-    def fit(self, matchups: List[Matchup], max_iter: int = 100, tol: float = 1e-4):  # noqa: C901
-        """Coordinate descent algorithm for mutual opponent adjustment"""
-        print(f"\n=== Fitting model with {len(matchups)} matchups ===")
+        self.converged = False
+        self.n_iter = 0
+        self.convergence_trace: List[float] = []
+        self.n_components = 0
+        self.player_components: Dict[str, int] = {}
+        self.opponent_components: Dict[str, int] = {}
+        self.component_league_avgs = np.zeros(0)
+        self._influence_cache: Dict[int, dict] = {}
+        self._bridges: Optional[np.ndarray] = None
+
+    def _index_matchups(self, matchups: List[Matchup]) -> None:
+        """Factorize matchup IDs into integer slots and pull out the arrays.
+
+        Every sweep then works on flat arrays, and the caller's Matchup
+        objects are never modified.
+        """
         self.matchups = matchups
+        self._player_idx, self._player_keys = pd.factorize(
+            np.array([m.player_id for m in matchups], dtype=object)
+        )
+        self._opponent_idx, self._opponent_keys = pd.factorize(
+            np.array([m.opponent_id for m in matchups], dtype=object)
+        )
+        self._metric = np.array([m.base_metric for m in matchups], dtype=float)
+        self._base_weights = np.array([m.weight for m in matchups], dtype=float)
+
+    def _sweep_weights(
+        self, rows: np.ndarray, base_weights: np.ndarray, opponent_ratings: np.ndarray
+    ) -> np.ndarray:
+        """Observation weights for the next sweep (extension hook).
+
+        Args:
+            rows: Positions of the swept matchups in ``self.matchups``
+            base_weights: Their matchup weights
+            opponent_ratings: Current rating of each matchup's opponent
+
+        The base model uses the matchup weights as given. Subclasses can
+        reweight from the current ratings, which turns the sweep loop into
+        iteratively reweighted least squares.
+        """
+        return base_weights
+
+    def _initial_ratings(self, warm_start: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Start from zero, or from the current ratings for known IDs."""
+        player = np.zeros(len(self._player_keys))
+        opponent = np.zeros(len(self._opponent_keys))
+        if warm_start:
+            player[:] = [self.player_ratings.get(k, 0.0) for k in self._player_keys]
+            opponent[:] = [
+                self.opponent_ratings.get(k, 0.0) for k in self._opponent_keys
+            ]
+        return player, opponent
+
+    def _solve_component(
+        self,
+        rows: np.ndarray,
+        p_idx: np.ndarray,
+        o_idx: np.ndarray,
+        player: np.ndarray,
+        opponent: np.ndarray,
+        settings: dict,
+    ) -> ComponentFit:
+        """Run the sweeps for one connected component
+
+        Args:
+            rows: The component's matchups (positions in ``self.matchups``)
+            p_idx: Local player slot of each row
+            o_idx: Local opponent slot of each row
+            player: Initial player ratings, local order
+            opponent: Initial opponent ratings, local order
+            settings: k, k_opponent, max_iter, tol, omega, anderson
+
+        """
+        k, k_opponent = settings["k"], settings["k_opponent"]
+        omega, tol = settings["omega"], settings["tol"]
+        n_players, n_opponents = len(player), len(opponent)
+        metric, base_weights = self._metric[rows], self._base_weights[rows]
+
+        accelerator = AndersonAccelerator(memory=settings["anderson"])
+        ratings = np.concatenate([player, opponent])
+        trace: List[float] = []
+        converged = False
+        for _ in range(settings["max_iter"]):
+            player, opponent = ratings[:n_players], ratings[n_players:]
+
+            # Weights (and so the league average) may depend on the ratings
+            weights = self._sweep_weights(rows, base_weights, opponent[o_idx])
+            league_avg = (metric * weights).sum() / weights.sum()
+            dev = metric - league_avg
+
+            # Update player ratings (fix opponents), shrunk toward 0 by k
+            player_w = np.bincount(p_idx, weights=weights, minlength=n_players)
+            residual = np.bincount(
+                p_idx, weights=weights * (dev + opponent[o_idx]), minlength=n_players
+            )
+            update = np.where(player_w > 0, residual / (player_w + k), player)
+            new_player = relax(player, update, omega)
+
+            # Center player ratings (mean = 0) before opponents see them, so
+            # the shift is absorbed once and omega never moves the fixed point
+            new_player -= new_player.mean()
+
+            # Update opponent ratings against the players just computed
+            opponent_w = np.bincount(o_idx, weights=weights, minlength=n_opponents)
+            residual = np.bincount(
+                o_idx,
+                weights=weights * (-dev + new_player[p_idx]),
+                minlength=n_opponents,
+            )
+            update = np.where(
+                opponent_w > 0, residual / (opponent_w + k_opponent), opponent
+            )
+            new_opponent = relax(opponent, update, omega)
+            swept = np.concatenate([new_player, new_opponent])
+
+            change = np.abs(swept - ratings).max(initial=0.0)
+            trace.append(float(change))
+            if change < tol:
+                ratings = swept
+                converged = True
+                break
+            ratings = accelerator.update(ratings, swept)
+
+        return ComponentFit(
+            player=ratings[:n_players],
+            opponent=ratings[n_players:],
+            league_avg=float(league_avg),
+            weights=weights,
+            player_w=player_w,
+            trace=trace,
+            converged=converged,
+        )
 
-        # Step 1: Compute league average (weighted)
-        print("\n1. Computing weighted league average...")
-        total_weight = sum(m.weight for m in matchups)
-        weighted_sum = sum(m.base_metric * m.weight for m in matchups)
-        self.league_avg = weighted_sum / total_weight
-        print(f"   League average (weighted) = {self.league_avg:.4f}")
-        print(f"   Total weight = {total_weight:.2f}")
-
-        # Step 2: Create observation dictionaries
-        print("\n2. Building observation dictionaries...")
-        player_obs = defaultdict(list)
-        opponent_obs = defaultdict(list)
-
-        for m in matchups:
-            dev = m.base_metric - self.league_avg
-            player_obs[m.player_id].append((dev, m.opponent_id, m.weight))
-            opponent_obs[m.opponent_id].append((dev, m.player_id, m.weight))
-
-        print(f"   Tracking {len(player_obs)} unique players")
-        print(f"   Tracking {len(opponent_obs)} unique opponents")
-
-        # Step 3: Initialize ratings
-        print("\n3. Initializing ratings...")
-        self.player_ratings = dict.fromkeys(player_obs.keys(), 0.0)
-        self.opponent_ratings = dict.fromkeys(opponent_obs.keys(), 0.0)
-
-        print(f"   Initialized {len(self.player_ratings)} player ratings to 0")
-        print(f"   Initialized {len(self.opponent_ratings)} opponent ratings to 0")
-
-        # Step 4: Iterative coordinate descent
-        print(f"\n4. Starting coordinate descent (max {max_iter} iterations)...")
-        for iteration in range(max_iter):
-            prev_player = self.player_ratings.copy()
-            prev_opponent = self.opponent_ratings.copy()
-
-            # Update player ratings (fix opponents)
-            print(f"\n   Iteration {iteration + 1}:")
-            print("   a. Updating player ratings...")
-            for pid, obs_list in player_obs.items():
-                effective_samples = 0
-                total_residual = 0.0
-
-                for dev, oid, weight in obs_list:
-                    residual = dev + self.opponent_ratings[oid]
-                    total_residual += residual * weight
-                    effective_samples += weight
-
-                if effective_samples > 0:
-                    k = self.position.get_prior_strength()
-                    raw_rating = total_residual / effective_samples
-                    shrunk_rating = (raw_rating * effective_samples) / (
-                        effective_samples + k
-                    )
-                    self.player_ratings[pid] = shrunk_rating
-
-                    if (
-                        iteration == 0 and pid in list(player_obs.keys())[:2]
-                    ):  # Show first couple
-                        print(
-                            f"      {pid}: raw={raw_rating:.3f}, shrunk={shrunk_rating:.3f}, samples={effective_samples:.1f}"
-                        )
-
-            # Update opponent ratings (fix players)
-            print("   b. Updating opponent ratings...")
-            for oid, obs_list in opponent_obs.items():
-                effective_samples = 0
-                total_residual = 0.0
-
-                for dev, pid, weight in obs_list:
-                    residual = -dev + self.player_ratings[pid]
-                    total_residual += residual * weight
-                    effective_samples += weight
-
-                if effective_samples > 0:
-                    k_opponent = self.position.get_prior_strength() * 1.5
-                    raw_rating = total_residual / effective_samples
-                    shrunk_rating = (raw_rating * effective_samples) / (
-                        effective_samples + k_opponent
-                    )
-                    self.opponent_ratings[oid] = shrunk_rating
-
-                    if iteration == 0 and oid in list(opponent_obs.keys())[:2]:
-                        print(
-                            f"      {oid}: raw={raw_rating:.3f}, shrunk={shrunk_rating:.3f}, samples={effective_samples:.1f}"
-                        )
-
-            # Center player ratings (mean = 0)
-            print("   c. Centering ratings...")
-            avg_player = sum(self.player_ratings.values()) / len(self.player_ratings)
-            self.player_ratings = {
-                k: v - avg_player for k, v in self.player_ratings.items()
-            }
-
-            # Adjust opponents accordingly
-            self.opponent_ratings = {
-                k: v + avg_player for k, v in self.opponent_ratings.items()
-            }
-            print(f"      Player mean was {avg_player:.4f}, now centered at 0")
+    def fit(
+        self,
+        matchups: List[Matchup],
+        max_iter: int = 100,
+        tol: float = 1e-4,
+        warm_start: bool = False,
+        omega: float = 1.0,
+        anderson: int = 0,
+        n_jobs: int = 1,
+    ):
+        """Coordinate descent algorithm for mutual opponent adjustment
+
+        Players and opponents that never meet, even indirectly, cannot be
+        rated against each other. The matchups are split into connected
+        components of the player-opponent graph and each component is
+        solved on its own, with its own league average and centering.
+
+        Args:
+            matchups: Observations to fit; their weights are read, not changed
+            max_iter: Maximum number of sweeps
+            tol: Stop when no rating moves by more than this in a sweep
+            warm_start: Start from the current ratings instead of zero
+            omega: Over-relaxation factor for each block update (1 = plain
+                Gauss-Seidel; 1 < omega < 2 extrapolates). It changes how
+                fast the sweeps converge, not the ratings they converge to
+            anderson: Number of past sweeps mixed by Anderson acceleration
+                (0 = off)
+            n_jobs: Threads solving components concurrently
+
+        The max change per sweep (over all components) is kept in
+        ``self.convergence_trace``; component membership is in
+        ``self.player_components`` and ``self.opponent_components``. A fit
+        that hits ``max_iter`` sets ``self.converged = False`` and warns
+        with ConvergenceWarning.
+        """
+        print(f"\n=== Fitting model with {len(matchups)} matchups ===")
+        self._index_matchups(matchups)
+        p_idx, o_idx = self._player_idx, self._opponent_idx
+        n_players, n_opponents = len(self._player_keys), len(self._opponent_keys)
+        print(f"   Tracking {n_players} unique players")
+        print(f"   Tracking {n_opponents} unique opponents")
+
+        player_comp, opponent_comp, n_comp = connected_components(
+            p_idx, o_idx, n_players, n_opponents
+        )
+        print(f"   Found {n_comp} connected component(s)")
+
+        # Local slot of every player/opponent inside its component
+        p_order, p_bounds = _group_slots(player_comp, n_comp)
+        o_order, o_bounds = _group_slots(opponent_comp, n_comp)
+        r_order, r_bounds = _group_slots(player_comp[p_idx], n_comp)
+        player_local = np.empty(n_players, dtype=np.int64)
+        player_local[p_order] = np.arange(n_players) - np.repeat(
+            p_bounds[:-1], np.diff(p_bounds)
+        )
+        opponent_local = np.empty(n_opponents, dtype=np.int64)
+        opponent_local[o_order] = np.arange(n_opponents) - np.repeat(
+            o_bounds[:-1], np.diff(o_bounds)
+        )
 
-            # Check convergence
-            player_change = self._max_change(prev_player, self.player_ratings)
-            opponent_change = self._max_change(prev_opponent, self.opponent_ratings)
+        k = self.position.get_prior_strength()
+        settings = {
+            "k": k,
+            "k_opponent": k * self.opponent_prior_ratio,
+            "max_iter": max_iter,
+            "tol": tol,
+            "omega": omega,
+            "anderson": anderson,
+        }
+        player, opponent = self._initial_ratings(warm_start)
+        print(f"   Starting from {'current ratings' if warm_start else 'zero'}")
+
+        def solve(c: int) -> ComponentFit:
+            players = p_order[p_bounds[c] : p_bounds[c + 1]]
+            opponents = o_order[o_bounds[c] : o_bounds[c + 1]]
+            rows = r_order[r_bounds[c] : r_bounds[c + 1]]
+            return self._solve_component(
+                rows,
+                player_local[p_idx[rows]],
+                opponent_local[o_idx[rows]],
+                player[players],
+                opponent[opponents],
+                settings,
+            )
 
-            print(
-                f"   d. Max change: players={player_change:.6f}, opponents={opponent_change:.6f}"
+        print(f"\nStarting coordinate descent (max {max_iter} iterations)...")
+        if n_jobs > 1 and n_comp > 1:
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                fits = list(pool.map(solve, range(n_comp)))
+        else:
+            fits = [solve(c) for c in range(n_comp)]
+
+        # Scatter component solutions back to global slots
+        self.weights = np.empty(len(matchups))
+        player_w = np.empty(n_players)
+        for c, fit in enumerate(fits):
+            players = p_order[p_bounds[c] : p_bounds[c + 1]]
+            opponents = o_order[o_bounds[c] : o_bounds[c + 1]]
+            player[players] = fit.player
+            opponent[opponents] = fit.opponent
+            player_w[players] = fit.player_w
+            self.weights[r_order[r_bounds[c] : r_bounds[c + 1]]] = fit.weights
+
+        self.n_components = n_comp
+        self._priors = (settings["k"], settings["k_opponent"])
+        self._player_comp, self._opponent_comp = player_comp, opponent_comp
+        self._player_local, self._opponent_local = player_local, opponent_local
+        self._influence_cache = {}
+        self._bridges = None
+        self.component_league_avgs = np.array([f.league_avg for f in fits])
+        self.league_avg = float(
+            (self._metric * self.weights).sum() / self.weights.sum()
+        )
+        longest = max((len(f.trace) for f in fits), default=0)
+        self.convergence_trace = [
+            max(f.trace[i] for f in fits if i < len(f.trace)) for i in range(longest)
+        ]
+        self.n_iter = longest
+        self.converged = all(f.converged for f in fits)
+        if self.converged:
+            print(f"\n   ✓ CONVERGED after {self.n_iter} iterations!")
+        else:
+            warnings.warn(
+                f"Coordinate descent stopped at max_iter={max_iter} without "
+                f"converging (last change "
+                f"{(self.convergence_trace or [np.nan])[-1]:.3g} > tol={tol}); "
+                "ratings are unreliable",
+                ConvergenceWarning,
+                stacklevel=2,
             )
 
-            if player_change < tol and opponent_change < tol:
-                print(f"\n   ✓ CONVERGED after {iteration + 1} iterations!")
-                break
+        self.player_weights = dict(zip(self._player_keys, player_w.tolist()))
+        opponent_w = np.bincount(o_idx, weights=self.weights, minlength=n_opponents)
+        self.opponent_weights = dict(zip(self._opponent_keys, opponent_w.tolist()))
+        self.fingerprint = self._data_fingerprint()
+        self.player_ratings = dict(zip(self._player_keys, player.tolist()))
+        self.opponent_ratings = dict(zip(self._opponent_keys, opponent.tolist()))
+        self.player_components = dict(zip(self._player_keys, player_comp.tolist()))
+        self.opponent_components = dict(
+            zip(self._opponent_keys, opponent_comp.tolist())
+        )
 
         print("\n=== Model fitting complete ===")
+        print(f"League average (weighted) = {self.league_avg:.4f}")
+        print(f"Final player ratings range: [{player.min():.3f}, {player.max():.3f}]")
         print(
-            f"Final player ratings range: [{min(self.player_ratings.values()):.3f}, {max(self.player_ratings.values()):.3f}]"
-        )
-        print(
-            f"Final opponent ratings range: [{min(self.opponent_ratings.values()):.3f}, {max(self.opponent_ratings.values()):.3f}]"
+            f"Final opponent ratings range: [{opponent.min():.3f}, {opponent.max():.3f}]"
         )
 
+    def _baseline(self, player_id: str) -> float:
+        """League average of the player's component (overall if unseen)"""
+        component = self.player_components.get(player_id)
+        if component is None:
+            return self.league_avg
+        return float(self.component_league_avgs[component])
+
     def predict(self, player_id: str, opponent_id: str) -> float:
         """Predict performance for a matchup"""
+        league_avg = self._baseline(player_id)
         prediction = (
-            self.league_avg
+            league_avg
             + self.player_ratings.get(player_id, 0.0)
             - self.opponent_ratings.get(opponent_id, 0.0)
         )
         print(f"\nPrediction for {player_id} vs {opponent_id}:")
-        print(f"  League avg: {self.league_avg:.3f}")
+        print(f"  League avg: {league_avg:.3f}")
         print(f"  Player rating: {self.player_ratings.get(player_id, 0.0):.3f}")
         print(f"  Opponent rating: {-self.opponent_ratings.get(opponent_id, 0.0):.3f}")
         print(f"  Predicted metric: {prediction:.3f}")
         return prediction
 
+    def predict_many(self, player_ids, opponent_ids) -> np.ndarray:
+        """Predict many matchups at once, without per-matchup output
+
+        Args:
+            player_ids: Player ID per matchup
+            opponent_ids: Opponent ID per matchup
+
+        Returns:
+            Predicted metric per matchup; unseen IDs are rated 0 and unseen
+            players get the overall league average
+
+        """
+        players = pd.Series(np.asarray(player_ids, dtype=object))
+        opponents = pd.Series(np.asarray(opponent_ids, dtype=object))
+        component_avgs = {
+            p: self.component_league_avgs[c] for p, c in self.player_components.items()
+        }
+        baseline = players.map(component_avgs).fillna(self.league_avg)
+        player = players.map(self.player_ratings).fillna(0.0)
+        opponent = opponents.map(self.opponent_ratings).fillna(0.0)
+        return (baseline + player - opponent).to_numpy(dtype=float)
+
+    def _influence_system(self, c: int) -> dict:
+        """Inverted normal equations of component c (cached until refit)
+
+        At convergence the sweeps solve a linear system: the ridge normal
+        equations for the pre-centering player ratings p' and the opponent
+        ratings o, bordered by one unknown a, the player mean removed by
+        centering before the opponent update:
+
+            (W_p + k) p' - N o             = sum w (y - mu)   (per player)
+            (W_o + k_o) o - N^T p' + a W_o = -sum w (y - mu)  (per opponent)
+            mean(p') - a                   = 0
+
+        and the reported ratings are p' - a and o. Fitted weights
+        (including any quality multipliers) are held fixed.
+        """
+        if c in self._influence_cache:
+            return self._influence_cache[c]
+        k, k_opponent = self._priors
+        rows = np.flatnonzero(self._player_comp[self._player_idx] == c)
+        lp = self._player_local[self._player_idx[rows]]
+        lo = self._opponent_local[self._opponent_idx[rows]]
+        n_p = int((self._player_comp == c).sum())
+        n_o = int((self._opponent_comp == c).sum())
+        n = n_p + n_o
+        w, y = self.weights[rows], self._metric[rows]
+
+        qo = n_p + lo
+        flat = np.concatenate([lp * (n + 1) + lp, qo * (n + 1) + qo, lp * (n + 1) + qo])
+        system = np.bincount(
+            flat, weights=np.concatenate([w, w, -w]), minlength=(n + 1) ** 2
+        ).reshape(n + 1, n + 1)
+        system[:n, :n] += np.triu(system[:n, :n], 1).T
+        system[np.arange(n), np.arange(n)] += np.r_[
+            np.full(n_p, k), np.full(n_o, k_opponent)
+        ]
+        system[n_p:n, n] = np.bincount(lo, weights=w, minlength=n_o)
+        system[n, :n_p] = 1.0 / n_p
+        system[n, n] = -1.0
+
+        # Right-hand side is c - mu * g: weighted metric and weight sums
+        rhs_c = np.r_[
+            np.bincount(lp, weights=w * y, minlength=n_p),
+            -np.bincount(lo, weights=w * y, minlength=n_o),
+            0.0,
+        ]
+        rhs_g = np.r_[
+            np.bincount(lp, weights=w, minlength=n_p),
+            -np.bincount(lo, weights=w, minlength=n_o),
+            0.0,
+        ]
+        inverse = np.linalg.inv(system)
+        cached = {
+            "rows": rows,
+            "slot": {r: i for i, r in enumerate(rows.tolist())},
+            "lp": lp,
+            "qo": qo,
+            "n": n,
+            "inverse": inverse,
+            "zc": inverse @ rhs_c,
+            "zg": inverse @ rhs_g,
+            "w": w,
+            "y": y,
+            "w_sum": w.sum(),
+            "wy_sum": (w * y).sum(),
+        }
+        self._influence_cache[c] = cached
+        return cached
+
+    def _leave_one_out(
+        self, c: int, local_rows: np.ndarray, targets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Exact refit of component c without each row (Woodbury, rank 2)
+
+        Args:
+            c: Component
+            local_rows: Rows to drop, one at a time (positions within c)
+            targets: Local rating slots to report, shape (rows, q)
+
+        Returns:
+            (pre-centering ratings at targets, centering shift a, league
+            average), each for the system without that row
+
+        """
+        cache = self._influence_system(c)
+        inv, n = cache["inverse"], cache["n"]
+        p, q = cache["lp"][local_rows], cache["qo"][local_rows]
+        w, y = cache["w"][local_rows], cache["y"][local_rows]
+        remaining = cache["w_sum"] - w
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mu = np.where(remaining > 0, (cache["wy_sum"] - w * y) / remaining, np.nan)
+
+        col = (-1, 1)
+        p_, q_ = p.reshape(col), q.reshape(col)
+        w_, mu_ = w.reshape(col), mu.reshape(col)
+
+        def solve(j):
+            """Entries j (rows x q) of K^-1 r, K^-1 x and K^-1 e_o per row"""
+            kq = inv[j, q_]
+            kx = inv[j, p_] - kq
+            z = cache["zc"][j] - mu_ * cache["zg"][j] - w_ * (y.reshape(col) - mu_) * kx
+            return z, kx, kq
+
+        (z_p, kx_p, kq_p), (z_q, kx_q, kq_q), (z_n, kx_n, kq_n) = (
+            [a.ravel() for a in solve(j.reshape(col))]
+            for j in (p, q, np.full_like(p, n))
+        )
+
+        # Removing row i: K - w x x^T - w e_o e_n^T = K + U V^T
+        m00 = 1.0 - w * (kx_p - kx_q)
+        m01 = -w * (kq_p - kq_q)
+        m10 = -w * kx_n
+        m11 = 1.0 - w * kq_n
+        t0, t1 = z_p - z_q, z_n
+        det = m00 * m11 - m01 * m10
+        s0 = ((m11 * t0 - m01 * t1) / det).reshape(col)
+        s1 = ((m00 * t1 - m10 * t0) / det).reshape(col)
+
+        z_t, kx_t, kq_t = solve(targets)
+        theta = z_t + w_ * (kx_t * s0 + kq_t * s1)
+        shift = z_n + w * (kx_n * s0.ravel() + kq_n * s1.ravel())
+        return theta, shift, mu
+
+    def _bridge_mask(self) -> np.ndarray:
+        """Matchups whose removal splits their component (cached until refit)"""
+        if self._bridges is None:
+            self._bridges = bridge_rows(
+                self._player_idx,
+                self._opponent_idx,
+                len(self._player_keys),
+                len(self._opponent_keys),
+            )
+        return self._bridges
+
+    def _refit_without(self, row: int) -> Optional["MutualOpponentModel"]:
+        """Refit the component of matchup ``row`` without it
+
+        Used for bridges, where the rank-2 update does not apply: the
+        component splits, and an entity left without matchups drops out of
+        the centering. Fitted weights are held fixed, as in the update.
+
+        Returns:
+            Base model fitted on the rest of the component, or None when
+            nothing is left of it
+
+        """
+        c = self._player_comp[self._player_idx[row]]
+        keep = np.flatnonzero(self._player_comp[self._player_idx] == c)
+        keep = keep[keep != row]
+        if len(keep) == 0:
+            return None
+        refit = MutualOpponentModel(self.position, self.opponent_prior_ratio)
+        refit.player_ratings = self.player_ratings
+        refit.opponent_ratings = self.opponent_ratings
+        matchups = [
+            replace(self.matchups[r], weight=float(self.weights[r]))
+            for r in keep.tolist()
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            refit.fit(matchups, max_iter=10_000, tol=1e-12, warm_start=True, anderson=5)
+        return refit
+
+    def _refit_influence(self, row: int) -> Tuple[float, Dict[str, float], dict]:
+        """League average and ratings after refitting without a bridge row
+
+        Entities left without matchups are absent from the returned
+        ratings; the league average is NaN when the player and opponent
+        both drop out.
+        """
+        refit = self._refit_without(row)
+        if refit is None:
+            return np.nan, {}, {}
+        m = self.matchups[row]
+        if m.player_id in refit.player_components:
+            c = refit.player_components[m.player_id]
+        else:
+            c = refit.opponent_components.get(m.opponent_id)
+        league = np.nan if c is None else float(refit.component_league_avgs[c])
+        return league, refit.player_ratings, refit.opponent_ratings
+
+    def influence(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Effect of leaving out each matchup, without refitting
+
+        Every dropped matchup is an exact rank-2 update of its component's
+        cached normal equations, so all matchups together cost about one
+        fit. Bridges (e.g. a player's only matchup) split their component
+        and are refitted instead; an entity left without matchups gets a
+        NaN change. Changes are (without the matchup) - (fitted).
+
+        Args:
+            rows: Positions in ``self.matchups`` to drop (default: all)
+
+        Returns:
+            One row per dropped matchup with its game, player and opponent
+            and the changes in league average, player rating, opponent
+            rating and the player's adjusted metric
+
+        """
+        rows = np.arange(len(self.matchups)) if rows is None else np.asarray(rows)
+        row_comp = self._player_comp[self._player_idx[rows]]
+        bridge = self._bridge_mask()[rows]
+        p_keys = self._player_keys[self._player_idx[rows]]
+        o_keys = self._opponent_keys[self._opponent_idx[rows]]
+        league, player, opponent = (np.zeros(len(rows)) for _ in range(3))
+        for c in np.unique(row_comp):
+            sel = np.flatnonzero((row_comp == c) & ~bridge)
+            if len(sel) == 0:
+                continue
+            cache = self._influence_system(int(c))
+            local = np.array([cache["slot"][r] for r in rows[sel].tolist()])
+            targets = np.column_stack([cache["lp"][local], cache["qo"][local]])
+            theta, shift, mu = self._leave_one_out(int(c), local, targets)
+            league[sel] = mu
+            player[sel] = theta[:, 0] - shift
+            opponent[sel] = theta[:, 1]
+        for i in np.flatnonzero(bridge):
+            league[i], players, opponents = self._refit_influence(int(rows[i]))
+            player[i] = players.get(p_keys[i], np.nan)
+            opponent[i] = opponents.get(o_keys[i], np.nan)
+
+        league -= self.component_league_avgs[row_comp]
+        player -= pd.Series(p_keys).map(self.player_ratings).to_numpy()
+        opponent -= pd.Series(o_keys).map(self.opponent_ratings).to_numpy()
+        return pd.DataFrame(
+            {
+                "game_id": [self.matchups[r].game_id for r in rows.tolist()],
+                "player_id": p_keys,
+                "opponent_id": o_keys,
+                "league_avg_change": league,
+                "player_rating_change": player,
+                "opponent_rating_change": opponent,
+                "adjusted_metric_change": league + player,
+            },
+            index=rows,
+        )
+
+    def influence_matrix(
+        self, player_ids: List[str], rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Change in every listed player's rating when each matchup is left out
+
+        Args:
+            player_ids: Fitted players to report
+            rows: Positions in ``self.matchups`` to drop (default: all)
+
+        Returns:
+            Array of shape (len(rows), len(player_ids)); matchups in another
+            component than a player leave that player unchanged (0), and a
+            player left without matchups is NaN
+
+        """
+        rows = np.arange(len(self.matchups)) if rows is None else np.asarray(rows)
+        slots = pd.Index(self._player_keys).get_indexer(player_ids)
+        if (slots < 0).any():
+            unknown = [p for p, s in zip(player_ids, slots) if s < 0]
+            raise KeyError(f"Players not in the fit: {unknown}")
+        fitted = np.array([self.player_ratings[p] for p in player_ids])
+        row_comp = self._player_comp[self._player_idx[rows]]
+        bridge = self._bridge_mask()[rows]
+        out = np.zeros((len(rows), len(slots)))
+        for c in np.unique(row_comp):
+            sel = np.flatnonzero((row_comp == c) & ~bridge)
+            cols = np.flatnonzero(self._player_comp[slots] == c)
+            if len(cols) == 0 or len(sel) == 0:
+                continue
+            cache = self._influence_system(int(c))
+            local = np.array([cache["slot"][r] for r in rows[sel].tolist()])
+            targets = np.broadcast_to(
+                self._player_local[slots[cols]], (len(sel), len(cols))
+            )
+            theta, shift, _ = self._leave_one_out(int(c), local, targets)
+            out[np.ix_(sel, cols)] = theta - shift[:, None] - fitted[cols]
+        for i in np.flatnonzero(bridge):
+            cols = np.flatnonzero(self._player_comp[slots] == row_comp[i])
+            if len(cols) == 0:
+                continue
+            _, players, _ = self._refit_influence(int(rows[i]))
+            refitted = [players.get(player_ids[j], np.nan) for j in cols.tolist()]
+            out[i, cols] = np.array(refitted) - fitted[cols]
+        return out
+
     def get_adjusted_metric(self, player_id: str) -> float:
         """Get player's adjusted metric (league average + player rating)"""
-        adjusted = self.league_avg + self.player_ratings.get(player_id, 0.0)
+        league_avg = self._baseline(player_id)
+        adjusted = league_avg + self.player_ratings.get(player_id, 0.0)
         print(f"\nAdjusted metric for {player_id}:")
         print(f"  Raw player rating: {self.player_ratings.get(player_id, 0.0):.3f}")
-        print(f"  League average: {self.league_avg:.3f}")
+        print(f"  League average: {league_avg:.3f}")
         print(f"  Adjusted metric: {adjusted:.3f}")
         return adjusted
 
-    def _max_change(self, old: Dict, new: Dict) -> float:
-        keys = set(old.keys()) | set(new.keys())
-        changes = [abs(new.get(k, 0) - old.get(k, 0)) for k in keys]
-        return max(changes) if changes else 0.0
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _data_fingerprint(self) -> str:
+        """Digest of the fitted matchups (IDs, metric and weights)"""
+        h = hashlib.blake2b(digest_size=16)
+        for keys in (self._player_keys, self._opponent_keys):
+            h.update("\0".join(map(str, keys)).encode())
+        for values in (
+            self._player_idx,
+            self._opponent_idx,
+            self._metric,
+            self._base_weights,
+        ):
+            h.update(np.ascontiguousarray(values).tobytes())
+        return h.hexdigest()
+
+    def _hyperparameters(self) -> dict:
+        """Constructor settings needed to rebuild this model"""
+        return {"opponent_prior_ratio": self.opponent_prior_ratio}
+
+    def _entity_frames(self) -> Dict[str, pd.DataFrame]:
+        """Per-player and per-opponent ratings, weights and components"""
+        frames = {}
+        for entity, ratings, weights, components in (
+            (
+                "player",
+                self.player_ratings,
+                self.player_weights,
+                self.player_components,
+            ),
+            (
+                "opponent",
+                self.opponent_ratings,
+                self.opponent_weights,
+                self.opponent_components,
+            ),
+        ):
+            keys = list(ratings)
+            frames[entity] = pd.DataFrame(
+                {
+                    "key": pd.Series(keys, dtype=str),
+                    "rating": np.array([ratings[k] for k in keys], dtype=float),
+                    "weight": np.array([weights.get(k, 0.0) for k in keys]),
+                    "component": np.array(
+                        [components.get(k, 0) for k in keys], dtype=np.int32
+                    ),
+                }
+            )
+        return frames
+
+    def save(self, path) -> Path:
+        """Save the fitted ratings as a memory-mappable artifact directory
+
+        Scoring processes can open it with RatingArtifact (numpy only);
+        MutualOpponentModel.load rebuilds the full model.
+        """
+        meta = {
+            "model": type(self).__name__,
+            "position_model": type(self.position).__name__,
+            "position_settings": self.position.get_settings(),
+            "hyperparameters": self._hyperparameters(),
+            "fingerprint": self.fingerprint,
+            "league_avg": self.league_avg,
+            "n_matchups": len(self.matchups),
+            "n_components": self.n_components,
+            "converged": self.converged,
+            "n_iter": self.n_iter,
+        }
+        path = write_artifact(
+            path,
+            self._entity_frames(),
+            {"component_league_avgs": self.component_league_avgs},
+            meta,
+        )
+        print(f"Saved {len(self.player_ratings)} player ratings to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path) -> "MutualOpponentModel":
+        """Rebuild a fitted model saved with save()
+
+        The saved model and position classes are looked up among the
+        subclasses of this class and PositionModel, so the modules defining
+        them (e.g. adj_dynamic) must be imported first.
+        """
+        artifact = RatingArtifact(path)
+        meta = artifact.meta
+        models = {cls.__name__: cls, **_subclasses(cls)}
+        positions = _subclasses(PositionModel)
+        for name, known in (
+            (meta["model"], models),
+            (meta["position_model"], positions),
+        ):
+            if name not in known:
+                raise ValueError(f"{path} was saved by {name}, which is not loaded")
+        position = positions[meta["position_model"]](**meta["position_settings"])
+        model = models[meta["model"]](position, **meta["hyperparameters"])
+
+        for entity in ("player", "opponent"):
+            keys = artifact.array(f"{entity}__key").tolist()
+            columns = {
+                c: artifact.array(f"{entity}__{c}").tolist()
+                for c in ("rating", "weight", "component")
+            }
+            setattr(model, f"{entity}_ratings", dict(zip(keys, columns["rating"])))
+            setattr(model, f"{entity}_weights", dict(zip(keys, columns["weight"])))
+            setattr(
+                model, f"{entity}_components", dict(zip(keys, columns["component"]))
+            )
+        model.component_league_avgs = np.array(artifact.array("component_league_avgs"))
+        model.league_avg = meta["league_avg"]
+        model.fingerprint = meta["fingerprint"]
+        model.n_components = meta["n_components"]
+        model.converged = meta["converged"]
+        model.n_iter = meta["n_iter"]
+        print(f"Loaded {len(model.player_ratings)} player ratings from {path}")
+        return model
+
+    def write_table(self, db_path=None, table: Optional[str] = None) -> int:
+        """Replace the gold ratings table for this position
+
+        Args:
+            db_path: Warehouse file (default warehouse/superbowl.duckdb)
+            table: Target table (default main_gold.<position>_adjusted_ratings)
+
+        Returns:
+            Rows written (players plus opponents)
+
+        """
+        code = type(self.position).__name__.removesuffix("Model").lower()
+        table = table or f"main_gold.{code}_adjusted_ratings"
+        frames = self._entity_frames()
+        for entity, frame in frames.items():
+            frame.insert(0, "entity", entity)
+        ratings = pd.concat(frames.values(), ignore_index=True).rename(
+            columns={"key": "entity_id"}
+        )
+        ratings["league_avg"] = self.component_league_avgs[ratings["component"]]
+        ratings["fingerprint"] = self.fingerprint
+
+        with DuckDBConnector(db_path) as db:
+            db.conn.execute(f"CREATE SCHEMA IF NOT EXISTS {table.rsplit('.', 1)[0]}")
+            db.conn.register("new_ratings", ratings)
+            db.conn.execute(
+                f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM new_ratings"
+            )
+            db.conn.unregister("new_ratings")
+        print(f"Wrote {len(ratings)} ratings to {table}")
+        return len(ratings)
 
 
 print("✓ Defined MutualOpponentModel base class\n")
@@ -323,59 +1165,134 @@ class EnhancedMutualOpponentModel(MutualOpponentModel):
         position_model: PositionModel,
         recency_decay: float = 0.95,
         quality_weight: bool = True,
+        opponent_prior_ratio: float = 1.5,
     ):
-        super().__init__(position_model)
+        super().__init__(position_model, opponent_prior_ratio)
         print("\n=== Initializing Enhanced Model ===")
         self.recency_decay = recency_decay
         self.quality_weight = quality_weight
         self.game_weights: Dict[str, float] = {}  # game_id -> recency weight
+        # Quality reweighting state read by _sweep_weights during a fit
+        self._reweight_in_loop = False
+        self._fixed_quality: Optional[np.ndarray] = None
         print(f"  Recency decay: {recency_decay}")
         print(f"  Quality weighting: {quality_weight}")
 
-    def compute_game_weights(self, matchups: List[Matchup], reference_week: int = 18):
-        """Apply recency weighting based on week number"""
-        print(f"\n=== Applying recency weighting (reference week {reference_week}) ===")
-        for m in matchups:
-            try:
-                week = int(m.game_id.split("_")[-1])
-                weeks_ago = reference_week - week
-                recency_weight = self.recency_decay**weeks_ago
-                original_weight = m.weight
-                m.weight *= recency_weight
-                self.game_weights[m.game_id] = recency_weight
-
-                if m.player_id in ["WR1", "WR2", "RB1"]:  # Show examples
-                    print(
-                        f"  {m.player_id} Week {week}: original={original_weight:.3f}, recency={recency_weight:.3f}, final={m.weight:.3f}"
-                    )
-            except (ValueError, IndexError):
-                # If game_id format doesn't have week, skip recency weighting
-                pass
-
-    def fit_with_quality_weighting(self, matchups: List[Matchup]):
-        """Enhanced fitting with opponent quality consideration"""
-        print("\n=== Starting quality-weighted fitting ===")
-
-        # Two-pass approach:
-        print("1. Initial fit to establish baseline ratings...")
-        super().fit(matchups)
+    def compute_game_weights(
+        self,
+        matchups: List[Matchup],
+        reference_week: Optional[int] = None,
+        reference_season: Optional[int] = None,
+    ):
+        """Apply recency weighting on an absolute week index across seasons
+
+        Matchup weights are multiplied by ``recency_decay`` per week slot
+        before the reference week. A season boundary only adds the unused
+        playoff slots (see WEEKS_PER_SEASON), not the offseason.
+
+        Args:
+            matchups: Matchups with season_year and week_number set
+            reference_week: Week the weights are relative to (default:
+                latest week of the reference season in the data)
+            reference_season: Season of the reference week (default: latest
+                season in the data)
+
+        Raises:
+            ValueError: If any matchup lacks season_year or week_number
+
+        """
+        weeks = matchup_week_index(matchups)
+        seasons = np.array([m.season_year for m in matchups], dtype=np.int64)
+        if reference_season is None:
+            reference_season = int(seasons.max())
+        if reference_week is None:
+            reference = int(weeks[seasons == reference_season].max())
+            reference_week = reference - reference_season * WEEKS_PER_SEASON
+        else:
+            reference = int(absolute_week(reference_season, reference_week))
+        print(
+            f"\n=== Applying recency weighting (reference {reference_season} week {reference_week}) ==="
+        )
+        recency = recency_weights(weeks, self.recency_decay, reference)
+        for m, r in zip(matchups, recency.tolist()):
+            m.weight *= r
+        self.game_weights = dict(zip((m.game_id for m in matchups), recency.tolist()))
+        print(
+            f"  Weighted {len(matchups)} matchups over {len(np.unique(weeks))} weeks;"
+            f" recency in [{recency.min():.3f}, {recency.max():.3f}]"
+        )
 
-        # 2. Re-weight based on opponent strength and re-fit
-        if self.quality_weight:
-            print("\n2. Re-weighting based on opponent strength...")
-            for m in matchups:
-                opponent_strength = abs(self.opponent_ratings[m.opponent_id])
-                quality_multiplier = 1.0 + (opponent_strength / 2.0)  # 1.0-1.5x
-                original_weight = m.weight
-                m.weight *= quality_multiplier
+    def _hyperparameters(self) -> dict:
+        return {
+            **super()._hyperparameters(),
+            "recency_decay": self.recency_decay,
+            "quality_weight": self.quality_weight,
+        }
 
-                if m.player_id in ["WR1", "WR2"]:  # Show examples
-                    print(
-                        f"  {m.player_id} vs {m.opponent_id}: strength={opponent_strength:.3f}, multiplier={quality_multiplier:.3f}, weight {original_weight:.3f}→{m.weight:.3f}"
-                    )
+    def _quality_multipliers(self, opponent_ratings: np.ndarray) -> np.ndarray:
+        """Per-matchup multiplier from opponent strength (1.0-1.5x)"""
+        return 1.0 + np.abs(opponent_ratings) / 2.0
+
+    def _sweep_weights(
+        self, rows: np.ndarray, base_weights: np.ndarray, opponent_ratings: np.ndarray
+    ) -> np.ndarray:
+        """Apply quality multipliers on top of the matchup weights"""
+        if self._reweight_in_loop:
+            return base_weights * self._quality_multipliers(opponent_ratings)
+        if self._fixed_quality is not None:
+            return base_weights * self._fixed_quality[rows]
+        return base_weights
+
+    def fit_with_quality_weighting(
+        self,
+        matchups: List[Matchup],
+        joint: bool = True,
+        max_iter: int = 100,
+        tol: float = 1e-4,
+        warm_start: bool = False,
+        **solver,
+    ):
+        """Enhanced fitting with opponent quality consideration
+
+        Matchup weights are never modified; quality multipliers live in the
+        model's own weight array (``self.weights`` after the fit).
+
+        Args:
+            matchups: Observations to fit
+            joint: Recompute the multipliers from the current opponent
+                ratings inside every sweep (IRLS), so the whole fit costs
+                about one plain fit. If False, fit once, freeze the
+                multipliers from that fit and refit from its ratings.
+            max_iter: Maximum number of sweeps per fit
+            tol: Convergence tolerance
+            warm_start: Start from the current ratings instead of zero
+            **solver: Acceleration settings passed to fit (omega, anderson)
+
+        """
+        print("\n=== Starting quality-weighted fitting ===")
+        if not self.quality_weight:
+            self.fit(matchups, max_iter, tol, warm_start, **solver)
+            return
 
-            print("\n3. Re-fitting with quality-weighted data...")
-            super().fit(matchups)
+        try:
+            if joint:
+                print("Reweighting by opponent strength inside each sweep...")
+                self._reweight_in_loop = True
+                self.fit(matchups, max_iter, tol, warm_start, **solver)
+            else:
+                print("1. Initial fit to establish baseline ratings...")
+                self.fit(matchups, max_iter, tol, warm_start, **solver)
+                opponent = np.array(
+                    [self.opponent_ratings[k] for k in self._opponent_keys]
+                )
+                self._fixed_quality = self._quality_multipliers(
+                    opponent[self._opponent_idx]
+                )
+                print("\n2. Re-fitting with quality-weighted data...")
+                self.fit(matchups, max_iter, tol, True, **solver)
+        finally:
+            self._reweight_in_loop = False
+            self._fixed_quality = None
 
     def get_confidence_interval(
         self, player_id: str, alpha: float = 0.05
@@ -383,8 +1300,7 @@ class EnhancedMutualOpponentModel(MutualOpponentModel):
         """Calculate confidence interval for rating"""
         print(f"\n=== Calculating confidence interval for {player_id} ===")
 
-        player_matchups = [m for m in self.matchups if m.player_id == player_id]
-        n_effective = sum(m.weight for m in player_matchups)
+        n_effective = self.player_weights.get(player_id, 0.0)
 
         print(f"  Effective sample size: {n_effective:.1f}")
 
@@ -427,18 +1343,33 @@ class ModelFactory:
     """Factory to create position-specific models"""
 
     @staticmethod
-    def create_model(position: str, **kwargs) -> EnhancedMutualOpponentModel:
+    def create_model(
+        position: str, prior_strength: Optional[float] = None, **kwargs
+    ) -> EnhancedMutualOpponentModel:
+        """Create a position model; keyword arguments override the defaults
+
+        Args:
+            position: Position code ("WR", "RB")
+            prior_strength: Player shrinkage k (position default if None)
+            **kwargs: recency_decay, quality_weight, opponent_prior_ratio
+
+        """
         print(f"\n=== ModelFactory creating {position} model ===")
 
         position_map = {
-            "WR": WRModel(),
-            "RB": RBModel(),
+            "WR": WRModel,
+            "RB": RBModel,
             # Add more positions as needed
         }
 
-        position_model = position_map.get(position)
-        if not position_model:
+        position_class = position_map.get(position)
+        if not position_class:
             raise ValueError(f"Unknown position: {position}")
+        position_model = (
+            position_class()
+            if prior_strength is None
+            else position_class(prior_strength=prior_strength)
+        )
 
         print(f"  Found position model: {position_model.__class__.__name__}")
 
@@ -448,16 +1379,64 @@ class ModelFactory:
             "RB": {"recency_decay": 0.90, "quality_weight": False},
         }
 
-        model_config = config.get(position, {})
+        model_config = {**config.get(position, {}), **kwargs}
         print(f"  Applying config: {model_config}")
 
         return EnhancedMutualOpponentModel(
-            position_model=position_model, **model_config, **kwargs
+            position_model=position_model, **model_config
         )
 
 
 print("✓ Defined ModelFactory\n")
 
+
+def matchups_from_stats(stats: pd.DataFrame) -> List[Matchup]:
+    """Matchups from per-(player, defense, season) sufficient statistics
+
+    Each row stands in for all of its games: the sweeps only read sums of
+    weight and weight * metric per (player, opponent), so fitting these
+    rows gives the same ratings as fitting the games one by one. A row's
+    ``game_id`` is the row key "<player_id>|<defense_id>", so influence()
+    and game_weights report matchup rows rather than games.
+
+    Args:
+        stats: Rows shaped like main_silver.wr_matchups (player_id,
+            defense_id, season_year, last_week, weight, weighted_metric)
+
+    """
+    metric = (stats["weighted_metric"] / stats["weight"]).tolist()
+    weight = stats["weight"].astype(float).tolist()
+    return [
+        Matchup(p, d, f"{p}|{d}", m, w, w, s, wk)
+        for p, d, m, w, s, wk in zip(
+            stats["player_id"],
+            stats["defense_id"],
+            metric,
+            weight,
+            stats["season_year"].tolist(),
+            stats["last_week"].tolist(),
+        )
+    ]
+
+
+def load_wr_matchups(
+    db_path=None, season_min: Optional[int] = None, season_max: Optional[int] = None
+) -> List[Matchup]:
+    """Load WR matchups from the warehouse, already collapsed in DuckDB
+
+    One matchup per (player, defense, season) row of main_silver.wr_matchups.
+    Unweighted fits match per-game fits exactly. Recency weighting
+    (compute_game_weights) is only approximate on these rows: each row is
+    weighted as if all of its games were played in its ``last_week``, which
+    is not equivalent to weighting the games one by one. Load per-game
+    matchups when exact recency weights matter.
+    """
+    with DuckDBConnector(db_path) as db:
+        stats = db.get_wr_matchups(season_min, season_max)
+    print(f"Loaded {len(stats)} WR matchup rows ({stats['games'].sum()} games)")
+    return matchups_from_stats(stats)
+
+
 # ============================================================================
 # DEMONSTRATION AND TESTING
 # ============================================================================
@@ -475,6 +1454,8 @@ def create_sample_data():
             "wr_id": "WR1",
             "defense_id": "DEF1",
             "game_id": "2023_1",
+            "season_year": 2023,
+            "week_number": 1,
             "epa": 12.5,
             "targets": 8,
             "routes": 40,
@@ -483,6 +1464,8 @@ def create_sample_data():
             "wr_id": "WR1",
             "defense_id": "DEF2",
             "game_id": "2023_2",
+            "season_year": 2023,
+            "week_number": 2,
             "epa": 8.2,
             "targets": 6,
             "routes": 38,
@@ -491,6 +1474,8 @@ def create_sample_data():
             "wr_id": "WR2",
             "defense_id": "DEF1",
             "game_id": "2023_1",
+            "season_year": 2023,
+            "week_number": 1,
             "epa": 6.8,
             "targets": 5,
             "routes": 35,
@@ -499,6 +1484,8 @@ def create_sample_data():
             "wr_id": "WR2",
             "defense_id": "DEF3",
             "game_id": "2023_3",
+            "season_year": 2023,
+            "week_number": 3,
             "epa": 15.3,
             "targets": 9,
             "routes": 42,
@@ -507,6 +1494,8 @@ def create_sample_data():
             "wr_id": "WR3",
             "defense_id": "DEF2",
             "game_id": "2023_2",
+            "season_year": 2023,
+            "week_number": 2,
             "epa": 4.5,
             "targets": 4,
             "routes": 30,
@@ -515,6 +1504,8 @@ def create_sample_data():
             "wr_id": "WR3",
             "defense_id": "DEF3",
             "game_id": "2023_3",
+            "season_year": 2023,
+            "week_number": 3,
             "epa": 9.6,
             "targets": 7,
             "routes": 36,
@@ -527,6 +1518,8 @@ def create_sample_data():
             "rb_id": "RB1",
             "run_defense_id": "RDEF1",
             "game_id": "2023_1",
+            "season_year": 2023,
+            "week_number": 1,
             "epa": 8.5,
             "carries": 15,
         },
@@ -534,6 +1527,8 @@ def create_sample_data():
             "rb_id": "RB1",
             "run_defense_id": "RDEF2",
             "game_id": "2023_2",
+            "season_year": 2023,
+            "week_number": 2,
             "epa": 12.3,
             "carries": 18,
         },
@@ -541,6 +1536,8 @@ def create_sample_data():
             "rb_id": "RB2",
             "run_defense_id": "RDEF1",
             "game_id": "2023_1",
+            "season_year": 2023,
+            "week_number": 1,
             "epa": 5.2,
             "carries": 12,
         },
@@ -548,6 +1545,8 @@ def create_sample_data():
             "rb_id": "RB2",
             "run_defense_id": "RDEF3",
             "game_id": "2023_3",
+            "season_year": 2023,
+            "week_number": 3,
             "epa": 9.8,
             "carries": 16,
         },
@@ -604,6 +1603,17 @@ def demonstrate_wr_model():
         print(f"  Adjusted EPA/target: {adjusted:.3f}")
         print(f"  95% CI: [{ci_lower:.3f}, {ci_upper:.3f}]")
 
+    # Leave-one-game-out effects, without refitting
+    print("\n" + "-" * 40)
+    print("GAME INFLUENCE (adjusted metric change if the game is dropped)")
+    print("-" * 40)
+    influence = wr_model.influence()
+    print(
+        influence[["game_id", "player_id", "opponent_id", "adjusted_metric_change"]]
+        .round(4)
+        .to_string(index=False)
+    )
+
     return wr_model
 
 
@@ -2,12 +2,14 @@
 WR EDA - Query and analyze wide receiver data from bronze layer
 """
 
+import argparse
+import re
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -15,12 +17,9 @@ sys.path.insert(0, str(project_root))
 
 # Now import from src (after path is set)
 from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+from src.utils.figures import FigurePipeline, FigureSpec  # noqa: E402
 
-# Setup
-plt.style.use("seaborn-v0_8-darkgrid")
-sns.set_palette("husl")
 FIGS_DIR = project_root / "docs" / "figures" / "wr"
-FIGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def print_header(title):
@@ -30,9 +29,153 @@ def print_header(title):
     print("=" * 60)
 
 
-def main():
+def build_filter(
+    season: Optional[int] = None, player: Optional[str] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """Build a WHERE clause and named parameters for the report filters.
+
+    Args:
+        season: Only include this season
+        player: Only include players whose name contains this (case-insensitive)
+
+    Returns:
+        (where clause, parameters) - the clause is "" when no filter is set
+
+    """
+    clauses: List[str] = []
+    params: Dict[str, Any] = {}
+    if season is not None:
+        clauses.append("season_year = $season")
+        params["season"] = season
+    if player:
+        clauses.append("player_name ILIKE $player")
+        params["player"] = f"%{player}%"
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def filter_tag(season: Optional[int] = None, player: Optional[str] = None) -> str:
+    """Name suffix for outputs of a filtered run ("" when unfiltered).
+
+    Filtered runs write next to the published league-wide outputs under
+    this tag instead of replacing them.
+    """
+    parts: List[str] = []
+    if season is not None:
+        parts.append(f"season{season}")
+    if player:
+        parts.append("player-" + re.sub(r"[^a-z0-9]+", "-", player.lower()).strip("-"))
+    return "_".join(parts)
+
+
+def season_profile(
+    db: DuckDBConnector, where: str = "", params: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Profile wr_season in a single scan.
+
+    GROUPING SETS produces the per-season rows and the all-seasons row
+    from the same pass over the table.
+
+    Returns:
+        (per-season profile, all-seasons profile)
+
+    """
+    profile = db.query(
+        f"""
+        SELECT
+            GROUPING(season_year) = 1 as is_total,
+            season_year,
+            COUNT(DISTINCT player_id) as unique_players,
+            COUNT(*) as total_records,
+            MIN(season_year) as first_season,
+            MAX(season_year) as last_season,
+            AVG(receiving_yards) as avg_rec_yards,
+            AVG(receptions) as avg_receptions,
+            AVG(targets) as avg_targets,
+            AVG(receiving_td) as avg_td,
+            MAX(receiving_yards) as max_rec_yards,
+            MAX(receiving_td) as max_td
+        FROM main_bronze.wr_season
+        {where}
+        GROUP BY GROUPING SETS ((season_year), ())
+        ORDER BY is_total, season_year
+        """,
+        params,
+    )
+    totals = profile[profile["is_total"]]
+    seasonal = profile[~profile["is_total"] & profile["season_year"].notna()]
+    seasonal = seasonal.drop(columns=["is_total", "first_season", "last_season"])
+    if totals.empty:
+        return seasonal, pd.Series(dtype=object)
+    return seasonal, totals.iloc[0]
+
+
+def plot_seasonal_trends(seasonal: pd.DataFrame) -> None:
+    """Plot average yards and receptions per season."""
+    plt.plot(
+        seasonal["season_year"],
+        seasonal["avg_rec_yards"],
+        marker="o",
+        label="Avg Receiving Yards",
+    )
+    plt.plot(
+        seasonal["season_year"],
+        seasonal["avg_receptions"],
+        marker="s",
+        label="Avg Receptions",
+    )
+    plt.title("WR Seasonal Averages Over Time", fontsize=16, fontweight="bold")
+    plt.xlabel("Year")
+    plt.ylabel("Average")
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+def plot_top_career_yards(top_alltime: pd.DataFrame) -> None:
+    """Plot the career receiving yards leaders as horizontal bars."""
+    plt.barh(top_alltime["player_name"], top_alltime["career_yards"] / 1000)
+    plt.xlabel("Career Receiving Yards (Thousands)")
+    plt.title("Top 15 WRs by Career Receiving Yards", fontsize=16, fontweight="bold")
+
+    # Add value labels
+    for i, (career_yards, seasons) in enumerate(
+        zip(top_alltime["career_yards"], top_alltime["seasons"])
+    ):
+        plt.text(
+            career_yards / 1000 + 50,
+            i,
+            f"{career_yards:,.0f} yds ({seasons} seasons)",
+            va="center",
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the report's command-line filters."""
+    parser = argparse.ArgumentParser(description="WR exploratory report")
+    parser.add_argument("--season", type=int, help="Only report on this season")
+    parser.add_argument(
+        "--player", help="Only report on players whose name contains this"
+    )
+    parser.add_argument(
+        "--draft", action="store_true", help="Render figures at low DPI"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main EDA function."""
+    args = parse_args(argv)
+    where, params = build_filter(args.season, args.player)
+    tag = filter_tag(args.season, args.player)
+    figs_dir = FIGS_DIR / tag if tag else FIGS_DIR
+    summary_path = FIGS_DIR.parent / (
+        f"wr_summary_stats_{tag}.csv" if tag else "wr_summary_stats.csv"
+    )
+    charts: List[FigureSpec] = []
+
     print_header("🏈 WIDE RECEIVER DATA EXPLORATION")
+    if params:
+        print(f"\nFilters: {params}")
 
     with DuckDBConnector() as db:
         # 1. Check what tables we have
@@ -44,52 +187,24 @@ def main():
             )
         )
 
-        # 2. Seasonal data overview
+        # 2. Seasonal data overview - every summary stat comes from this scan
         print_header("📅 SEASONAL WR DATA (2015-2025)")
 
-        seasonal = db.query("""
-            SELECT
-                season_year,
-                COUNT(DISTINCT player_id) as unique_players,
-                COUNT(*) as total_records,
-                AVG(receiving_yards) as avg_rec_yards,
-                AVG(receptions) as avg_receptions,
-                AVG(targets) as avg_targets,
-                AVG(receiving_td) as avg_td
-            FROM main_bronze.wr_season
-            GROUP BY season_year
-            ORDER BY season_year
-        """)
+        seasonal, totals = season_profile(db, where, params)
+        if seasonal.empty:
+            print("\nNo WR seasons match the filters.")
+            return
 
         print("\nSeasonal summary by year:")
         print(seasonal.to_string(index=False))
 
-        # Plot seasonal trends
-        plt.figure(figsize=(12, 6))
-        plt.plot(
-            seasonal["season_year"],
-            seasonal["avg_rec_yards"],
-            marker="o",
-            label="Avg Receiving Yards",
-        )
-        plt.plot(
-            seasonal["season_year"],
-            seasonal["avg_receptions"],
-            marker="s",
-            label="Avg Receptions",
-        )
-        plt.title("WR Seasonal Averages Over Time", fontsize=16, fontweight="bold")
-        plt.xlabel("Year")
-        plt.ylabel("Average")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.savefig(FIGS_DIR / "wr_seasonal_trends.png", dpi=300, bbox_inches="tight")
-        plt.close()
+        charts.append(FigureSpec("wr_seasonal_trends", seasonal, plot_seasonal_trends))
 
         # 3. Top WR seasons
         print_header("🏆 TOP 10 WR SEASONS (by receiving yards)")
 
-        top_seasons = db.query("""
+        top_seasons = db.query(
+            f"""
             SELECT
                 player_name,
                 team,
@@ -99,9 +214,12 @@ def main():
                 receiving_td,
                 targets
             FROM main_bronze.wr_season
+            {where}
             ORDER BY receiving_yards DESC
             LIMIT 10
-        """)
+        """,
+            params,
+        )
 
         print(top_seasons.to_string(index=False))
 
@@ -110,9 +228,12 @@ def main():
             print_header("🎮 GAME-LEVEL WR DATA (2021-2025)")
 
             # Check if game data exists
-            game_check = db.query("SELECT COUNT(*) as cnt FROM main_bronze.wr_game")
+            game_check = db.query(
+                f"SELECT COUNT(*) as cnt FROM main_bronze.wr_game {where}", params
+            )
             if game_check.iloc[0, 0] > 0:
-                game_summary = db.query("""
+                game_summary = db.query(
+                    f"""
                     SELECT
                         season_year,
                         COUNT(DISTINCT week_number) as weeks,
@@ -121,15 +242,19 @@ def main():
                         AVG(receptions) as avg_rec_per_game,
                         MAX(receiving_yards) as max_yards_game
                     FROM main_bronze.wr_game
+                    {where}
                     GROUP BY season_year
                     ORDER BY season_year
-                """)
+                """,
+                    params,
+                )
 
                 print("\nGame data summary by year:")
                 print(game_summary.to_string(index=False))
 
                 # Best single games
-                top_games = db.query("""
+                top_games = db.query(
+                    f"""
                     SELECT
                         player_name,
                         team,
@@ -140,9 +265,12 @@ def main():
                         receptions,
                         receiving_td
                     FROM main_bronze.wr_game
+                    {where}
                     ORDER BY receiving_yards DESC
                     LIMIT 10
-                """)
+                """,
+                    params,
+                )
 
                 print("\n🏆 TOP 10 WR GAMES (by receiving yards):")
                 print(top_games.to_string(index=False))
@@ -153,20 +281,15 @@ def main():
         except Exception as e:
             print(f"\nGame data not available: {e}")
 
-        # 5. Compare 2023 players
-        print_header("🔍 2023 WR LEADERS")
-
-        # First, check what years we actually have
-        years_available = db.query("""
-            SELECT DISTINCT season_year
-            FROM main_bronze.wr_season
-            WHERE season_year IS NOT NULL AND season_year != ''
-            ORDER BY season_year
-        """)
-        print(f"\nYears available in data: {years_available['season_year'].tolist()}")
+        # 5. Leaders of the selected (or latest) season
+        years = seasonal["season_year"].astype(int).tolist()
+        print(f"\nYears available in data: {years}")
+        leader_year = args.season if args.season is not None else years[-1]
+        print_header(f"🔍 {leader_year} WR LEADERS")
 
-        # Now get 2023 data with proper filtering
-        wr_2023 = db.query("""
+        leader_where, leader_params = build_filter(leader_year, args.player)
+        leaders = db.query(
+            f"""
             SELECT
                 player_name,
                 team,
@@ -175,69 +298,48 @@ def main():
                 receiving_td,
                 targets
             FROM main_bronze.wr_season
-            WHERE season_year = '2023'  -- Use string comparison
+            {leader_where}
                 AND receiving_yards IS NOT NULL
             ORDER BY receiving_yards DESC
             LIMIT 15
-        """)
+        """,
+            leader_params,
+        )
+        print(f"\nTop 15 WRs of {leader_year}:")
+        print(leaders.to_string(index=False))
 
-        if len(wr_2023) > 0:
-            print("\nTop 15 WRs of 2023:")
-            print(wr_2023.to_string(index=False))
+        # 6. Create a bar chart of top 10 WRs all-time
+        if not params:
+            # Unfiltered careers come straight from the maintained career table
+            top_alltime = db.get_top_wr_careers(n=15, min_seasons=3)
         else:
-            print("\nNo 2023 data found. Trying alternative year format...")
-
-            # Try numeric conversion if string doesn't work
-            wr_2023 = db.query("""
+            top_alltime = db.query(
+                f"""
                 SELECT
-                    player_name,
-                    team,
-                    receiving_yards,
-                    receptions,
-                    receiving_td,
-                    targets
+                    player_id,
+                    ARG_MAX(player_name, season_year) as player_name,
+                    SUM(receiving_yards) as career_yards,
+                    COUNT(DISTINCT season_year) as seasons,
+                    AVG(receiving_yards) as avg_per_season
                 FROM main_bronze.wr_season
-                WHERE TRY_CAST(season_year AS INTEGER) = 2023
-                    AND receiving_yards IS NOT NULL
-                ORDER BY receiving_yards DESC
+                {where}
+                GROUP BY player_id
+                HAVING seasons >= {1 if args.season is not None else 3}
+                ORDER BY career_yards DESC
                 LIMIT 15
-            """)
-            print(wr_2023.to_string(index=False))
-
-        # 6. Create a bar chart of top 10 WRs all-time
-        plt.figure(figsize=(14, 8))
-
-        top_alltime = db.query("""
-            SELECT
-                player_name,
-                SUM(receiving_yards) as career_yards,
-                COUNT(DISTINCT season_year) as seasons,
-                AVG(receiving_yards) as avg_per_season
-            FROM main_bronze.wr_season
-            GROUP BY player_name
-            HAVING seasons >= 3
-            ORDER BY career_yards DESC
-            LIMIT 15
-        """)
-
-        plt.barh(top_alltime["player_name"], top_alltime["career_yards"] / 1000)
-        plt.xlabel("Career Receiving Yards (Thousands)")
-        plt.title(
-            "Top 15 WRs by Career Receiving Yards", fontsize=16, fontweight="bold"
-        )
-
-        # Add value labels
-        for i, (_, row) in enumerate(top_alltime.iterrows()):
-            plt.text(
-                row["career_yards"] / 1000 + 50,
-                i,
-                f"{row['career_yards']:,.0f} yds ({row['seasons']} seasons)",
-                va="center",
+            """,
+                params,
             )
 
-        plt.tight_layout()
-        plt.savefig(FIGS_DIR / "top_wr_career_yards.png", dpi=300, bbox_inches="tight")
-        plt.close()
+        charts.append(
+            FigureSpec(
+                "top_wr_career_yards",
+                top_alltime,
+                plot_top_career_yards,
+                figsize=(14, 8),
+                tight_layout=True,
+            )
+        )
 
         # 7. Save summary stats
         print_header("💾 SAVING SUMMARY")
@@ -253,25 +355,29 @@ def main():
                 "Most TDs in a season",
             ],
             "Value": [
-                str(db.query("SELECT COUNT(*) FROM main_bronze.wr_season").iloc[0, 0]),
-                str(
-                    db.query(
-                        "SELECT COUNT(DISTINCT player_id) FROM main_bronze.wr_season"
-                    ).iloc[0, 0]
-                ),
-                f"{db.query('SELECT MIN(season_year) FROM main_bronze.wr_season').iloc[0, 0]}-{db.query('SELECT MAX(season_year) FROM main_bronze.wr_season').iloc[0, 0]}",
-                f"{db.query('SELECT AVG(receiving_yards) FROM main_bronze.wr_season').iloc[0, 0]:.0f}",
-                f"{db.query('SELECT AVG(receiving_td) FROM main_bronze.wr_season').iloc[0, 0]:.1f}",
-                f"{db.query('SELECT MAX(receiving_yards) FROM main_bronze.wr_season').iloc[0, 0]:,.0f}",
-                f"{db.query('SELECT MAX(receiving_td) FROM main_bronze.wr_season').iloc[0, 0]}",
+                str(totals["total_records"]),
+                str(totals["unique_players"]),
+                f"{totals['first_season']:.0f}-{totals['last_season']:.0f}",
+                f"{totals['avg_rec_yards']:.0f}",
+                f"{totals['avg_td']:.1f}",
+                f"{totals['max_rec_yards']:,.0f}",
+                f"{totals['max_td']:.0f}",
             ],
         }
 
-        pd.DataFrame(summary).to_csv(
-            FIGS_DIR.parent / "wr_summary_stats.csv", index=False
-        )
-        print(f"\n✅ Summary saved to {FIGS_DIR.parent}/wr_summary_stats.csv")
-        print(f"📁 Visualizations saved to: {FIGS_DIR}")
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(summary).to_csv(summary_path, index=False)
+        print(f"\n✅ Summary saved to {summary_path}")
+
+    # Charts only depend on the frames above, so render them after the
+    # connection is closed; unchanged charts are skipped
+    pipeline = FigurePipeline(figs_dir, draft=args.draft)
+    status = pipeline.render(charts)
+    rendered = sum(v == "rendered" for v in status.values())
+    print(
+        f"📁 Visualizations saved to: {pipeline.out_dir} "
+        f"({rendered}/{len(status)} rendered)"
+    )
 
 
 if __name__ == "__main__":
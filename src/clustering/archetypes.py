@@ -0,0 +1,314 @@
+"""Stage 1: per-position player archetypes from warehouse features.
+
+For each position, the engine:
+- streams standardized player-season features from DuckDB in batches;
+- fits one mini-batch K-Means per candidate k, updating all of them from
+  the same batch in a thread pool;
+- picks k at the elbow of the inertia curve;
+- writes archetype labels and centroids to main_gold.
+
+Standardization (mean/std per feature) is computed in SQL up front. Rows
+are streamed in a deterministic hash order so batches are not grouped by
+season or team. Only one batch is held in memory at a time.
+
+Usage:
+    python -m src.clustering.archetypes --positions WR --k-min 2 --k-max 10
+"""
+
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.clustering.minibatch_kmeans import MiniBatchKMeans, elbow_k
+from src.utils.duckdb_connector import DuckDBConnector
+
+logger = logging.getLogger(__name__)
+
+GOLD_SCHEMA = "main_gold"
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    """Where a position's clustering features live in the warehouse."""
+
+    position: str
+    relation: str
+    features: Tuple[str, ...]
+    keys: Tuple[str, ...] = ("player_id", "season_year")
+    name_column: str = "player_name"
+    where: str = ""
+
+
+# Positions with performance features in the warehouse. Others are added as
+# their bronze tables land.
+FEATURE_SETS: Dict[str, FeatureSet] = {
+    "WR": FeatureSet(
+        position="WR",
+        relation="main_bronze.wr_season",
+        features=(
+            "targets",
+            "receptions",
+            "receiving_yards",
+            "receiving_td",
+            "reception_pct",
+            "red_zone_targets",
+            "rushing_yards",
+            "total_points",
+        ),
+        where="targets > 0",
+    ),
+}
+
+
+@dataclass
+class ArchetypeFit:
+    """Result of fitting one position."""
+
+    position: str
+    k: int
+    inertias: Dict[int, float]
+    model: MiniBatchKMeans
+    means: np.ndarray
+    stds: np.ndarray
+    n_rows: int
+
+    def centroids(self, features: Sequence[str]) -> pd.DataFrame:
+        """Return the chosen model's centers in original feature units."""
+        centers = self.model.centers * self.stds + self.means
+        df = pd.DataFrame(centers, columns=list(features))
+        df.insert(0, "archetype", np.arange(self.k))
+        df.insert(0, "position", self.position)
+        return df
+
+
+class ArchetypeEngine:
+    """Fit per-position archetypes by streaming features from the warehouse."""
+
+    def __init__(
+        self,
+        db: DuckDBConnector,
+        ks: Sequence[int] = range(2, 11),
+        batch_rows: int = 8192,
+        epochs: int = 3,
+        max_workers: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """Initialize the engine.
+
+        Args:
+            db: Connector to read features from and write labels to
+            ks: Candidate cluster counts for the elbow
+            batch_rows: Rows per streamed batch
+            epochs: Passes over the feature stream while fitting
+            max_workers: Threads updating the candidate models per batch
+            seed: Seed for every model's initialization
+
+        """
+        if batch_rows < max(ks):
+            raise ValueError("batch_rows must be at least the largest k")
+        self.db = db
+        self.ks = list(ks)
+        self.batch_rows = batch_rows
+        self.epochs = epochs
+        self.max_workers = max_workers or len(self.ks)
+        self.seed = seed
+
+    # ------------------------------------------------------------------
+    # Feature stream
+    # ------------------------------------------------------------------
+
+    def _where(self, fs: FeatureSet) -> str:
+        return f"WHERE {fs.where}" if fs.where else ""
+
+    def _stats(self, fs: FeatureSet) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Return per-feature mean, std and the row count in one scan."""
+        exprs = ", ".join(f"AVG({c}), STDDEV_POP({c})" for c in fs.features)
+        row = self.db.conn.execute(
+            f"SELECT COUNT(*), {exprs} FROM {fs.relation} {self._where(fs)}"
+        ).fetchone()
+        values = np.array(
+            [np.nan if v is None else v for v in row[1:]], dtype=float
+        ).reshape(-1, 2)
+        means = np.nan_to_num(values[:, 0])
+        stds = np.nan_to_num(values[:, 1])
+        stds[stds == 0] = 1.0
+        return means, stds, int(row[0])
+
+    def _feature_sql(self, fs: FeatureSet, means: np.ndarray, stds: np.ndarray) -> str:
+        """Build SQL emitting keys plus standardized, mean-imputed features."""
+        keys = ", ".join(fs.keys)
+        scaled = ", ".join(
+            f"(COALESCE(CAST({c} AS DOUBLE), {m}) - {m}) / {s} AS {c}"
+            for c, m, s in zip(fs.features, means.tolist(), stds.tolist())
+        )
+        return (
+            f"SELECT {keys}, {fs.name_column} AS player_name, {scaled} "
+            f"FROM {fs.relation} {self._where(fs)} "
+            f"ORDER BY hash({keys}), {keys}"
+        )
+
+    def _batches(self, sql: str):
+        return self.db.iter_batches(sql, batch_rows=self.batch_rows)
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+
+    def fit(self, fs: FeatureSet) -> ArchetypeFit:
+        """Fit every candidate k for one position and pick the elbow."""
+        if not self.db.conn:
+            self.db.connect()
+        means, stds, n_rows = self._stats(fs)
+        ks = [k for k in self.ks if k <= n_rows]
+        if not ks:
+            raise ValueError(f"{fs.position}: {n_rows} rows is too few to cluster")
+
+        sql = self._feature_sql(fs, means, stds)
+        columns = list(fs.features)
+        models = {k: MiniBatchKMeans(k, seed=self.seed) for k in ks}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ks))) as pool:
+            for epoch in range(self.epochs):
+                for batch in self._batches(sql):
+                    x = batch[columns].to_numpy(dtype=float)
+                    list(pool.map(lambda m: m.partial_fit(x), models.values()))
+                logger.info(f"{fs.position}: epoch {epoch + 1}/{self.epochs} done")
+
+            inertias = dict.fromkeys(ks, 0.0)
+            for batch in self._batches(sql):
+                x = batch[columns].to_numpy(dtype=float)
+                for k, value in zip(
+                    ks, pool.map(lambda m: m.inertia(x), models.values())
+                ):
+                    inertias[k] += value
+
+        k = elbow_k(ks, [inertias[k] for k in ks])
+        logger.info(f"{fs.position}: {n_rows:,} rows, elbow at k={k}")
+        return ArchetypeFit(fs.position, k, inertias, models[k], means, stds, n_rows)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _ensure_tables(self) -> None:
+        conn = self.db.conn
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {GOLD_SCHEMA}")
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {GOLD_SCHEMA}.player_archetypes (
+                position VARCHAR,
+                player_id VARCHAR,
+                season_year INTEGER,
+                player_name VARCHAR,
+                archetype INTEGER,
+                distance DOUBLE
+            )
+        """)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {GOLD_SCHEMA}.archetype_centroids (
+                position VARCHAR,
+                archetype INTEGER,
+                k INTEGER,
+                feature VARCHAR,
+                value DOUBLE
+            )
+        """)
+
+    def write(self, fs: FeatureSet, fit: ArchetypeFit) -> int:
+        """Replace a position's labels and centroids in main_gold.
+
+        Returns:
+            Number of labelled player-seasons
+
+        """
+        self._ensure_tables()
+        conn = self.db.conn
+        conn.execute(
+            f"DELETE FROM {GOLD_SCHEMA}.player_archetypes WHERE position = ?",
+            [fs.position],
+        )
+        conn.execute(
+            f"DELETE FROM {GOLD_SCHEMA}.archetype_centroids WHERE position = ?",
+            [fs.position],
+        )
+
+        centroids = fit.centroids(fs.features).melt(
+            id_vars=["position", "archetype"], var_name="feature"
+        )
+        centroids["k"] = fit.k
+        conn.register("new_centroids", centroids)
+        conn.execute(f"""
+            INSERT INTO {GOLD_SCHEMA}.archetype_centroids
+            SELECT position, archetype, k, feature, value FROM new_centroids
+        """)
+        conn.unregister("new_centroids")
+
+        written = 0
+        columns = list(fs.features)
+        sql = self._feature_sql(fs, fit.means, fit.stds)
+        for batch in self._batches(sql):
+            labels, d2 = fit.model.assign(batch[columns].to_numpy(dtype=float))
+            out = pd.DataFrame(
+                {
+                    "position": fs.position,
+                    "player_id": batch["player_id"].astype(str),
+                    "season_year": batch["season_year"],
+                    "player_name": batch["player_name"],
+                    "archetype": labels,
+                    "distance": np.sqrt(d2),
+                }
+            )
+            conn.register("new_labels", out)
+            conn.execute(
+                f"INSERT INTO {GOLD_SCHEMA}.player_archetypes SELECT * FROM new_labels"
+            )
+            conn.unregister("new_labels")
+            written += len(out)
+        return written
+
+    def run(self, positions: Optional[Sequence[str]] = None) -> Dict[str, ArchetypeFit]:
+        """Fit and write archetypes for each position (default: all known)."""
+        fits = {}
+        for position in positions or sorted(FEATURE_SETS):
+            fs = FEATURE_SETS[position]
+            fits[position] = self.fit(fs)
+            written = self.write(fs, fits[position])
+            logger.info(f"{position}: wrote {written:,} archetype labels")
+        return fits
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the archetype stage from the command line."""
+    parser = argparse.ArgumentParser(description="Fit per-position archetypes")
+    parser.add_argument("--positions", nargs="+", choices=sorted(FEATURE_SETS))
+    parser.add_argument("--k-min", type=int, default=2)
+    parser.add_argument("--k-max", type=int, default=10)
+    parser.add_argument("--batch-rows", type=int, default=8192)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with DuckDBConnector() as db:
+        engine = ArchetypeEngine(
+            db,
+            ks=range(args.k_min, args.k_max + 1),
+            batch_rows=args.batch_rows,
+            epochs=args.epochs,
+            seed=args.seed,
+        )
+        fits = engine.run(args.positions)
+
+    for position, fit in fits.items():
+        print(f"{position}: k={fit.k} over {fit.n_rows:,} player-seasons")
+        for k, inertia in fit.inertias.items():
+            marker = "  <- elbow" if k == fit.k else ""
+            print(f"   k={k:>2}  inertia={inertia:,.1f}{marker}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
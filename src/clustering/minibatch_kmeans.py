@@ -0,0 +1,94 @@
+"""Mini-batch K-Means and elbow selection in plain numpy.
+
+Centers follow Sculley's mini-batch update: each center moves toward the
+mean of the points assigned to it in a batch with a per-center learning
+rate of (points in batch) / (points seen so far). Models only ever see one
+batch at a time, so the full feature matrix never has to fit in memory.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class MiniBatchKMeans:
+    """K-Means fitted incrementally from a stream of batches."""
+
+    def __init__(self, k: int, seed: int = 0):
+        """Initialize the model.
+
+        Args:
+            k: Number of clusters
+            seed: Seed for the k-means++ initialization
+
+        """
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.centers: Optional[np.ndarray] = None
+        self.counts = np.zeros(k)
+
+    def _init_centers(self, x: np.ndarray) -> None:
+        """Seed centers with k-means++ on the first batch."""
+        if len(x) < self.k:
+            raise ValueError(f"First batch has {len(x)} rows, need at least k={self.k}")
+        centers = [x[self.rng.integers(len(x))]]
+        d2 = ((x - centers[0]) ** 2).sum(axis=1)
+        for _ in range(1, self.k):
+            total = d2.sum()
+            if total > 0:
+                idx = self.rng.choice(len(x), p=d2 / total)
+            else:
+                idx = self.rng.integers(len(x))
+            centers.append(x[idx])
+            d2 = np.minimum(d2, ((x - x[idx]) ** 2).sum(axis=1))
+        self.centers = np.array(centers, dtype=float)
+
+    def assign(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (nearest center index, squared distance to it) per row."""
+        d2 = (
+            (x**2).sum(axis=1)[:, None]
+            - 2 * x @ self.centers.T
+            + (self.centers**2).sum(axis=1)[None, :]
+        )
+        labels = d2.argmin(axis=1)
+        return labels, np.maximum(d2[np.arange(len(x)), labels], 0.0)
+
+    def partial_fit(self, x: np.ndarray) -> "MiniBatchKMeans":
+        """Update the centers with one batch."""
+        if self.centers is None:
+            self._init_centers(x)
+        labels, _ = self.assign(x)
+        n_batch = np.bincount(labels, minlength=self.k).astype(float)
+        sums = np.stack(
+            [
+                np.bincount(labels, weights=x[:, j], minlength=self.k)
+                for j in range(x.shape[1])
+            ],
+            axis=1,
+        )
+        hit = n_batch > 0
+        self.counts += n_batch
+        eta = n_batch[hit] / self.counts[hit]
+        batch_means = sums[hit] / n_batch[hit, None]
+        self.centers[hit] += eta[:, None] * (batch_means - self.centers[hit])
+        return self
+
+    def inertia(self, x: np.ndarray) -> float:
+        """Sum of squared distances from each row to its nearest center."""
+        return float(self.assign(x)[1].sum())
+
+
+def elbow_k(ks: Sequence[int], inertias: Sequence[float]) -> int:
+    """Pick the elbow of an inertia curve.
+
+    Both axes are scaled to [0, 1] and the elbow is the k whose point lies
+    furthest below the straight line joining the first and last points.
+    """
+    ks = np.asarray(ks, dtype=float)
+    y = np.asarray(inertias, dtype=float)
+    if len(ks) < 3 or y[0] == y[-1]:
+        return int(ks[0])
+    x = (ks - ks[0]) / (ks[-1] - ks[0])
+    y = (y - y[-1]) / (y[0] - y[-1])
+    # Line from (0, 1) to (1, 0) is y = 1 - x
+    return int(ks[np.argmax((1 - x) - y)])
@@ -0,0 +1,344 @@
+"""Stage 3: Bayesian % of salary cap model with cached posteriors.
+
+One conjugate Normal-Inverse-Gamma linear regression is fitted per position
+on ``main_bronze.contracts``:
+
+    avg_percent_of_cap ~ Normal(X @ beta, sigma^2)
+    beta | sigma^2     ~ Normal(0, sigma^2 * diag(prior scales^2))
+    sigma^2            ~ InverseGamma(a0, b0)
+
+The posterior is closed-form, so fitting is a few small matrix solves.
+Posterior draws of (beta, sigma) are then stored in an ``.npz`` file keyed
+on a hash of the training data and settings; later runs load the draws
+instead of refitting. Scoring any number of players is a matrix product
+against the draws plus predictive noise, in row blocks, after which the
+median and the credible interval are read off along the draw axis.
+
+Usage:
+    python -m src.financial_model.cap_model --position QB --age 27 --years 4
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.utils.duckdb_connector import DuckDBConnector
+
+logger = logging.getLogger(__name__)
+
+FEATURES: Tuple[str, ...] = ("age_at_signing", "years", "start_year")
+TARGET = "avg_percent_of_cap"
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CapSharePrior:
+    """Normal-Inverse-Gamma prior on standardized features."""
+
+    intercept_scale: float = 10.0
+    coef_scale: float = 1.0
+    a0: float = 2.0
+    b0: float = 0.0025
+
+
+@dataclass
+class PositionPosterior:
+    """Posterior draws for one position's regression."""
+
+    beta: np.ndarray
+    sigma: np.ndarray
+    means: np.ndarray
+    stds: np.ndarray
+    n_obs: int
+
+    def design(self, x: np.ndarray) -> np.ndarray:
+        """Standardize raw features and prepend the intercept column."""
+        z = (x - self.means) / self.stds
+        return np.column_stack([np.ones(len(z)), z])
+
+
+def fit_position(
+    x: np.ndarray,
+    y: np.ndarray,
+    prior: CapSharePrior,
+    n_draws: int,
+    rng: np.random.Generator,
+) -> PositionPosterior:
+    """Fit the conjugate regression for one position and draw from it.
+
+    Args:
+        x: Raw feature matrix, shape (n, p)
+        y: Cap share per contract, shape (n,)
+        prior: Prior settings
+        n_draws: Posterior draws to keep
+        rng: Random generator for the draws
+
+    Returns:
+        Posterior draws with the standardization used
+
+    """
+    means = x.mean(axis=0)
+    stds = x.std(axis=0)
+    stds[stds == 0] = 1.0
+    post = PositionPosterior(np.empty(0), np.empty(0), means, stds, len(y))
+    design = post.design(x)
+
+    p = design.shape[1]
+    prior_precision = np.diag(
+        1.0 / np.r_[prior.intercept_scale, np.full(p - 1, prior.coef_scale)] ** 2
+    )
+    precision = prior_precision + design.T @ design
+    chol = np.linalg.cholesky(precision)
+    mean = np.linalg.solve(precision, design.T @ y)
+
+    a_n = prior.a0 + len(y) / 2
+    b_n = prior.b0 + 0.5 * (y @ y - mean @ precision @ mean)
+    sigma2 = b_n / rng.gamma(a_n, size=n_draws)
+
+    # beta ~ N(mean, sigma^2 * precision^-1) via the Cholesky factor
+    eps = rng.standard_normal((n_draws, p))
+    offsets = np.linalg.solve(chol.T, eps.T).T
+    post.beta = mean + np.sqrt(sigma2)[:, None] * offsets
+    post.sigma = np.sqrt(sigma2)
+    return post
+
+
+class CapShareModel:
+    """Per-position cap-share regressions scored from cached posterior draws."""
+
+    def __init__(
+        self,
+        prior: Optional[CapSharePrior] = None,
+        n_draws: int = 4000,
+        seed: int = 0,
+        features: Tuple[str, ...] = FEATURES,
+    ):
+        """Initialize the model.
+
+        Args:
+            prior: Prior settings shared by every position
+            n_draws: Posterior draws kept per position
+            seed: Seed for posterior and predictive draws
+            features: Contract columns used as predictors
+
+        """
+        self.prior = prior or CapSharePrior()
+        self.n_draws = n_draws
+        self.seed = seed
+        self.features = tuple(features)
+        self.posteriors: Dict[str, PositionPosterior] = {}
+        self.from_cache = False
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+
+    def training_sql(self) -> str:
+        """Return the query selecting complete training rows."""
+        cols = ", ".join(self.features)
+        not_null = " AND ".join(f"{c} IS NOT NULL" for c in (*self.features, TARGET))
+        return (
+            f"SELECT position, {cols}, {TARGET} FROM main_bronze.contracts "
+            f"WHERE {not_null} ORDER BY position, rank"
+        )
+
+    def fit(self, contracts: pd.DataFrame) -> "CapShareModel":
+        """Fit every position present in the training frame."""
+        rng = np.random.default_rng(self.seed)
+        self.posteriors = {}
+        for position, group in contracts.groupby("position", sort=True):
+            x = group[list(self.features)].to_numpy(dtype=float)
+            y = group[TARGET].to_numpy(dtype=float)
+            self.posteriors[position] = fit_position(
+                x, y, self.prior, self.n_draws, rng
+            )
+        self.from_cache = False
+        return self
+
+    def cache_key(self, contracts: pd.DataFrame) -> str:
+        """Hash the training data and every setting that shapes the draws."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(pd.util.hash_pandas_object(contracts, index=False).values.tobytes())
+        settings = {
+            "version": CACHE_VERSION,
+            "prior": asdict(self.prior),
+            "n_draws": self.n_draws,
+            "seed": self.seed,
+            "features": self.features,
+        }
+        h.update(json.dumps(settings, sort_keys=True).encode())
+        return h.hexdigest()
+
+    def load_or_fit(
+        self, db: DuckDBConnector, cache_dir: Optional[Union[str, Path]] = None
+    ) -> "CapShareModel":
+        """Load cached draws for the current contracts, fitting on a miss.
+
+        Args:
+            db: Connector to read training contracts from
+            cache_dir: Where posterior files live. Defaults to
+                warehouse/posteriors next to the database.
+
+        Returns:
+            The model, with ``from_cache`` set when no fit was needed
+
+        """
+        if not db.conn:
+            db.connect()
+        contracts = db.query(self.training_sql())
+        cache_dir = Path(cache_dir or db.db_path.parent / "posteriors")
+        path = cache_dir / f"cap_share_{self.cache_key(contracts)}.npz"
+
+        if path.exists():
+            self.load(path)
+            logger.info(f"Loaded cap-share posteriors from {path}")
+            return self
+
+        self.fit(contracts)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.save(path)
+        logger.info(f"Fitted {len(self.posteriors)} positions, cached to {path}")
+        return self
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write posterior draws and metadata to an ``.npz`` file."""
+        arrays = {}
+        for position, post in self.posteriors.items():
+            arrays[f"{position}__beta"] = post.beta
+            arrays[f"{position}__sigma"] = post.sigma
+            arrays[f"{position}__means"] = post.means
+            arrays[f"{position}__stds"] = post.stds
+        meta = {
+            "features": self.features,
+            "n_obs": {p: post.n_obs for p, post in self.posteriors.items()},
+        }
+        # Write then rename so readers never see a half-written file
+        tmp = Path(path).with_suffix(".tmp.npz")
+        np.savez(tmp, meta=np.array(json.dumps(meta)), **arrays)
+        tmp.replace(path)
+
+    def load(self, path: Union[str, Path]) -> "CapShareModel":
+        """Read posterior draws written by :meth:`save`."""
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            self.features = tuple(meta["features"])
+            self.posteriors = {
+                position: PositionPosterior(
+                    beta=data[f"{position}__beta"],
+                    sigma=data[f"{position}__sigma"],
+                    means=data[f"{position}__means"],
+                    stds=data[f"{position}__stds"],
+                    n_obs=n_obs,
+                )
+                for position, n_obs in meta["n_obs"].items()
+            }
+        self.n_draws = len(next(iter(self.posteriors.values())).sigma)
+        self.from_cache = True
+        return self
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def predict(
+        self,
+        players: pd.DataFrame,
+        interval: float = 0.9,
+        seed: Optional[int] = None,
+        chunk_rows: int = 1024,
+    ) -> pd.DataFrame:
+        """Score players by posterior-predictive sampling.
+
+        Args:
+            players: One row per player with ``position`` and the feature
+                columns
+            interval: Central credible interval width
+            seed: Seed for the predictive noise (default: the model seed)
+            chunk_rows: Players scored per block of draws
+
+        Returns:
+            The input rows with mean, median, lower and upper cap share
+
+        """
+        unknown = set(players["position"]) - set(self.posteriors)
+        if unknown:
+            raise ValueError(f"No fitted posterior for positions: {sorted(unknown)}")
+
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        tail = (1 - interval) / 2
+        quantiles = np.array([tail, 0.5, 1 - tail])
+        stats = np.empty((len(players), 4))
+
+        positions = players["position"].to_numpy()
+        x_all = players[list(self.features)].to_numpy(dtype=float)
+        for position in np.unique(positions):
+            post = self.posteriors[position]
+            matches = np.flatnonzero(positions == position)
+            # Chunk rows so the (rows x draws) block stays small
+            for start in range(0, len(matches), chunk_rows):
+                rows = matches[start : start + chunk_rows]
+                mu = post.design(x_all[rows]) @ post.beta.T
+                draws = mu + post.sigma * rng.standard_normal(mu.shape)
+                np.clip(draws, 0.0, 1.0, out=draws)
+                stats[rows, 0] = draws.mean(axis=1)
+                stats[rows, 1:] = np.quantile(draws, quantiles, axis=1).T[:, [1, 0, 2]]
+
+        out = players.reset_index(drop=True).copy()
+        out["cap_share_mean"] = stats[:, 0]
+        out["cap_share_median"] = stats[:, 1]
+        out["cap_share_lower"] = stats[:, 2]
+        out["cap_share_upper"] = stats[:, 3]
+        return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Answer a what-if cap-share query from the command line."""
+    parser = argparse.ArgumentParser(description="Predict % of cap for a contract")
+    parser.add_argument("--position", required=True)
+    parser.add_argument("--age", type=int, required=True)
+    parser.add_argument("--years", type=int, required=True)
+    parser.add_argument("--start-year", type=int, default=2025)
+    parser.add_argument("--interval", type=float, default=0.9)
+    parser.add_argument("--n-draws", type=int, default=4000)
+    args = parser.parse_args(argv)
+
+    with DuckDBConnector() as db:
+        model = CapShareModel(n_draws=args.n_draws).load_or_fit(db)
+
+    players = pd.DataFrame(
+        {
+            "position": [args.position],
+            "age_at_signing": [args.age],
+            "years": [args.years],
+            "start_year": [args.start_year],
+        }
+    )
+    start = time.perf_counter()
+    row = model.predict(players, interval=args.interval).iloc[0]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    source = "cached posterior" if model.from_cache else "fresh fit"
+    print(
+        f"{args.position}, age {args.age}, {args.years} years from {args.start_year}: "
+        f"median {row.cap_share_median:.2%} of cap, "
+        f"{args.interval:.0%} interval [{row.cap_share_lower:.2%}, "
+        f"{row.cap_share_upper:.2%}]"
+    )
+    print(f"Scored in {elapsed_ms:.1f} ms from {source}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
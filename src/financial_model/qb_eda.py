@@ -1,18 +1,18 @@
 """QB EDA using DuckDB connector."""
 
+import argparse
 from pathlib import Path
+from typing import List, Optional
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 
+from src.reports.catalog import CONTRACTS
+from src.reports.engine import ReportEngine
 from src.utils.duckdb_connector import DuckDBConnector
+from src.utils.figures import FigurePipeline, FigureSpec
 
-# Setup
-plt.style.use("seaborn-v0_8-darkgrid")
-sns.set_palette("husl")
 FIGS_DIR = Path(__file__).parent.parent.parent / "docs" / "figures"
-FIGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def fmt_millions(v: float) -> str:
@@ -20,70 +20,141 @@ def fmt_millions(v: float) -> str:
     return f"${v / 1_000_000:.2f}M"
 
 
-print("=" * 60)
-print("🏈 QB CONTRACT ANALYSIS")
-print("=" * 60)
-
-with DuckDBConnector() as db:
-    # Load data
-    qb_df = db.query("""
-        SELECT player_name, team_signed_with, start_year, years,
-               total_value, average_salary, guarantee_at_signing
-        FROM main_bronze.contracts
-        WHERE position = 'QB' AND total_value IS NOT NULL
-        ORDER BY total_value DESC
-    """)
-
-    print(f"Loaded {len(qb_df):,} QB contracts")
-    print(f"Years: {qb_df['start_year'].min()}-{qb_df['start_year'].max()}")
-
-    # Add guarantee percentage
-    qb_df["guarantee_pct"] = (
-        qb_df["guarantee_at_signing"] / qb_df["total_value"] * 100
-    ).round(1)
-
-    # Basic stats
-    print("\n📊 BASIC STATS")
-    print("-" * 40)
-    print(f"Avg value: {fmt_millions(qb_df['total_value'].mean())}")
-    print(f"Median: {fmt_millions(qb_df['total_value'].median())}")
-    print(f"Max: {fmt_millions(qb_df['total_value'].max())}")
-    print(f"Avg length: {qb_df['years'].mean():.1f} years")
-    print(f"Avg guarantee: {qb_df['guarantee_pct'].mean():.1f}%")
-
-    # Top 10
-    print("\n🏆 TOP 10")
-    print("-" * 60)
-    top10 = qb_df.head(10).copy()
-    top10["total"] = top10["total_value"].apply(fmt_millions)
-    top10["salary"] = top10["average_salary"].apply(fmt_millions)
-    print(
-        top10[
-            [
-                "player_name",
-                "team_signed_with",
-                "start_year",
-                "years",
-                "total",
-                "salary",
-            ]
-        ].to_string(index=False)
+def plot_values_over_time(qb_df: pd.DataFrame) -> None:
+    """Plot average and max QB contract value by signing year."""
+    by_year = qb_df.groupby("start_year")["total_value"].agg(["mean", "max"])
+    plt.plot(by_year.index, by_year["mean"] / 1e6, marker="o", label="Average")
+    plt.plot(by_year.index, by_year["max"] / 1e6, marker="s", label="Max")
+    plt.title("QB Contract Values Over Time", fontsize=16, fontweight="bold")
+    plt.xlabel("Signing Year")
+    plt.ylabel("Total Value ($M)")
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+def plot_length_distribution(qb_df: pd.DataFrame) -> None:
+    """Plot the distribution of QB contract lengths."""
+    counts = qb_df["years"].value_counts().sort_index()
+    plt.bar(counts.index.astype(str), counts.values)
+    plt.title("QB Contract Length Distribution", fontsize=16, fontweight="bold")
+    plt.xlabel("Years")
+    plt.ylabel("Contracts")
+
+
+def plot_guarantee_pie(qb_df: pd.DataFrame) -> None:
+    """Plot guaranteed vs non-guaranteed money across all QB contracts."""
+    guaranteed = qb_df["guarantee_at_signing"].sum()
+    rest = qb_df["total_value"].sum() - guaranteed
+    plt.pie(
+        [guaranteed, max(rest, 0)],
+        labels=["Guaranteed at signing", "Not guaranteed"],
+        autopct="%1.1f%%",
+        startangle=90,
     )
+    plt.title("QB Guaranteed Money Share", fontsize=16, fontweight="bold")
+
+
+def plot_team_spending(qb_df: pd.DataFrame) -> None:
+    """Plot the 15 teams with the most total QB contract value."""
+    spending = (
+        qb_df.groupby("team_signed_with")["total_value"]
+        .sum()
+        .nlargest(15)
+        .sort_values()
+    )
+    plt.barh(spending.index, spending.values / 1e6)
+    plt.title("Top 15 Teams by QB Spending", fontsize=16, fontweight="bold")
+    plt.xlabel("Total Contract Value ($M)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="QB contract report")
+    parser.add_argument(
+        "--draft", action="store_true", help="Render figures at low DPI"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the QB contract report."""
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("🏈 QB CONTRACT ANALYSIS")
+    print("=" * 60)
+
+    with DuckDBConnector() as db, ReportEngine(db) as engine:
+        # Guarantee percentage is a derived column of the contracts report
+        frames = engine.fetch(CONTRACTS, position="QB")
+        qb_df = frames["contracts"]
+
+        print(f"Loaded {len(qb_df):,} QB contracts")
+        print(f"Years: {qb_df['start_year'].min()}-{qb_df['start_year'].max()}")
+
+        # Basic stats
+        print("\n📊 BASIC STATS")
+        print("-" * 40)
+        print(f"Avg value: {fmt_millions(qb_df['total_value'].mean())}")
+        print(f"Median: {fmt_millions(qb_df['total_value'].median())}")
+        print(f"Max: {fmt_millions(qb_df['total_value'].max())}")
+        print(f"Avg length: {qb_df['years'].mean():.1f} years")
+        print(f"Avg guarantee: {qb_df['guarantee_pct'].mean():.1f}%")
+        print(f"Avg APY share of cap: {qb_df['aav_pct_of_cap'].mean():.2f}%")
+
+        # Top 10
+        print("\n🏆 TOP 10")
+        print("-" * 60)
+        top10 = qb_df.head(10).copy()
+        top10["total"] = top10["total_value"].apply(fmt_millions)
+        top10["salary"] = top10["average_salary"].apply(fmt_millions)
+        print(
+            top10[
+                [
+                    "player_name",
+                    "team_signed_with",
+                    "start_year",
+                    "years",
+                    "total",
+                    "salary",
+                ]
+            ].to_string(index=False)
+        )
+
+        # Save summary
+        summary = {
+            "Metric": ["Total", "Avg Value", "Median", "Max", "Avg Length"],
+            "Value": [
+                len(qb_df),
+                fmt_millions(qb_df["total_value"].mean()),
+                fmt_millions(qb_df["total_value"].median()),
+                fmt_millions(qb_df["total_value"].max()),
+                f"{qb_df['years'].mean():.1f} years",
+            ],
+        }
+        pd.DataFrame(summary).to_csv(FIGS_DIR.parent / "qb_summary.csv", index=False)
+        print("\n✅ Summary saved")
+
+    charts = [
+        FigureSpec("qb_values_over_time", qb_df, plot_values_over_time),
+        FigureSpec("qb_length_distribution", qb_df, plot_length_distribution),
+        FigureSpec("qb_guarantee_pie", qb_df, plot_guarantee_pie, figsize=(8, 8)),
+        FigureSpec(
+            "qb_team_spending",
+            qb_df,
+            plot_team_spending,
+            figsize=(12, 8),
+            tight_layout=True,
+        ),
+    ]
+    status = FigurePipeline(FIGS_DIR, draft=args.draft).render(charts)
+    rendered = sum(v == "rendered" for v in status.values())
+    print(f"📁 Figures: {rendered}/{len(status)} rendered")
+
+    print("\n" + "=" * 60)
+    print("✅ Complete")
+    print("=" * 60)
+
 
-    # Save summary
-    summary = {
-        "Metric": ["Total", "Avg Value", "Median", "Max", "Avg Length"],
-        "Value": [
-            len(qb_df),
-            fmt_millions(qb_df["total_value"].mean()),
-            fmt_millions(qb_df["total_value"].median()),
-            fmt_millions(qb_df["total_value"].max()),
-            f"{qb_df['years'].mean():.1f} years",
-        ],
-    }
-    pd.DataFrame(summary).to_csv(FIGS_DIR.parent / "qb_summary.csv", index=False)
-    print("\n✅ Summary saved")
-
-print("\n" + "=" * 60)
-print("✅ Complete")
-print("=" * 60)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Declared report specs run by :mod:`src.reports.engine`."""
+
+from typing import Dict
+
+from src.reports.engine import QuerySpec, ReportSpec
+
+CONTRACT_FILTERS = {"position": "position", "season": "start_year"}
+
+CONTRACTS = ReportSpec(
+    name="contracts",
+    description="Contract values, lengths and guarantees per position/season",
+    queries=(
+        QuerySpec(
+            name="contracts",
+            sql="""
+                SELECT player_name, team_signed_with,
+                       CAST(position AS VARCHAR) AS position, start_year, years,
+                       total_value_cents / 100 AS total_value,
+                       average_salary_cents / 100 AS average_salary,
+                       guarantee_at_signing_cents / 100 AS guarantee_at_signing,
+                       pct_guaranteed_at_signing, aav_pct_of_cap
+                FROM main_silver.fact_contracts
+                {where}
+            """,
+            conditions=("total_value_cents IS NOT NULL",),
+            filters=CONTRACT_FILTERS,
+            derived={"guarantee_pct": "ROUND(pct_guaranteed_at_signing, 1)"},
+            order_by="total_value DESC",
+        ),
+        QuerySpec(
+            name="summary",
+            sql="""
+                SELECT
+                    COUNT(*) AS total,
+                    AVG(total_value_cents) / 100 AS avg_value,
+                    MEDIAN(total_value_cents) / 100 AS median_value,
+                    MAX(total_value_cents) / 100 AS max_value,
+                    AVG(years) AS avg_length,
+                    AVG(pct_guaranteed_at_signing) AS avg_guarantee_pct,
+                    AVG(aav_pct_of_cap) AS avg_aav_pct_of_cap
+                FROM main_silver.fact_contracts
+                {where}
+            """,
+            conditions=("total_value_cents IS NOT NULL",),
+            filters=CONTRACT_FILTERS,
+        ),
+        QuerySpec(
+            name="by_year",
+            sql="""
+                SELECT
+                    start_year,
+                    COUNT(*) AS contracts,
+                    AVG(total_value_cents) / 100 AS avg_value,
+                    MAX(total_value_cents) / 100 AS max_value,
+                    AVG(aav_pct_of_cap) AS avg_aav_pct_of_cap
+                FROM main_silver.fact_contracts
+                {where}
+                GROUP BY start_year
+            """,
+            conditions=("total_value_cents IS NOT NULL",),
+            filters=CONTRACT_FILTERS,
+            order_by="start_year",
+        ),
+    ),
+)
+
+BRONZE_CHECK = ReportSpec(
+    name="bronze_check",
+    description="Row counts and a sample of the bronze contracts table",
+    queries=(
+        QuerySpec(
+            name="overview",
+            sql="""
+                SELECT
+                    COUNT(*) as row_count,
+                    COUNT(DISTINCT position) as unique_positions
+                FROM main_bronze.contracts
+                {where}
+            """,
+        ),
+        QuerySpec(
+            name="sample",
+            sql="""
+                SELECT
+                    rank, player_name, position, team_signed_with,
+                    years, total_value_cents / 100 AS total_value,
+                    average_salary_cents / 100 AS average_salary
+                FROM main_bronze.contracts
+                {where}
+                LIMIT 5
+            """,
+        ),
+    ),
+)
+
+REPORTS: Dict[str, ReportSpec] = {r.name: r for r in (CONTRACTS, BRONZE_CHECK)}
@@ -0,0 +1,344 @@
+"""Report engine for running declared EDA reports against the warehouse.
+
+A report is a :class:`ReportSpec`: a set of named :class:`QuerySpec` queries,
+each with optional position/season filters and derived columns. The engine
+runs every query of every requested (position, season) slice concurrently.
+Each worker thread has its own cursor on one shared DuckDB connection.
+Results come back as DataFrames (:meth:`ReportEngine.fetch`) or are written
+straight to CSV/Parquet by DuckDB's COPY (:meth:`ReportEngine.run`).
+
+Usage:
+    python -m src.reports.engine --report contracts --positions all \
+        --seasons all --format csv parquet
+"""
+
+import argparse
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import duckdb
+import pandas as pd
+
+from src.utils.duckdb_connector import DuckDBConnector
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"csv": "(HEADER, DELIMITER ',')", "parquet": "(FORMAT parquet)"}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """One query of a report.
+
+    ``sql`` must contain a ``{where}`` placeholder. It is replaced by the
+    base ``conditions`` ANDed with whichever ``filters`` are set for the
+    slice being run. ``filters`` maps a filter name ("position" or
+    "season") to the column it restricts. ``derived`` maps new column names
+    to SQL expressions over the query's output columns.
+    """
+
+    name: str
+    sql: str
+    conditions: Tuple[str, ...] = ()
+    filters: Dict[str, str] = field(default_factory=dict)
+    derived: Dict[str, str] = field(default_factory=dict)
+    order_by: Optional[str] = None
+
+    def render(
+        self, position: Optional[str] = None, season: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the SQL and named parameters for one slice."""
+        clauses = list(self.conditions)
+        params: Dict[str, Any] = {}
+        for name, value in (("position", position), ("season", season)):
+            if value is not None and name in self.filters:
+                clauses.append(f"{self.filters[name]} = ${name}")
+                params[name] = value
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = self.sql.format(where=where)
+        if self.derived or self.order_by:
+            extra = "".join(f", {expr} AS {col}" for col, expr in self.derived.items())
+            sql = f"SELECT *{extra} FROM ({sql}) AS q"
+            if self.order_by:
+                sql += f" ORDER BY {self.order_by}"
+        return sql, params
+
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """A named group of queries that make up one report."""
+
+    name: str
+    queries: Tuple[QuerySpec, ...]
+    description: str = ""
+
+    @property
+    def filters(self) -> set:
+        """Filter names any of the report's queries respond to."""
+        return {name for q in self.queries for name in q.filters}
+
+
+@dataclass
+class ReportOutput:
+    """One file written by :meth:`ReportEngine.run`."""
+
+    report: str
+    query: str
+    position: Optional[str]
+    season: Optional[int]
+    path: Path
+    rows: int
+
+
+def _slug(value: Any) -> str:
+    return "all" if value is None else re.sub(r"[^A-Za-z0-9_-]", "_", str(value))
+
+
+class ReportEngine:
+    """Run report specs concurrently on pooled cursors of one connection."""
+
+    def __init__(self, db: DuckDBConnector, max_workers: int = 4):
+        """Initialize the engine.
+
+        Args:
+            db: Connector whose connection every worker cursor is opened from
+            max_workers: Number of queries run at once
+
+        """
+        self.db = db
+        self.max_workers = max_workers
+        self._local = threading.local()
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+        self._lock = threading.Lock()
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            if not self.db.conn:
+                self.db.connect()
+            cursor = self.db.conn.cursor()
+            self._local.cursor = cursor
+            with self._lock:
+                self._cursors.append(cursor)
+        return cursor
+
+    def close(self) -> None:
+        """Close every pooled cursor (the shared connection stays open)."""
+        with self._lock:
+            for cursor in self._cursors:
+                cursor.close()
+            self._cursors.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Slices
+    # ------------------------------------------------------------------
+
+    def available_positions(self) -> List[str]:
+        """Return every position with contract facts."""
+        rows = (
+            self._cursor()
+            .execute(
+                "SELECT DISTINCT CAST(position AS VARCHAR) "
+                "FROM main_silver.fact_contracts ORDER BY 1"
+            )
+            .fetchall()
+        )
+        return [r[0] for r in rows]
+
+    def available_seasons(self) -> List[int]:
+        """Return every contract start year with contract facts."""
+        rows = (
+            self._cursor()
+            .execute(
+                "SELECT DISTINCT start_year FROM main_silver.fact_contracts "
+                "WHERE start_year IS NOT NULL ORDER BY 1"
+            )
+            .fetchall()
+        )
+        return [int(r[0]) for r in rows]
+
+    @staticmethod
+    def slices(
+        report: ReportSpec,
+        positions: Sequence[Optional[str]] = (None,),
+        seasons: Sequence[Optional[int]] = (None,),
+    ) -> List[Tuple[Optional[str], Optional[int]]]:
+        """Return the (position, season) slices a report is run for.
+
+        Filters the report does not declare collapse to a single unfiltered
+        slice, so a report with no filters runs once.
+        """
+        if "position" not in report.filters:
+            positions = (None,)
+        if "season" not in report.filters:
+            seasons = (None,)
+        return [(p, s) for p in positions for s in seasons]
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _fetch_one(
+        self, query: QuerySpec, position: Optional[str], season: Optional[int]
+    ) -> pd.DataFrame:
+        sql, params = query.render(position, season)
+        return self._cursor().execute(sql, params).fetchdf()
+
+    def _copy_one(
+        self,
+        report: ReportSpec,
+        query: QuerySpec,
+        position: Optional[str],
+        season: Optional[int],
+        out_dir: Path,
+        fmt: str,
+    ) -> ReportOutput:
+        sql, params = query.render(position, season)
+        filename = f"{query.name}__position={_slug(position)}__season={_slug(season)}"
+        path = out_dir / report.name / f"{filename}.{fmt}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        literal = str(path).replace("'", "''")
+        rows = (
+            self._cursor()
+            .execute(f"COPY ({sql}) TO '{literal}' {FORMATS[fmt]}", params)
+            .fetchone()[0]
+        )
+        return ReportOutput(report.name, query.name, position, season, path, rows)
+
+    def fetch(
+        self,
+        report: ReportSpec,
+        position: Optional[str] = None,
+        season: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Run all of a report's queries concurrently for one slice.
+
+        Args:
+            report: Report to run
+            position: Position filter, for queries that declare one
+            season: Season filter, for queries that declare one
+
+        Returns:
+            DataFrame per query name
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                q.name: pool.submit(self._fetch_one, q, position, season)
+                for q in report.queries
+            }
+            return {name: f.result() for name, f in futures.items()}
+
+    def run(
+        self,
+        reports: Sequence[ReportSpec],
+        out_dir: Path,
+        positions: Sequence[Optional[str]] = (None,),
+        seasons: Sequence[Optional[int]] = (None,),
+        formats: Sequence[str] = ("csv",),
+    ) -> List[ReportOutput]:
+        """Write every query of every report slice to disk.
+
+        Args:
+            reports: Reports to run
+            out_dir: Root directory; each report gets a subdirectory
+            positions: Positions to slice by (None = all positions pooled)
+            seasons: Seasons to slice by (None = all seasons pooled)
+            formats: Any of "csv" and "parquet"
+
+        Returns:
+            One ReportOutput per file written
+
+        """
+        unknown = set(formats) - set(FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown output formats: {sorted(unknown)}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self._copy_one, report, q, p, s, Path(out_dir), fmt)
+                for report in reports
+                for p, s in self.slices(report, positions, seasons)
+                for q in report.queries
+                for fmt in formats
+            ]
+            outputs = [f.result() for f in futures]
+        logger.info(f"Wrote {len(outputs)} report files to {out_dir}")
+        return outputs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run reports from the command line."""
+    from src.reports.catalog import REPORTS
+
+    parser = argparse.ArgumentParser(description="Generate EDA report summaries")
+    parser.add_argument(
+        "--report",
+        nargs="+",
+        choices=sorted(REPORTS),
+        default=sorted(REPORTS),
+        help="Reports to run (default: all)",
+    )
+    parser.add_argument(
+        "--positions",
+        nargs="*",
+        help="Positions to slice by, or 'all' for every position",
+    )
+    parser.add_argument(
+        "--seasons",
+        nargs="*",
+        help="Seasons to slice by, or 'all' for every season",
+    )
+    parser.add_argument("--format", nargs="+", choices=sorted(FORMATS), default=["csv"])
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "reports",
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--db-path", type=Path)
+    args = parser.parse_args(argv)
+
+    with DuckDBConnector(args.db_path) as db, ReportEngine(db, args.workers) as engine:
+        positions: List[Optional[str]] = [None]
+        if args.positions:
+            positions = (
+                engine.available_positions()
+                if args.positions == ["all"]
+                else args.positions
+            )
+        seasons: List[Optional[int]] = [None]
+        if args.seasons:
+            seasons = (
+                engine.available_seasons()
+                if args.seasons == ["all"]
+                else [int(s) for s in args.seasons]
+            )
+        outputs = engine.run(
+            [REPORTS[name] for name in args.report],
+            args.out_dir,
+            positions,
+            seasons,
+            args.format,
+        )
+
+    print(f"✅ Wrote {len(outputs)} files to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+"""Convergence acceleration for the alternating rating solvers.
+
+Both rating fits (eda/adj.py and eda/adjusted_metric.py) are fixed-point
+iterations: one sweep maps the current (player, opponent) ratings to new
+ones. On poorly connected schedules that map contracts slowly. Two tools
+speed it up:
+
+- Successive over-relaxation: each block update is extrapolated past the
+  plain Gauss-Seidel value, ``x + omega * (update - x)`` with 1 < omega < 2.
+- Anderson acceleration: the next iterate is the combination of the last
+  few sweep outputs whose residuals (output - input) nearly cancel.
+
+Both are optional; omega=1 and memory=0 give the plain iteration back.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+
+def relax(old: np.ndarray, update: np.ndarray, omega: float) -> np.ndarray:
+    """Over- (omega > 1) or under-relax a block update."""
+    if omega == 1.0:
+        return update
+    return old + omega * (update - old)
+
+
+class AndersonAccelerator:
+    """Type-II Anderson mixing for a fixed-point map x -> g(x)."""
+
+    def __init__(self, memory: int = 5, regularization: float = 1e-10):
+        """Initialize the accelerator.
+
+        Args:
+            memory: Number of past residual differences to mix
+            regularization: Ridge term (relative to the residual scale) for
+                the small least-squares solve
+
+        """
+        self.memory = memory
+        self.regularization = regularization
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the history, e.g. after the map itself changed."""
+        self._df: List[np.ndarray] = []
+        self._dg: List[np.ndarray] = []
+        self._last_f: Optional[np.ndarray] = None
+        self._last_g: Optional[np.ndarray] = None
+
+    def update(self, x: np.ndarray, gx: np.ndarray) -> np.ndarray:
+        """Return the next iterate given the input and output of one sweep."""
+        if self.memory <= 0:
+            return gx
+        f = gx - x
+        if self._last_f is not None:
+            self._df.append(f - self._last_f)
+            self._dg.append(gx - self._last_g)
+            if len(self._df) > self.memory:
+                self._df.pop(0)
+                self._dg.pop(0)
+        self._last_f, self._last_g = f, gx
+        if not self._df:
+            return gx
+
+        df = np.column_stack(self._df)
+        gram = df.T @ df
+        ridge = self.regularization * max(np.trace(gram), 1e-300)
+        try:
+            gamma = np.linalg.solve(gram + ridge * np.eye(len(gram)), df.T @ f)
+        except np.linalg.LinAlgError:
+            self.reset()
+            return gx
+        mixed = gx - np.column_stack(self._dg) @ gamma
+        if not np.all(np.isfinite(mixed)):
+            self.reset()
+            return gx
+        return mixed
@@ -5,11 +5,13 @@ Provides easy access to the DuckDB database created by dbt.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import duckdb
 import pandas as pd
 
+from src.utils.fingerprint import cache_version_from
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -103,6 +105,70 @@ class DuckDBConnector:
             sql += f" LIMIT {limit}"
         return self.query(sql)
 
+    def get_contract_facts(
+        self,
+        position: Optional[str] = None,
+        start_year: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Get typed contract facts with precomputed guarantee and cap-share ratios.
+
+        Args:
+            position: Optional position filter
+            start_year: Optional start year filter
+            limit: Optional row limit
+
+        Returns:
+            DataFrame from main_silver.fact_contracts
+
+        """
+        sql = "SELECT * FROM main_silver.fact_contracts WHERE 1 = 1"
+        params = []
+        if position:
+            sql += " AND position = ?"
+            params.append(position)
+        if start_year:
+            sql += " AND start_year = ?"
+            params.append(start_year)
+        if limit:
+            sql += f" LIMIT {limit}"
+        return self.query(sql, params)
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: Optional[Union[List[Any], Dict[str, Any]]] = None,
+        batch_rows: int = 8192,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a query's result as DataFrames of at most ~batch_rows rows.
+
+        Runs on its own cursor, so the connection stays free for writes while
+        the batches are consumed.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters for the query
+            batch_rows: Target rows per batch (rounded to DuckDB's 2048-row
+                vectors)
+
+        Yields:
+            Non-empty DataFrames in result order
+
+        """
+        if not self.conn:
+            self.connect()
+        vectors = max(1, batch_rows // 2048)
+        cursor = self.conn.cursor()
+        try:
+            result = cursor.execute(sql, params) if params else cursor.execute(sql)
+            while True:
+                batch = result.fetch_df_chunk(vectors)
+                if batch.empty:
+                    break
+                yield batch
+        finally:
+            cursor.close()
+
     def get_top_contracts(self, position: str = "QB", n: int = 10) -> pd.DataFrame:
         """Get top N contracts by value for a specific position.
 
@@ -120,12 +186,12 @@ class DuckDBConnector:
             team_signed_with,
             start_year,
             years,
-            total_value,
-            average_salary,
-            guarantee_at_signing
-        FROM main_bronze.contracts
+            total_value_cents / 100 AS total_value,
+            average_salary_cents / 100 AS average_salary,
+            guarantee_at_signing_cents / 100 AS guarantee_at_signing
+        FROM main_silver.fact_contracts
         WHERE position = ?
-            AND total_value IS NOT NULL
+            AND total_value_cents IS NOT NULL
         ORDER BY total_value DESC
         LIMIT ?
         """
@@ -147,9 +213,9 @@ class DuckDBConnector:
             position,
             team_signed_with,
             years,
-            total_value,
-            average_salary
-        FROM main_bronze.contracts
+            total_value_cents / 100 AS total_value,
+            average_salary_cents / 100 AS average_salary
+        FROM main_silver.fact_contracts
         WHERE start_year = ?
         """
         if position:
@@ -161,62 +227,199 @@ class DuckDBConnector:
         sql += " ORDER BY total_value DESC"
         return self.query(sql, params)
 
-    def get_position_summary(self) -> pd.DataFrame:
-        """Get summary statistics by position."""
-        sql = """
+    @staticmethod
+    def _year_range(
+        column: str, start_year_min: Optional[int], start_year_max: Optional[int]
+    ) -> Tuple[str, List[int]]:
+        """Build an inclusive year-range predicate and its parameters."""
+        clause, params = "", []
+        if start_year_min is not None:
+            clause += f" AND {column} >= ?"
+            params.append(start_year_min)
+        if start_year_max is not None:
+            clause += f" AND {column} <= ?"
+            params.append(start_year_max)
+        return clause, params
+
+    def get_position_summary(
+        self,
+        start_year_min: Optional[int] = None,
+        start_year_max: Optional[int] = None,
+        team: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get summary statistics by position.
+
+        Reads the position x year rollup, or the position x team rollup when a
+        team is given. Combining a team with a year range is not rolled up and
+        falls back to scanning the contract facts.
+
+        Args:
+            start_year_min: Optional first signing year (inclusive)
+            start_year_max: Optional last signing year (inclusive)
+            team: Optional team filter
+
+        """
+        years, params = self._year_range("start_year", start_year_min, start_year_max)
+        if team and years:
+            sql = f"""
+            SELECT
+                position,
+                COUNT(*) as contract_count,
+                ROUND(AVG(total_value_cents) / 100, 2) as avg_total_value,
+                ROUND(AVG(average_salary_cents) / 100, 2) as avg_annual_value,
+                ROUND(AVG(years), 1) as avg_length,
+                ROUND(MIN(total_value_cents) / 100, 2) as min_value,
+                ROUND(MAX(total_value_cents) / 100, 2) as max_value,
+                ROUND(AVG(guarantee_at_signing_cents) / 100, 2) as avg_guarantee
+            FROM main_silver.fact_contracts
+            WHERE team_signed_with = ?{years}
+            GROUP BY position
+            ORDER BY avg_total_value DESC
+            """
+            return self.query(sql, [team] + params)
+
+        if team:
+            source, where = "main_gold.position_team_summary", " AND team = ?"
+            params = [team]
+        else:
+            source, where = "main_gold.position_year_summary", years
+        sql = f"""
         SELECT
             position,
-            COUNT(*) as contract_count,
-            ROUND(AVG(total_value), 2) as avg_total_value,
-            ROUND(AVG(average_salary), 2) as avg_annual_value,
-            ROUND(AVG(years), 1) as avg_length,
-            ROUND(MIN(total_value), 2) as min_value,
-            ROUND(MAX(total_value), 2) as max_value,
-            ROUND(AVG(guarantee_at_signing), 2) as avg_guarantee
-        FROM main_bronze.contracts
-        WHERE position IS NOT NULL
-            AND position NOT IN ('', 'Pos')
+            CAST(SUM(contract_count) AS BIGINT) as contract_count,
+            ROUND(SUM(sum_total_value_cents) / SUM(n_total_value) / 100, 2)
+                as avg_total_value,
+            ROUND(SUM(sum_average_salary_cents) / SUM(n_average_salary) / 100, 2)
+                as avg_annual_value,
+            ROUND(SUM(sum_years) / SUM(n_years), 1) as avg_length,
+            ROUND(MIN(min_total_value_cents) / 100, 2) as min_value,
+            ROUND(MAX(max_total_value_cents) / 100, 2) as max_value,
+            ROUND(
+                SUM(sum_guarantee_at_signing_cents) / SUM(n_guarantee_at_signing) / 100,
+                2
+            ) as avg_guarantee
+        FROM {source}
+        WHERE 1 = 1{where}
         GROUP BY position
         ORDER BY avg_total_value DESC
         """
-        return self.query(sql)
+        return self.query(sql, params)
 
-    def get_team_summary(self) -> pd.DataFrame:
-        """Get team spending summary."""
-        sql = """
+    def get_team_summary(
+        self,
+        start_year_min: Optional[int] = None,
+        start_year_max: Optional[int] = None,
+        position: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get team spending summary.
+
+        Reads the position x team rollup, or the team x year rollup when a year
+        range is given. Combining a position with a year range falls back to
+        scanning the contract facts.
+
+        Args:
+            start_year_min: Optional first signing year (inclusive)
+            start_year_max: Optional last signing year (inclusive)
+            position: Optional position filter
+
+        """
+        years, params = self._year_range("start_year", start_year_min, start_year_max)
+        if position and years:
+            sql = f"""
+            SELECT
+                team_signed_with as team,
+                COUNT(*) as total_contracts,
+                ROUND(SUM(total_value_cents) / 100, 2) as total_spent,
+                ROUND(AVG(total_value_cents) / 100, 2) as avg_contract_value,
+                COUNT(DISTINCT position) as positions_signed
+            FROM main_silver.fact_contracts
+            WHERE team_signed_with IS NOT NULL
+                AND position = ?{years}
+            GROUP BY team_signed_with
+            ORDER BY total_spent DESC
+            """
+            return self.query(sql, [position] + params)
+
+        if years:
+            source, where = "main_gold.team_year_summary", years
+            positions_signed = "BIT_COUNT(BIT_OR(position_mask))"
+        else:
+            source = "main_gold.position_team_summary"
+            where, params = (" AND position = ?", [position]) if position else ("", [])
+            positions_signed = "COUNT(DISTINCT position)"
+        sql = f"""
         SELECT
-            team_signed_with as team,
-            COUNT(*) as total_contracts,
-            ROUND(SUM(total_value), 2) as total_spent,
-            ROUND(AVG(total_value), 2) as avg_contract_value,
-            COUNT(DISTINCT position) as positions_signed
-        FROM main_bronze.contracts
-        WHERE team_signed_with IS NOT NULL
-        GROUP BY team_signed_with
+            team,
+            CAST(SUM(contract_count) AS BIGINT) as total_contracts,
+            ROUND(SUM(sum_total_value_cents) / 100, 2) as total_spent,
+            ROUND(SUM(sum_total_value_cents) / SUM(n_total_value) / 100, 2)
+                as avg_contract_value,
+            {positions_signed} as positions_signed
+        FROM {source}
+        WHERE team IS NOT NULL{where}
+        GROUP BY team
         ORDER BY total_spent DESC
         """
-        return self.query(sql)
+        return self.query(sql, params)
+
+    def get_qb_market_trends(
+        self, start_year_min: int = 2010, team: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Get QB market trends over time.
+
+        Reads the position x year rollup. A team filter is not rolled up by
+        year and falls back to scanning the contract facts.
+
+        Args:
+            start_year_min: First signing year to include
+            team: Optional team filter
+
+        """
+        if team:
+            sql = """
+            SELECT
+                start_year,
+                COUNT(*) as num_contracts,
+                ROUND(AVG(total_value_cents) / 100, 2) as avg_total_value,
+                ROUND(AVG(average_salary_cents) / 100, 2) as avg_annual_value,
+                ROUND(AVG(years), 1) as avg_length,
+                ROUND(AVG(avg_percent_of_cap), 4) as avg_cap_percentage,
+                ROUND(AVG(aav_pct_of_cap), 4) as avg_aav_pct_of_cap,
+                ROUND(AVG(pct_guaranteed_at_signing), 2) as avg_pct_guaranteed,
+                ROUND(MAX(total_value_cents) / 100, 2) as max_value,
+                ROUND(MIN(total_value_cents) / 100, 2) as min_value
+            FROM main_silver.fact_contracts
+            WHERE position = 'QB'
+                AND start_year >= ?
+                AND total_value_cents IS NOT NULL
+                AND team_signed_with = ?
+            GROUP BY start_year
+            ORDER BY start_year
+            """
+            return self.query(sql, [start_year_min, team])
 
-    def get_qb_market_trends(self) -> pd.DataFrame:
-        """Get QB market trends over time."""
         sql = """
         SELECT
             start_year,
-            COUNT(*) as num_contracts,
-            ROUND(AVG(total_value), 2) as avg_total_value,
-            ROUND(AVG(average_salary), 2) as avg_annual_value,
-            ROUND(AVG(years), 1) as avg_length,
-            ROUND(AVG(avg_percent_of_cap), 4) as avg_cap_percentage,
-            ROUND(MAX(total_value), 2) as max_value,
-            ROUND(MIN(total_value), 2) as min_value
-        FROM main_bronze.contracts
+            contract_count as num_contracts,
+            ROUND(sum_total_value_cents / n_total_value / 100, 2) as avg_total_value,
+            ROUND(sum_average_salary_cents / n_average_salary / 100, 2)
+                as avg_annual_value,
+            ROUND(sum_years / n_years, 1) as avg_length,
+            ROUND(sum_avg_percent_of_cap / n_avg_percent_of_cap, 4)
+                as avg_cap_percentage,
+            ROUND(sum_aav_pct_of_cap / n_aav_pct_of_cap, 4) as avg_aav_pct_of_cap,
+            ROUND(sum_pct_guaranteed_at_signing / n_pct_guaranteed_at_signing, 2)
+                as avg_pct_guaranteed,
+            ROUND(max_total_value_cents / 100, 2) as max_value,
+            ROUND(min_total_value_cents / 100, 2) as min_value
+        FROM main_gold.position_year_summary
         WHERE position = 'QB'
-            AND start_year >= 2010
-            AND total_value IS NOT NULL
-        GROUP BY start_year
+            AND start_year >= ?
+            AND has_total_value
         ORDER BY start_year
         """
-        return self.query(sql)
+        return self.query(sql, [start_year_min])
 
     def search_players(self, search_term: str) -> pd.DataFrame:
         """Search for players by name."""
@@ -226,14 +429,115 @@ class DuckDBConnector:
             position,
             team_signed_with,
             start_year,
-            total_value,
+            total_value_cents / 100 AS total_value,
             years
-        FROM main_bronze.contracts
+        FROM main_silver.fact_contracts
         WHERE LOWER(player_name) LIKE LOWER(?)
-        ORDER BY total_value DESC
+        ORDER BY total_value_cents DESC
         """
         return self.query(sql, [f"%{search_term}%"])
 
+    def get_top_wr_careers(self, n: int = 15, min_seasons: int = 1) -> pd.DataFrame:
+        """Get the top N WR careers by receiving yards.
+
+        Reads each player's latest-season row of main_gold.wr_careers, which
+        carries the running career totals.
+
+        Args:
+            n: Number of players to return
+            min_seasons: Only include players with at least this many seasons
+
+        """
+        sql = """
+        SELECT
+            player_id,
+            player_name,
+            first_season,
+            season_year as last_season,
+            seasons_played as seasons,
+            career_receiving_yards as career_yards,
+            career_receptions,
+            career_receiving_td,
+            career_targets,
+            career_receiving_yards / seasons_played as avg_per_season
+        FROM main_gold.wr_careers
+        WHERE is_latest_season
+            AND seasons_played >= ?
+        ORDER BY career_yards DESC
+        LIMIT ?
+        """
+        return self.query(sql, [min_seasons, n])
+
+    def get_wr_career(self, player_id: str) -> pd.DataFrame:
+        """Get one WR's season-by-season history with running career totals.
+
+        An indexed point read on main_gold.wr_careers.player_id.
+
+        Args:
+            player_id: Player ID as stored in the bronze WR tables
+
+        """
+        sql = """
+        SELECT *
+        FROM main_gold.wr_careers
+        WHERE player_id = ?
+        ORDER BY season_year
+        """
+        return self.query(sql, [str(player_id)])
+
+    def get_contract_training_set(
+        self,
+        position: Optional[str] = None,
+        max_seasons_since: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Get contracts with their player's stats as of signing.
+
+        Reads main_gold.contract_stats_asof, which carries the latest season
+        before start_year plus trailing 1/2/3-season totals. Contracts with
+        no prior stats have NULL stat columns.
+
+        Args:
+            position: Optional position filter
+            max_seasons_since: Only keep contracts whose latest stats season
+                is at most this many seasons before signing
+
+        """
+        sql = "SELECT * FROM main_gold.contract_stats_asof WHERE 1 = 1"
+        params: List[Any] = []
+        if position:
+            sql += " AND position = ?"
+            params.append(position)
+        if max_seasons_since is not None:
+            sql += " AND seasons_since_stats <= ?"
+            params.append(max_seasons_since)
+        sql += " ORDER BY position, start_year, rank"
+        return self.query(sql, params)
+
+    def get_wr_matchups(
+        self,
+        season_min: Optional[int] = None,
+        season_max: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Get per-(player, defense, season) WR matchup sufficient statistics.
+
+        Reads main_silver.wr_matchups: summed targets (weight) and targets *
+        yards per target (weighted_metric), one row per player per defense
+        per season, ready for the rating solver in eda/adj.py.
+
+        Args:
+            season_min: Optional first season (inclusive)
+            season_max: Optional last season (inclusive)
+
+        """
+        years, params = self._year_range("season_year", season_min, season_max)
+        sql = f"""
+        SELECT *
+        FROM main_silver.wr_matchups
+        WHERE 1 = 1{years}
+        ORDER BY season_year, player_id, defense_id
+        """
+        return self.query(sql, params)
+
     def get_table_info(self) -> pd.DataFrame:
         """Get information about available tables."""
         sql = """
@@ -260,6 +564,17 @@ class DuckDBConnector:
         """
         return self.query(sql, [table_name])
 
+    def get_cache_version(self) -> Optional[str]:
+        """Get a token that changes whenever a model is rebuilt from new inputs.
+
+        Derived from the source fingerprints recorded by
+        ``src.utils.fingerprint``; None if no fingerprinted build has run.
+        Callers can key caches of query results on it.
+        """
+        if not self.conn:
+            self.connect()
+        return cache_version_from(self.conn)
+
     def execute_dbt_model(self, model_name: str) -> None:
         """Execute a dbt model (requires dbt installed).
 
@@ -0,0 +1,324 @@
+"""Feature store between the gold layer and the model stages.
+
+A feature view names an entity key, an event timestamp and numeric feature
+columns on a warehouse table. Materializing a view writes two copies:
+
+- Offline: every (entity, timestamp) row as Parquet, written by DuckDB's
+  COPY. Training sets are built with an ASOF join, so each entity row gets
+  the latest feature values at or before its own timestamp and never sees
+  the future.
+- Online: the latest row per entity as ``.npy`` arrays (sorted keys, a
+  float64 value matrix, timestamps). Serving memory-maps them and finds
+  rows with a binary search, so scoring never re-runs SQL joins.
+
+Layout under the store root (default: warehouse/feature_store)::
+
+    offline/<view>.parquet
+    online/<view>/keys.npy, values.npy, timestamps.npy, meta.json
+
+Usage:
+    python -m src.utils.feature_store materialize
+    python -m src.utils.feature_store lookup 1000 1001
+"""
+
+import argparse
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.utils.duckdb_connector import DuckDBConnector
+from src.utils.sorted_keys import find_keys, sort_keys, swap_directory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeatureView:
+    """Numeric features of one entity over time in a warehouse table."""
+
+    name: str
+    relation: str
+    features: Tuple[str, ...]
+    entity: str = "player_id"
+    timestamp: str = "season_year"
+    where: str = ""
+
+    def source_sql(self) -> str:
+        """Select keys and DOUBLE features, ordered by entity and time."""
+        cols = ", ".join(f"CAST({c} AS DOUBLE) AS {c}" for c in self.features)
+        where = f"WHERE {self.where}" if self.where else ""
+        return (
+            f"SELECT CAST({self.entity} AS VARCHAR) AS {self.entity}, "
+            f"{self.timestamp}, {cols} FROM {self.relation} {where} "
+            f"ORDER BY {self.entity}, {self.timestamp}"
+        )
+
+
+FEATURE_VIEWS: Dict[str, FeatureView] = {
+    "wr_career": FeatureView(
+        name="wr_career",
+        relation="main_gold.wr_careers",
+        features=(
+            "receptions",
+            "receiving_yards",
+            "receiving_td",
+            "targets",
+            "total_points",
+            "seasons_played",
+            "career_receptions",
+            "career_receiving_yards",
+            "career_receiving_td",
+            "career_targets",
+            "career_total_points",
+        ),
+    ),
+    "wr_archetype": FeatureView(
+        name="wr_archetype",
+        relation="main_gold.player_archetypes",
+        features=("archetype", "distance"),
+        where="position = 'WR'",
+    ),
+}
+
+
+def feature_column(view: FeatureView, feature: str) -> str:
+    """Return the output column name for a view's feature."""
+    return f"{view.name}__{feature}"
+
+
+class OnlineStore:
+    """Memory-mapped latest feature values keyed by entity."""
+
+    def __init__(self, root: Union[str, Path]):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding one subdirectory per view
+
+        """
+        self.root = Path(root)
+        self._tables: Dict[str, Tuple[np.ndarray, np.ndarray, dict]] = {}
+
+    def _table(self, view: str) -> Tuple[np.ndarray, np.ndarray, dict]:
+        if view not in self._tables:
+            path = self.root / view
+            if not path.exists():
+                raise FileNotFoundError(f"View '{view}' is not materialized: {path}")
+            keys = np.load(path / "keys.npy", mmap_mode="r")
+            values = np.load(path / "values.npy", mmap_mode="r")
+            meta = json.loads((path / "meta.json").read_text())
+            self._tables[view] = (keys, values, meta)
+        return self._tables[view]
+
+    def reload(self) -> None:
+        """Drop open maps so the next lookup sees a fresh materialization."""
+        self._tables.clear()
+
+    def lookup(self, view: str, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Fetch feature rows for a batch of keys.
+
+        Args:
+            view: Materialized view name
+            keys: Entity keys to look up
+
+        Returns:
+            (values, found): a (len(keys) x features) matrix with NaN rows
+            for unknown keys, and the hit mask
+
+        """
+        stored, values, meta = self._table(view)
+        idx, found = find_keys(stored, keys)
+        out = np.full((len(idx), len(meta["features"])), np.nan)
+        out[found] = values[idx[found]]
+        return out, found
+
+    def features(self, view: str) -> List[str]:
+        """Return a materialized view's feature names in column order."""
+        return list(self._table(view)[2]["features"])
+
+
+class FeatureStore:
+    """Materialize feature views and serve them offline and online."""
+
+    def __init__(
+        self,
+        db: DuckDBConnector,
+        root: Optional[Union[str, Path]] = None,
+        views: Optional[Dict[str, FeatureView]] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            db: Connector to the warehouse holding the source tables
+            root: Store directory. Defaults to warehouse/feature_store
+                next to the database.
+            views: Feature views by name (default: FEATURE_VIEWS)
+
+        """
+        self.db = db
+        self.root = Path(root or db.db_path.parent / "feature_store")
+        self.views = views or FEATURE_VIEWS
+        self.online = OnlineStore(self.root / "online")
+
+    def offline_path(self, view: str) -> Path:
+        """Return where a view's offline Parquet file lives."""
+        return self.root / "offline" / f"{view}.parquet"
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+
+    def _write_online(self, view: FeatureView, latest: pd.DataFrame) -> None:
+        """Write the latest-row arrays, swapping the directory in at the end."""
+        keys, order = sort_keys(latest[view.entity].to_numpy(dtype=str))
+        values = latest[list(view.features)].to_numpy(dtype=np.float64)
+        with swap_directory(self.root / "online" / view.name) as tmp:
+            np.save(tmp / "keys.npy", keys)
+            np.save(tmp / "values.npy", values[order])
+            np.save(
+                tmp / "timestamps.npy",
+                latest[view.timestamp].to_numpy(dtype=np.int64)[order],
+            )
+            (tmp / "meta.json").write_text(
+                json.dumps(
+                    {
+                        "features": list(view.features),
+                        "entity": view.entity,
+                        "timestamp": view.timestamp,
+                        "rows": len(keys),
+                    }
+                )
+            )
+
+    def materialize(self, views: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """Write offline Parquet and online arrays for each view.
+
+        Returns:
+            Offline row count per view
+
+        """
+        if not self.db.conn:
+            self.db.connect()
+        (self.root / "offline").mkdir(parents=True, exist_ok=True)
+        counts = {}
+        for name in views or list(self.views):
+            view = self.views[name]
+            path = self.offline_path(name)
+            counts[name] = self.db.conn.execute(
+                f"COPY ({view.source_sql()}) TO '{path}' (FORMAT parquet)"
+            ).fetchone()[0]
+
+            latest = self.db.query(f"""
+                SELECT * FROM read_parquet('{path}')
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY {view.entity} ORDER BY {view.timestamp} DESC
+                ) = 1
+            """)
+            self._write_online(view, latest)
+            logger.info(
+                f"{name}: {counts[name]:,} offline rows, {len(latest):,} online"
+            )
+        self.online.reload()
+        return counts
+
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
+
+    def get_historical_features(
+        self,
+        entity_df: pd.DataFrame,
+        views: Sequence[str],
+        timestamp: str = "season_year",
+    ) -> pd.DataFrame:
+        """Join point-in-time correct features onto entity rows for training.
+
+        Args:
+            entity_df: Rows with the views' entity key and a timestamp
+            views: Views to join
+            timestamp: Column of entity_df holding each row's as-of time
+
+        Returns:
+            entity_df in its original order plus one column per feature,
+            taken from the latest view row at or before the timestamp
+
+        """
+        if not self.db.conn:
+            self.db.connect()
+        for name in views:
+            if not self.offline_path(name).exists():
+                self.materialize([name])
+
+        select = ["e.* EXCLUDE (__row)"]
+        joins = []
+        for i, name in enumerate(views):
+            view = self.views[name]
+            select += [
+                f'v{i}.{f} AS "{feature_column(view, f)}"' for f in view.features
+            ]
+            joins.append(
+                f"ASOF LEFT JOIN read_parquet('{self.offline_path(name)}') v{i} "
+                f"ON CAST(e.{view.entity} AS VARCHAR) = v{i}.{view.entity} "
+                f"AND e.{timestamp} >= v{i}.{view.timestamp}"
+            )
+
+        rows = entity_df.reset_index(drop=True).assign(__row=np.arange(len(entity_df)))
+        self.db.conn.register("entity_rows", rows)
+        try:
+            return self.db.query(
+                f"SELECT {', '.join(select)} FROM entity_rows e "
+                f"{' '.join(joins)} ORDER BY e.__row"
+            )
+        finally:
+            self.db.conn.unregister("entity_rows")
+
+    def get_online_features(
+        self, keys: Sequence[str], views: Sequence[str]
+    ) -> pd.DataFrame:
+        """Look up the latest features for entities from the online store.
+
+        Args:
+            keys: Entity keys, e.g. player_ids
+            views: Views to read
+
+        Returns:
+            One row per key with one column per feature (NaN if unknown)
+
+        """
+        out = pd.DataFrame({"key": [str(k) for k in keys]})
+        for name in views:
+            values, _ = self.online.lookup(name, keys)
+            view = self.views[name]
+            for j, feature in enumerate(self.online.features(name)):
+                out[feature_column(view, feature)] = values[:, j]
+        return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Materialize views or look up online features from the command line."""
+    parser = argparse.ArgumentParser(description="Feature store maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mat = sub.add_parser("materialize", help="Write offline and online stores")
+    mat.add_argument("--views", nargs="+", choices=sorted(FEATURE_VIEWS))
+    look = sub.add_parser("lookup", help="Read latest features for players")
+    look.add_argument("keys", nargs="+")
+    look.add_argument("--views", nargs="+", default=["wr_career"])
+    args = parser.parse_args(argv)
+
+    with DuckDBConnector() as db:
+        store = FeatureStore(db)
+        if args.command == "materialize":
+            for name, rows in store.materialize(args.views).items():
+                print(f"{name}: {rows:,} rows")
+        else:
+            print(store.get_online_features(args.keys, args.views).T.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
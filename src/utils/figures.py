@@ -0,0 +1,195 @@
+"""Parallel, cached figure rendering for the EDA reports.
+
+Each chart is declared as a :class:`FigureSpec`: an output name, the
+DataFrame it plots and a module-level render function that draws on the
+current pyplot figure. Charts whose inputs are unchanged since the last
+run are skipped; the rest are rendered in a process pool on the Agg
+backend.
+
+A chart's key hashes its DataFrame contents, the render function's source,
+the figure layout and the DPI. Keys are kept in a JSON manifest next to the
+images, so editing either the data or the plotting code forces a re-render.
+Draft renders go to a ``draft/`` subdirectory with a manifest of their own,
+so they never replace the published full-resolution images.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".figures_manifest.json"
+FINAL_DPI = 300
+DRAFT_DPI = 72
+DRAFT_DIR = "draft"
+STYLE = "seaborn-v0_8-darkgrid"
+PALETTE = "husl"
+
+
+@dataclass
+class FigureSpec:
+    """One chart to render.
+
+    ``render`` must be a module-level function (so worker processes can
+    import it) taking the DataFrame and drawing on the current figure.
+    """
+
+    name: str
+    data: pd.DataFrame
+    render: Callable[[pd.DataFrame], None]
+    figsize: Tuple[float, float] = (12, 6)
+    tight_layout: bool = False
+
+    @property
+    def filename(self) -> str:
+        """PNG filename the chart is written to."""
+        return self.name if self.name.endswith(".png") else f"{self.name}.png"
+
+
+def data_hash(df: pd.DataFrame) -> str:
+    """Return a content hash of a DataFrame, including column names and dtypes."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(zip(df.columns, df.dtypes.astype(str)))).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def figure_key(spec: FigureSpec, dpi: int) -> str:
+    """Return the cache key for a chart at a DPI."""
+    try:
+        source = inspect.getsource(spec.render)
+    except (OSError, TypeError):
+        source = f"{spec.render.__module__}.{spec.render.__qualname__}"
+    h = hashlib.blake2b(digest_size=16)
+    layout = repr((spec.figsize, spec.tight_layout))
+    for part in (data_hash(spec.data), source, layout, str(dpi)):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _init_worker(style: str, palette: str) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use(style)
+    sns.set_palette(palette)
+
+
+def _render_one(spec: FigureSpec, path: str, dpi: int) -> str:
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=spec.figsize)
+    try:
+        spec.render(spec.data)
+        if spec.tight_layout:
+            plt.tight_layout()
+        plt.savefig(path, dpi=dpi, bbox_inches="tight")
+    finally:
+        plt.close("all")
+    return path
+
+
+class FigurePipeline:
+    """Render charts into a directory, skipping ones whose inputs are unchanged."""
+
+    def __init__(
+        self,
+        out_dir: Union[str, Path],
+        draft: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            out_dir: Directory the PNGs and the manifest are written to
+            draft: Render at low DPI for quick iteration, into
+                ``out_dir/draft`` instead of ``out_dir``
+            max_workers: Process pool size. Defaults to one per CPU
+
+        """
+        self.out_dir = Path(out_dir) / DRAFT_DIR if draft else Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.dpi = DRAFT_DPI if draft else FINAL_DPI
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.manifest_path = self.out_dir / MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, str]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_path}")
+            return {}
+
+    def render(self, specs: List[FigureSpec]) -> Dict[str, str]:
+        """Render every chart that is missing or stale.
+
+        Args:
+            specs: Charts to render
+
+        Returns:
+            Status per filename: "rendered" or "cached"
+
+        """
+        manifest = self._load_manifest()
+        status: Dict[str, str] = {}
+        todo: List[Tuple[FigureSpec, str]] = []
+        for spec in specs:
+            key = figure_key(spec, self.dpi)
+            path = self.out_dir / spec.filename
+            if manifest.get(spec.filename) == key and path.exists():
+                status[spec.filename] = "cached"
+            else:
+                todo.append((spec, key))
+
+        if todo:
+            workers = min(self.max_workers, len(todo))
+            if workers == 1:
+                # Not worth a pool's startup cost for a single chart
+                _init_worker(STYLE, PALETTE)
+                for spec, _ in todo:
+                    _render_one(spec, str(self.out_dir / spec.filename), self.dpi)
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(STYLE, PALETTE),
+                ) as pool:
+                    futures = [
+                        pool.submit(
+                            _render_one,
+                            spec,
+                            str(self.out_dir / spec.filename),
+                            self.dpi,
+                        )
+                        for spec, _ in todo
+                    ]
+                    for future in futures:
+                        future.result()
+
+            for spec, key in todo:
+                manifest[spec.filename] = key
+                status[spec.filename] = "rendered"
+            self.manifest_path.write_text(
+                json.dumps(manifest, indent=2, sort_keys=True)
+            )
+
+        logger.info(
+            f"Figures: {sum(s == 'rendered' for s in status.values())} rendered, "
+            f"{sum(s == 'cached' for s in status.values())} cached"
+        )
+        return status
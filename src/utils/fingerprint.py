@@ -0,0 +1,342 @@
+"""Source fingerprinting to skip dbt rebuilds when nothing has changed.
+
+Raw input files are fingerprinted by (size, mtime, content digest) and the
+results are stored in the warehouse under ``main_meta``. Each model's
+fingerprint combines its SQL, the shared macros and project config
+(dbt_project.yml, profiles.yml), its raw inputs and the fingerprints of the
+models it refs, so a change anywhere upstream propagates downstream. Only
+models whose fingerprint moved are rebuilt.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Raw files each bronze model reads, as globs relative to the raw data root
+MODEL_SOURCES: Dict[str, List[str]] = {
+    "contracts": ["NFL_Contracts.csv"],
+    "wr_season": ["*/WR_season.csv"],
+    "wr_game": ["*/*/WR.csv"],
+}
+
+# dbt project files that affect how every model builds
+PROJECT_FILES = ["dbt_project.yml", "profiles.yml"]
+
+META_SCHEMA = "main_meta"
+REF_PATTERN = re.compile(r"ref\(\s*['\"](\w+)['\"]\s*\)")
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Fingerprint of one raw input file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the BLAKE2b content digest of a file, read in chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _combine(parts: List[str]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class SourceFingerprinter:
+    """Fingerprint raw sources and dbt models against a warehouse."""
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        raw_root: Optional[Union[str, Path]] = None,
+        dbt_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the fingerprinter.
+
+        Args:
+            db_path: Warehouse DuckDB file. Defaults to warehouse/superbowl.duckdb.
+            raw_root: Raw data root. Defaults to data/raw.
+            dbt_dir: dbt project directory. Defaults to dbt/.
+
+        """
+        self.db_path = Path(db_path or PROJECT_ROOT / "warehouse" / "superbowl.duckdb")
+        self.raw_root = Path(raw_root or PROJECT_ROOT / "data" / "raw")
+        self.dbt_dir = Path(dbt_dir or PROJECT_ROOT / "dbt")
+
+    # ------------------------------------------------------------------
+    # Metadata tables
+    # ------------------------------------------------------------------
+
+    def _ensure_meta(self, conn: duckdb.DuckDBPyConnection) -> None:
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {META_SCHEMA}")
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {META_SCHEMA}.source_fingerprints (
+                path VARCHAR PRIMARY KEY,
+                size BIGINT,
+                mtime_ns BIGINT,
+                digest VARCHAR,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {META_SCHEMA}.model_fingerprints (
+                model VARCHAR PRIMARY KEY,
+                fingerprint VARCHAR,
+                built_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def _load_stored(self) -> tuple:
+        """Return (file fingerprints by path, model fingerprints, built tables).
+
+        Reads without writing: a warehouse that has never been built through
+        the fingerprinter has no meta tables, which counts as nothing stored.
+        """
+        if not self.db_path.exists():
+            return {}, {}, set()
+        with duckdb.connect(str(self.db_path), read_only=True) as conn:
+            tables_by_schema = conn.execute(
+                "SELECT table_schema, table_name FROM information_schema.tables"
+            ).fetchall()
+            meta = {t for schema, t in tables_by_schema if schema == META_SCHEMA}
+            files = {}
+            if "source_fingerprints" in meta:
+                files = {
+                    row[0]: FileFingerprint(*row)
+                    for row in conn.execute(
+                        f"SELECT path, size, mtime_ns, digest "
+                        f"FROM {META_SCHEMA}.source_fingerprints"
+                    ).fetchall()
+                }
+            models = {}
+            if "model_fingerprints" in meta:
+                models = dict(
+                    conn.execute(
+                        f"SELECT model, fingerprint "
+                        f"FROM {META_SCHEMA}.model_fingerprints"
+                    ).fetchall()
+                )
+        tables = {t for schema, t in tables_by_schema if schema != META_SCHEMA}
+        return files, models, tables
+
+    def save(self, files: List[FileFingerprint], models: Dict[str, str]) -> None:
+        """Persist file and model fingerprints after a successful build.
+
+        ``files`` and ``models`` are the complete current sets; rows for raw
+        files or models that no longer exist are removed.
+        """
+        with duckdb.connect(str(self.db_path)) as conn:
+            self._ensure_meta(conn)
+            conn.execute(
+                f"DELETE FROM {META_SCHEMA}.source_fingerprints "
+                "WHERE NOT list_contains(?, path)",
+                [[f.path for f in files]],
+            )
+            conn.execute(
+                f"DELETE FROM {META_SCHEMA}.model_fingerprints "
+                "WHERE NOT list_contains(?, model)",
+                [list(models)],
+            )
+            if files:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {META_SCHEMA}.source_fingerprints "
+                    "(path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                    [(f.path, f.size, f.mtime_ns, f.digest) for f in files],
+                )
+            if models:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {META_SCHEMA}.model_fingerprints "
+                    "(model, fingerprint) VALUES (?, ?)",
+                    list(models.items()),
+                )
+
+    # ------------------------------------------------------------------
+    # Fingerprinting
+    # ------------------------------------------------------------------
+
+    def fingerprint_files(
+        self, patterns: List[str], stored: Dict[str, FileFingerprint]
+    ) -> List[FileFingerprint]:
+        """Fingerprint raw files, re-reading content only when size/mtime moved."""
+        results = []
+        for pattern in patterns:
+            for path in sorted(self.raw_root.glob(pattern)):
+                stat = path.stat()
+                key = str(path.relative_to(self.raw_root))
+                previous = stored.get(key)
+                if (
+                    previous
+                    and previous.size == stat.st_size
+                    and previous.mtime_ns == stat.st_mtime_ns
+                ):
+                    results.append(previous)
+                else:
+                    results.append(
+                        FileFingerprint(
+                            key, stat.st_size, stat.st_mtime_ns, file_digest(path)
+                        )
+                    )
+        return results
+
+    def model_files(self) -> Dict[str, Path]:
+        """Map every dbt model and seed name to its defining file."""
+        files = {p.stem: p for p in (self.dbt_dir / "models").rglob("*.sql")}
+        files.update({p.stem: p for p in (self.dbt_dir / "seeds").glob("*.csv")})
+        return files
+
+    def compute(self) -> tuple:
+        """Compute current fingerprints.
+
+        Returns:
+            (file fingerprints, model fingerprints, stored model fingerprints,
+            tables present in the warehouse)
+
+        """
+        stored_files, stored_models, tables = self._load_stored()
+        files = self.model_files()
+        shared = sorted((self.dbt_dir / "macros").glob("*.sql")) + [
+            p for p in (self.dbt_dir / name for name in PROJECT_FILES) if p.exists()
+        ]
+        shared_digest = _combine([f"{p.name}:{file_digest(p)}" for p in shared])
+
+        all_files: List[FileFingerprint] = []
+        fingerprints: Dict[str, str] = {}
+
+        def visit(model: str) -> str:
+            if model in fingerprints:
+                return fingerprints[model]
+            path = files[model]
+            parts = [model, file_digest(path), shared_digest]
+            if path.suffix == ".sql":
+                for upstream in sorted(set(REF_PATTERN.findall(path.read_text()))):
+                    parts.append(visit(upstream))
+            inputs = self.fingerprint_files(MODEL_SOURCES.get(model, []), stored_files)
+            all_files.extend(inputs)
+            parts.extend(f"{f.path}:{f.digest}" for f in inputs)
+            fingerprints[model] = _combine(parts)
+            return fingerprints[model]
+
+        for model in sorted(files):
+            visit(model)
+        return all_files, fingerprints, stored_models, tables
+
+    def changed_models(self) -> List[str]:
+        """Return models whose inputs or SQL changed since the last build."""
+        _, current, stored, tables = self.compute()
+        return sorted(
+            m for m, fp in current.items() if stored.get(m) != fp or m not in tables
+        )
+
+    # ------------------------------------------------------------------
+    # Incremental build
+    # ------------------------------------------------------------------
+
+    def run(self, full_refresh: bool = False, dry_run: bool = False) -> List[str]:
+        """Build only the changed models with dbt and record their fingerprints.
+
+        Args:
+            full_refresh: Rebuild every model regardless of fingerprints
+            dry_run: Report what would be rebuilt without running dbt
+
+        Returns:
+            Names of the models (and seeds) that were, or would be, rebuilt
+
+        """
+        files, current, stored, tables = self.compute()
+        changed = sorted(
+            m
+            for m, fp in current.items()
+            if full_refresh or stored.get(m) != fp or m not in tables
+        )
+        if not changed:
+            logger.info("All models up to date, nothing to rebuild")
+            return []
+
+        logger.info(f"Rebuilding {len(changed)} changed models: {changed}")
+        if dry_run:
+            return changed
+
+        cmd = [
+            "dbt",
+            "build",
+            "--select",
+            *changed,
+            "--vars",
+            json.dumps({"raw_data_root": str(self.raw_root.resolve())}),
+        ]
+        env = {**os.environ, "NFL_WAREHOUSE_PATH": str(self.db_path.resolve())}
+        result = subprocess.run(
+            cmd, cwd=self.dbt_dir, env=env, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            logger.error(f"dbt build failed: {result.stdout[-2000:]}")
+            raise RuntimeError("dbt build failed, fingerprints not updated")
+
+        self.save(files, current)
+        return changed
+
+
+def cache_version(db_path: Union[str, Path]) -> Optional[str]:
+    """Return a token that changes whenever any model is rebuilt from new inputs.
+
+    Returns None if the warehouse has no fingerprint metadata yet.
+    """
+    with duckdb.connect(str(db_path), read_only=True) as conn:
+        return cache_version_from(conn)
+
+
+def cache_version_from(conn: duckdb.DuckDBPyConnection) -> Optional[str]:
+    """Compute the cache-version token on an open connection."""
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_schema = ? AND table_name = 'model_fingerprints'",
+        [META_SCHEMA],
+    ).fetchone()[0]
+    if not exists:
+        return None
+    rows = conn.execute(
+        f"SELECT model, fingerprint FROM {META_SCHEMA}.model_fingerprints "
+        "ORDER BY model"
+    ).fetchall()
+    if not rows:
+        return None
+    return _combine([f"{m}={fp}" for m, fp in rows])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild only changed dbt models")
+    parser.add_argument("--full-refresh", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--raw-root", type=Path)
+    parser.add_argument("--db-path", type=Path)
+    args = parser.parse_args()
+
+    fingerprinter = SourceFingerprinter(db_path=args.db_path, raw_root=args.raw_root)
+    rebuilt = fingerprinter.run(full_refresh=args.full_refresh, dry_run=args.dry_run)
+    print(f"Rebuilt: {', '.join(rebuilt) if rebuilt else 'nothing'}")
@@ -0,0 +1,136 @@
+"""On-disk artifacts for fitted opponent-adjusted ratings.
+
+A fitted rating model (eda/adj.py) is saved as one directory::
+
+    meta.json                  hyperparameters, data fingerprint, league avg
+    player__key.npy            player IDs, sorted ('U' dtype)
+    player__<column>.npy       per-player arrays aligned with the keys
+    opponent__key.npy          opponent IDs, sorted
+    opponent__<column>.npy     per-opponent arrays
+    component_league_avgs.npy  league average of each connected component
+
+Readers memory-map the arrays, so a scoring process starts without parsing
+anything and every process on the host shares one copy through the page
+cache. Only numpy is needed to score.
+"""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.utils.sorted_keys import find_keys, sort_keys, swap_directory
+
+if TYPE_CHECKING:  # pandas is only needed to write, not to score
+    import pandas as pd
+
+FORMAT_VERSION = 1
+
+
+def write_artifact(
+    path: Union[str, Path],
+    tables: Dict[str, "pd.DataFrame"],
+    arrays: Dict[str, np.ndarray],
+    meta: dict,
+) -> Path:
+    """Write a ratings artifact, swapping the directory in at the end.
+
+    Args:
+        path: Artifact directory (replaced if it exists)
+        tables: Per-entity frames with a "key" column plus numeric columns
+        arrays: Extra model-wide arrays (e.g. component_league_avgs)
+        meta: JSON-serializable metadata
+
+    Returns:
+        The artifact directory
+
+    """
+    columns = {}
+    with swap_directory(path) as tmp:
+        for entity, frame in tables.items():
+            keys, order = sort_keys(frame["key"].to_numpy(dtype=str))
+            np.save(tmp / f"{entity}__key.npy", keys)
+            columns[entity] = [c for c in frame.columns if c != "key"]
+            for column in columns[entity]:
+                np.save(
+                    tmp / f"{entity}__{column}.npy", frame[column].to_numpy()[order]
+                )
+        for name, values in arrays.items():
+            np.save(tmp / f"{name}.npy", np.asarray(values))
+
+        meta = {
+            **meta,
+            "format": FORMAT_VERSION,
+            "columns": columns,
+            "arrays": list(arrays),
+        }
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+    return Path(path)
+
+
+class RatingArtifact:
+    """Memory-mapped view of a saved ratings artifact."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open an artifact; arrays are mapped lazily on first use.
+
+        Args:
+            path: Directory written by :func:`write_artifact`
+
+        """
+        self.path = Path(path)
+        self.meta = json.loads((self.path / "meta.json").read_text())
+        if self.meta.get("format") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported artifact format {self.meta.get('format')} in {path}"
+            )
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def array(self, name: str) -> np.ndarray:
+        """Return a stored array (``<entity>__<column>`` or a model-wide one)."""
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.path / f"{name}.npy", mmap_mode="r")
+        return self._arrays[name]
+
+    def lookup(self, entity: str, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Locate keys in an entity's sorted key array.
+
+        Returns:
+            (positions, found): positions are only meaningful where found
+
+        """
+        return find_keys(self.array(f"{entity}__key"), keys)
+
+    def values(
+        self, entity: str, column: str, keys: Sequence[str], default: float = np.nan
+    ) -> np.ndarray:
+        """Fetch one column for a batch of keys, ``default`` for unknown keys."""
+        idx, found = self.lookup(entity, keys)
+        out = np.full(len(idx), default, dtype=float)
+        out[found] = self.array(f"{entity}__{column}")[idx[found]]
+        return out
+
+    def _baselines(self, player_ids: Sequence[str]) -> np.ndarray:
+        """League average of each player's component (overall if unseen)."""
+        idx, found = self.lookup("player", player_ids)
+        out = np.full(len(idx), self.meta["league_avg"], dtype=float)
+        components = self.array("player__component")[idx[found]]
+        out[found] = self.array("component_league_avgs")[components]
+        return out
+
+    def predict_many(
+        self, player_ids: Sequence[str], opponent_ids: Sequence[str]
+    ) -> np.ndarray:
+        """Predicted metric per matchup; unseen IDs are rated 0."""
+        return (
+            self._baselines(player_ids)
+            + self.values("player", "rating", player_ids, default=0.0)
+            - self.values("opponent", "rating", opponent_ids, default=0.0)
+        )
+
+    def adjusted_metric(self, player_ids: Sequence[str]) -> np.ndarray:
+        """League average plus player rating, per player."""
+        return self._baselines(player_ids) + self.values(
+            "player", "rating", player_ids, default=0.0
+        )
@@ -0,0 +1,58 @@
+"""Sorted-key ``.npy`` tables shared by the feature store and rating artifacts.
+
+Both write string keys sorted in numpy next to row-aligned arrays, swap the
+directory in once it is complete, and find rows by binary search over a
+memory-mapped key array.
+"""
+
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def sort_keys(keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort string keys for :func:`find_keys`.
+
+    Returns:
+        (sorted keys, order): apply ``order`` to every row-aligned array
+
+    """
+    # Sort in numpy so the order matches what searchsorted expects
+    keys = np.asarray(keys, dtype=str)
+    order = np.argsort(keys, kind="stable")
+    return keys[order], order
+
+
+def find_keys(stored: np.ndarray, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Locate keys in a sorted key array.
+
+    Returns:
+        (positions, found): positions are only meaningful where found
+
+    """
+    query = np.asarray([str(k) for k in keys], dtype=str)
+    if len(stored) == 0 or len(query) == 0:
+        return np.zeros(len(query), dtype=np.int64), np.zeros(len(query), bool)
+    idx = np.searchsorted(stored, query)
+    idx[idx == len(stored)] = 0
+    return idx, stored[idx] == query
+
+
+@contextmanager
+def swap_directory(target: Union[str, Path]) -> Iterator[Path]:
+    """Yield a scratch directory that replaces ``target`` on success.
+
+    Readers never see a half-written table: files go to ``<target>.tmp``,
+    which is moved over ``target`` only once the block finishes.
+    """
+    target = Path(target)
+    tmp = target.with_name(f"{target.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    yield tmp
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp, target)
@@ -0,0 +1,240 @@
+"""Stage 2 input: year-by-year snap-share projections over each contract.
+
+Implements the rules in docs/age_curve_README.md. Every contract is one row
+of a (contract x future year) grid, and age, accrued seasons and snap share
+are computed for the whole grid at once with numpy broadcasting:
+
+    age[i, t]      = age_at_signing[i] + t
+    accrued[i, t]  = accrued_at_signing[i] + t
+    curve[i, t]    = age factor * experience bonus * wear * rookie factor
+    snap[i, t]     = clip(base[i] * curve[i, t] / curve[i, 0], 0, 1)
+
+so the projection is anchored on the player's recent usage and shaped by
+the position's curve. Cells past a contract's length are masked out before
+the long-format table is written to main_gold.snap_share_projections.
+
+The warehouse has no snap counts yet, so recent usage is proxied: for WRs
+it is the mean over the three seasons before signing of targets relative
+to that season's 90th-percentile WR workload (a full-time starter), capped
+at 1. Positions without bronze stats start from their curve's baseline.
+
+Usage:
+    python -m src.years_model.age_curve
+"""
+
+import argparse
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils.duckdb_connector import DuckDBConnector
+
+logger = logging.getLogger(__name__)
+
+GOLD_SCHEMA = "main_gold"
+OUTPUT_TABLE = f"{GOLD_SCHEMA}.snap_share_projections"
+
+# Typical age of a first-year player; seasons accrued before the warehouse's
+# history starts are estimated from it.
+ROOKIE_AGE = 22
+LOOKBACK_SEASONS = 3
+
+
+@dataclass(frozen=True)
+class PositionCurve:
+    """Aging rules for one position."""
+
+    peak_start: int
+    peak_end: int
+    decline: float
+    growth: float = 0.03
+    wear: float = 0.0
+    experience_bonus: float = 0.0
+    experience_cap: int = 10
+    rookie_factor: float = 1.0
+    baseline: float = 0.6
+    floor: float = 0.05
+
+
+CURVES: Dict[str, PositionCurve] = {
+    "QB": PositionCurve(
+        peak_start=28,
+        peak_end=35,
+        decline=0.08,
+        experience_bonus=0.01,
+        rookie_factor=0.6,
+        baseline=0.7,
+    ),
+    "RB": PositionCurve(peak_start=24, peak_end=27, decline=0.12, wear=0.05),
+    "WR": PositionCurve(peak_start=25, peak_end=30, decline=0.06),
+    "TE": PositionCurve(peak_start=25, peak_end=30, decline=0.05),
+}
+DEFAULT_CURVE = PositionCurve(peak_start=25, peak_end=30, decline=0.05)
+
+
+def _curve_params(positions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Look up each row's curve parameters as column vectors."""
+    codes, uniques = pd.factorize(positions)
+    curves = [CURVES.get(p, DEFAULT_CURVE) for p in uniques]
+    params = {}
+    for field in PositionCurve.__dataclass_fields__:
+        values = np.array([getattr(c, field) for c in curves], dtype=float)
+        params[field] = values[codes][:, None]
+    return params
+
+
+def curve_factors(
+    positions: np.ndarray, ages: np.ndarray, accrued: np.ndarray
+) -> np.ndarray:
+    """Evaluate the position curves on a (player x year) grid.
+
+    Args:
+        positions: Position code per player, shape (n,)
+        ages: Age per cell, shape (n, h)
+        accrued: Accrued seasons per cell, shape (n, h)
+
+    Returns:
+        Multiplicative usage factor per cell, shape (n, h)
+
+    """
+    p = _curve_params(np.asarray(positions))
+    age_factor = (
+        1.0
+        - p["growth"] * np.maximum(p["peak_start"] - ages, 0)
+        - p["decline"] * np.maximum(ages - p["peak_end"], 0)
+    )
+    experience = 1.0 + p["experience_bonus"] * np.minimum(accrued, p["experience_cap"])
+    wear = (1.0 - p["wear"]) ** accrued
+    rookie = np.where(accrued == 0, p["rookie_factor"], 1.0)
+    return np.maximum(age_factor * experience * wear * rookie, p["floor"])
+
+
+def project(contracts: pd.DataFrame, max_horizon: int = 7) -> pd.DataFrame:
+    """Project snap share for every year of every contract in one pass.
+
+    Args:
+        contracts: One row per contract with player_name, position,
+            team_signed_with, start_year, years, age_at_signing,
+            accrued_seasons and base_snap_share (NaN when unknown)
+        max_horizon: Cap on projected years per contract
+
+    Returns:
+        Long-format projections, one row per contract year
+
+    """
+    n = len(contracts)
+    horizon = int(min(contracts["years"].max(), max_horizon)) if n else 0
+    offsets = np.arange(horizon)
+
+    positions = contracts["position"].to_numpy()
+    ages = contracts["age_at_signing"].to_numpy(dtype=float)[:, None] + offsets
+    accrued = contracts["accrued_seasons"].to_numpy(dtype=float)[:, None] + offsets
+    curve = curve_factors(positions, ages, accrued)
+
+    base = contracts["base_snap_share"].to_numpy(dtype=float)[:, None]
+    baseline = _curve_params(positions)["baseline"]
+    base = np.where(np.isnan(base), baseline * curve[:, :1], base)
+    snap = np.clip(base * curve / curve[:, :1], 0.0, 1.0)
+
+    rows, cols = np.nonzero(offsets < contracts["years"].to_numpy()[:, None])
+    out = contracts.iloc[rows][
+        ["player_name", "position", "team_signed_with", "start_year"]
+    ].reset_index(drop=True)
+    out["contract_year"] = cols + 1
+    out["season_year"] = out["start_year"] + cols
+    out["age"] = ages[rows, cols].astype(int)
+    out["accrued_seasons"] = accrued[rows, cols].astype(int)
+    out["projected_snap_share"] = snap[rows, cols]
+    return out
+
+
+def load_contracts(db: DuckDBConnector) -> pd.DataFrame:
+    """Read contracts with accrued seasons and recent usage in one query."""
+    return db.query(f"""
+        WITH wr_usage AS (
+            SELECT
+                player_name,
+                season_year,
+                LEAST(
+                    targets / QUANTILE_CONT(targets, 0.9)
+                        OVER (PARTITION BY season_year),
+                    1.0
+                ) AS usage
+            FROM main_bronze.wr_season
+            WHERE targets IS NOT NULL
+        )
+        SELECT
+            c.player_name,
+            c.position,
+            c.team_signed_with,
+            c.start_year,
+            c.years,
+            c.age_at_signing,
+            GREATEST(
+                COUNT(DISTINCT u.season_year),
+                c.age_at_signing - {ROOKIE_AGE}
+            ) AS accrued_seasons,
+            AVG(u.usage) FILTER (
+                WHERE u.season_year >= c.start_year - {LOOKBACK_SEASONS}
+            ) AS base_snap_share
+        FROM main_bronze.contracts c
+        LEFT JOIN wr_usage u
+          ON c.position = 'WR'
+         AND u.player_name = c.player_name
+         AND u.season_year < c.start_year
+        WHERE c.age_at_signing IS NOT NULL
+          AND c.start_year IS NOT NULL
+          AND c.years > 0
+        GROUP BY 1, 2, 3, 4, 5, 6
+        ORDER BY c.position, c.player_name, c.start_year
+    """)
+
+
+def write_projections(db: DuckDBConnector, projections: pd.DataFrame) -> int:
+    """Replace main_gold.snap_share_projections with new projections."""
+    db.conn.execute(f"CREATE SCHEMA IF NOT EXISTS {GOLD_SCHEMA}")
+    db.conn.register("new_projections", projections)
+    db.conn.execute(
+        f"CREATE OR REPLACE TABLE {OUTPUT_TABLE} AS SELECT * FROM new_projections"
+    )
+    db.conn.unregister("new_projections")
+    return len(projections)
+
+
+def run(db: DuckDBConnector, max_horizon: int = 7) -> pd.DataFrame:
+    """Project the whole league and write the gold table."""
+    if not db.conn:
+        db.connect()
+    contracts = load_contracts(db)
+    projections = project(contracts, max_horizon=max_horizon)
+    written = write_projections(db, projections)
+    logger.info(f"Projected {len(contracts):,} contracts into {written:,} rows")
+    return projections
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the projection stage from the command line."""
+    parser = argparse.ArgumentParser(description="Project snap share per contract year")
+    parser.add_argument("--max-horizon", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    with DuckDBConnector() as db:
+        projections = run(db, max_horizon=args.max_horizon)
+
+    summary = projections.pivot_table(
+        index="position",
+        columns="contract_year",
+        values="projected_snap_share",
+        aggfunc="mean",
+    )
+    print(f"Wrote {len(projections):,} rows to {OUTPUT_TABLE}")
+    print("Mean projected snap share by contract year:")
+    print(summary.round(3).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
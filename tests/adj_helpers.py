@@ -0,0 +1,48 @@
+"""Shared helpers for the rating model tests (eda/adj.py)."""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root and eda/ to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "eda"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import adj  # noqa: E402  (prints its own progress on import)
+
+
+def quiet(fn, *args, **kwargs):
+    """Call fn with the models' progress output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def make_matchups(n_players=30, n_defenses=8, weeks=6, seed=0):
+    """One game per player per week of season 2023 against a random defense."""
+    rng = np.random.default_rng(seed)
+    skill = rng.normal(0, 0.2, n_players)
+    strength = rng.normal(0, 0.1, n_defenses)
+    matchups = []
+    for week in range(1, weeks + 1):
+        for p in range(n_players):
+            d = int(rng.integers(n_defenses))
+            targets = float(rng.integers(3, 13))
+            metric = 0.1 + skill[p] - strength[d] + rng.normal(0, 1) / targets
+            matchups.append(
+                adj.Matchup(
+                    f"WR{p}",
+                    f"DEF{d}",
+                    f"2023_{week}_{p}",
+                    metric,
+                    targets,
+                    targets,
+                    season_year=2023,
+                    week_number=week,
+                )
+            )
+    return matchups
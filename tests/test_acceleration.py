@@ -0,0 +1,109 @@
+"""Tests for the fixed-point acceleration helpers."""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.acceleration import AndersonAccelerator, relax  # noqa: E402
+
+
+def linear_map(n: int = 50, rate: float = 0.98, seed: int = 0):
+    """A slowly contracting affine map x -> A x + b and its fixed point."""
+    rng = np.random.default_rng(seed)
+    q, _ = np.linalg.qr(rng.normal(size=(n, n)))
+    a = q @ np.diag(np.linspace(0.1, rate, n)) @ q.T
+    b = rng.normal(size=n)
+    return (lambda x: a @ x + b), np.linalg.solve(np.eye(n) - a, b)
+
+
+def iterate(g, accelerator, n=50, tol=1e-8, max_iter=5000):
+    """Return (iterations, final x) for x <- accelerator(x, g(x)) from zero."""
+    x = np.zeros(n)
+    for i in range(max_iter):
+        gx = g(x)
+        if np.abs(gx - x).max() < tol:
+            return i + 1, gx
+        x = accelerator.update(x, gx)
+    return max_iter, x
+
+
+def test_anderson_reaches_fixed_point_in_fewer_sweeps():
+    """Mixing a few past sweeps beats the plain iteration by a wide margin."""
+    g, fixed = linear_map()
+    plain_iters, plain_x = iterate(g, AndersonAccelerator(memory=0))
+    fast_iters, fast_x = iterate(g, AndersonAccelerator(memory=5))
+
+    np.testing.assert_allclose(plain_x, fixed, atol=1e-5)
+    np.testing.assert_allclose(fast_x, fixed, atol=1e-6)
+    assert fast_iters * 5 < plain_iters
+
+
+def test_relax_extrapolates_block_updates():
+    """omega=1 is the plain update; omega>1 moves past it."""
+    old, update = np.zeros(3), np.ones(3)
+    assert relax(old, update, 1.0) is update
+    np.testing.assert_allclose(relax(old, update, 1.5), 1.5)
+
+
+def small_league(seed: int = 0):
+    """Random WR/DEF matchups: (wr, def, observed, weight) arrays."""
+    rng = np.random.default_rng(seed)
+    n_rows, n_wr, n_def = 600, 40, 12
+    wr = rng.integers(0, n_wr, n_rows)
+    de = rng.integers(0, n_def, n_rows)
+    skill, strength = rng.normal(0, 0.2, n_wr), rng.normal(0, 0.1, n_def)
+    weight = rng.integers(3, 13, n_rows).astype(float)
+    observed = 0.1 + skill[wr] - strength[de] + rng.normal(0, 1, n_rows) / weight
+    return wr, de, observed, weight
+
+
+def test_solver_settings_do_not_move_the_ratings():
+    """omega and Anderson only change the speed of both rating solvers."""
+    sys.path.insert(0, str(project_root / "eda"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        import adj
+        from adjusted_metric import fit_adjusted_metric
+
+    wr, de, observed, weight = small_league()
+    matchups = [
+        adj.Matchup(f"WR{p}", f"DEF{d}", str(i), y, w, w)
+        for i, (p, d, y, w) in enumerate(zip(wr, de, observed, weight))
+    ]
+    df = pd.DataFrame(
+        {"wr_id": wr, "def_id": de, "observed": observed, "weight": weight}
+    )
+
+    ratings, devs = [], []
+    for omega, anderson in [(1.0, 0), (1.5, 0), (1.0, 5)]:
+        # A small prior k used to make the plain sweeps diverge
+        model = adj.MutualOpponentModel(adj.WRModel(prior_strength=5))
+        with contextlib.redirect_stdout(io.StringIO()):
+            model.fit(
+                matchups, max_iter=2000, tol=1e-12, omega=omega, anderson=anderson
+            )
+        assert model.converged
+        ratings.append([model.player_ratings[f"WR{p}"] for p in range(40)])
+
+        wr_table, _ = fit_adjusted_metric(
+            df,
+            min_per_game=0,
+            min_targets=0,
+            max_iters=2000,
+            tol=1e-12,
+            omega=omega,
+            anderson=anderson,
+        )
+        devs.append(wr_table.sort_values("wr_id")["wr_dev"].to_numpy())
+
+    for other in ratings[1:]:
+        np.testing.assert_allclose(other, ratings[0], atol=1e-9)
+    for other in devs[1:]:
+        np.testing.assert_allclose(other, devs[0], atol=1e-9)
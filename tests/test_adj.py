@@ -0,0 +1,102 @@
+"""Tests for the opponent-adjusted rating models in eda/adj.py."""
+
+import numpy as np
+import pandas as pd
+from adj_helpers import adj, make_matchups, quiet
+
+
+def test_collapsed_matchups_are_keyed_by_row():
+    """Each (player, defense) row gets its own key, not the defense ID."""
+    stats = pd.DataFrame(
+        {
+            "player_id": ["WR1", "WR2", "WR1"],
+            "defense_id": ["DAL_2023", "DAL_2023", "NYG_2023"],
+            "season_year": [2023, 2023, 2023],
+            "last_week": [5, 9, 12],
+            "weight": [10.0, 4.0, 6.0],
+            "weighted_metric": [80.0, 20.0, 60.0],
+        }
+    )
+    matchups = adj.matchups_from_stats(stats)
+
+    assert [m.game_id for m in matchups] == [
+        "WR1|DAL_2023",
+        "WR2|DAL_2023",
+        "WR1|NYG_2023",
+    ]
+    np.testing.assert_allclose([m.base_metric for m in matchups], [8.0, 5.0, 10.0])
+    assert [m.week_number for m in matchups] == [5, 9, 12]
+
+
+def test_influence_matches_refitting_without_the_matchup():
+    """Leave-one-out influence equals an exact refit without that matchup."""
+    matchups = make_matchups()
+    settings = {"max_iter": 5000, "tol": 1e-13}
+    model = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(model.fit, matchups, **settings)
+    influence = model.influence()
+    players = ["WR0", "WR1", "WR2"]
+    matrix = model.influence_matrix(players)
+
+    for row in [0, 37, len(matchups) - 1]:
+        dropped = matchups[row]
+        refit = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+        quiet(refit.fit, matchups[:row] + matchups[row + 1 :], **settings)
+
+        change = influence.loc[row]
+        assert change["game_id"] == dropped.game_id
+        np.testing.assert_allclose(
+            change["league_avg_change"], refit.league_avg - model.league_avg, atol=1e-10
+        )
+        np.testing.assert_allclose(
+            change["player_rating_change"],
+            refit.player_ratings[dropped.player_id]
+            - model.player_ratings[dropped.player_id],
+            atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            change["opponent_rating_change"],
+            refit.opponent_ratings[dropped.opponent_id]
+            - model.opponent_ratings[dropped.opponent_id],
+            atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            matrix[row],
+            [refit.player_ratings[p] - model.player_ratings[p] for p in players],
+            atol=1e-10,
+        )
+
+
+def test_influence_of_an_only_matchup_matches_refitting_without_it():
+    """Dropping a player's only matchup refits, leaving that player NaN."""
+    matchups = make_matchups()
+    matchups.append(adj.Matchup("ROOKIE", "DEF0", "2023_7_R", 0.9, 4.0, 4.0))
+    row = len(matchups) - 1
+    settings = {"max_iter": 5000, "tol": 1e-13}
+    model = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(model.fit, matchups, **settings)
+    change = model.influence(rows=[0, row])
+    players = ["ROOKIE", "WR0", "WR1"]
+    matrix = model.influence_matrix(players, rows=[row])
+
+    refit = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(refit.fit, matchups[:row], **settings)
+    assert np.isnan(change.loc[row, "player_rating_change"])
+    np.testing.assert_allclose(
+        change.loc[row, "league_avg_change"],
+        refit.league_avg - model.league_avg,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        change.loc[row, "opponent_rating_change"],
+        refit.opponent_ratings["DEF0"] - model.opponent_ratings["DEF0"],
+        atol=1e-10,
+    )
+    assert np.isnan(matrix[0, 0])
+    np.testing.assert_allclose(
+        matrix[0, 1:],
+        [refit.player_ratings[p] - model.player_ratings[p] for p in players[1:]],
+        atol=1e-10,
+    )
+    # The well-connected row next to it still takes the rank-2 update
+    assert change.filter(like="_change").loc[0].notna().all()
@@ -0,0 +1,101 @@
+"""Tests for the week-by-week dynamic ratings in eda/adj_dynamic.py."""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+from adj_helpers import adj, make_matchups, quiet
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from adj_dynamic import DynamicMutualOpponentModel, residual_variance
+
+
+def test_dynamic_single_week_matches_static_ridge_solve():
+    """With drift 0, one week where every player meets one defense is exact."""
+    rng = np.random.default_rng(3)
+    n, sigma2, k, ratio = 6, 0.5, 4.0, 1.5
+    y, w = rng.normal(0.2, 0.5, n), rng.uniform(1.0, 8.0, n)
+    matchups = [
+        adj.Matchup(f"WR{i}", f"DEF{i}", str(i), y[i], w[i], w[i], 2023, 1)
+        for i in range(n)
+    ]
+    model = quiet(
+        DynamicMutualOpponentModel,
+        adj.WRModel(prior_strength=k),
+        opponent_prior_ratio=ratio,
+        drift=0.0,
+        obs_variance=sigma2,
+    )
+    quiet(model.fit, matchups)
+
+    # Joint ridge: minimize sum w (y - mu - p + o)^2 + k p^2 + k_o o^2
+    mu = (w * y).sum() / w.sum()
+    x = np.hstack([np.eye(n), -np.eye(n)])
+    hessian = x.T @ (w[:, None] * x) + np.diag(
+        np.r_[np.full(n, k), np.full(n, k * ratio)]
+    )
+    mean = np.linalg.solve(hessian, x.T @ (w * (y - mu)))
+    variance = sigma2 * np.diag(np.linalg.inv(hessian))
+
+    ids = [f"WR{i}" for i in range(n)], [f"DEF{i}" for i in range(n)]
+    np.testing.assert_allclose(
+        [model.player_ratings[i] for i in ids[0]]
+        + [model.opponent_ratings[i] for i in ids[1]],
+        mean,
+    )
+    np.testing.assert_allclose(
+        [model.player_variances[i] for i in ids[0]]
+        + [model.opponent_variances[i] for i in ids[1]],
+        variance,
+    )
+
+
+def test_dynamic_trajectory_has_one_row_per_week_and_entity_played():
+    """Every (week, entity) that played gets exactly one filtered state."""
+    matchups = make_matchups(n_players=10, n_defenses=6, weeks=5)
+    model = quiet(
+        DynamicMutualOpponentModel, adj.WRModel(prior_strength=10), obs_variance=0.5
+    )
+    quiet(model.fit, matchups)
+
+    played = {(m.week_number, "player", m.player_id) for m in matchups} | {
+        (m.week_number, "opponent", m.opponent_id) for m in matchups
+    }
+    t = model.trajectory
+    states = list(zip(t["week_number"], t["entity"], t["entity_id"]))
+    assert len(states) == len(set(states))
+    assert set(states) == played
+    assert (t["season_year"] == 2023).all()
+
+    last = t.groupby(["entity", "entity_id"]).tail(1)
+    for _, row in last[last["entity"] == "player"].iterrows():
+        assert row["rating"] == model.player_ratings[row["entity_id"]]
+
+
+def test_dynamic_noise_scale_comes_from_residuals():
+    """obs_variance is required; residual_variance estimates it from a fit."""
+    with pytest.raises(ValueError, match="obs_variance"):
+        quiet(DynamicMutualOpponentModel, adj.WRModel(), obs_variance=0.0)
+
+    # Weighted noise has variance sigma^2 / weight with sigma^2 = 0.25
+    rng = np.random.default_rng(4)
+    matchups = [
+        adj.Matchup(m.player_id, m.opponent_id, m.game_id, 0.1, m.volume, m.weight)
+        for m in make_matchups(weeks=20)
+    ]
+    for m in matchups:
+        m.base_metric += rng.normal(0, 0.5 / np.sqrt(m.weight))
+    static = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=200))
+    quiet(static.fit, matchups)
+    assert abs(residual_variance(static) - 0.25) < 0.03
+
+
+def test_dynamic_model_rejects_static_influence():
+    """The inherited leave-one-out methods fail with a clear message."""
+    model = quiet(DynamicMutualOpponentModel, adj.WRModel(), obs_variance=0.25)
+    quiet(model.fit, make_matchups(weeks=2))
+    with pytest.raises(NotImplementedError, match="refit without the matchup"):
+        model.influence()
+    with pytest.raises(NotImplementedError, match="refit without the matchup"):
+        model.influence_matrix(["WR0"])
@@ -0,0 +1,146 @@
+"""Tests for the vectorized schedule-adjusted WR metric (eda/adjusted_metric.py)."""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add eda/ to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "eda"))
+
+from adjusted_metric import fit_adjusted_metric  # noqa: E402
+
+OUTPUT_COLUMNS = [
+    "wr_id",
+    "adjusted_epa_per_target",
+    "wr_dev",
+    "raw_epa_per_target",
+    "targets",
+    "league_avg",
+    "percentile",
+    "num_matchups",
+]
+
+
+@pytest.fixture
+def df_raw():
+    """300 matchups of 20 WRs against 6 defenses; some below 5 targets."""
+    rng = np.random.default_rng(0)
+    n = 300
+    return pd.DataFrame(
+        {
+            "wr_id": rng.integers(0, 20, n),
+            "def_id": [f"D{d}" for d in rng.integers(0, 6, n)],
+            "observed": rng.normal(0.1, 0.5, n),
+            "weight": rng.integers(1, 15, n),
+        }
+    )
+
+
+def per_player_loop(df_raw, min_per_game, prior_w_wr, prior_w_def, max_iters):
+    """The original dict-of-matchups implementation, kept as a reference."""
+    df = df_raw[df_raw["weight"] >= min_per_game].copy()
+    league_avg = (df["observed"] * df["weight"]).sum() / df["weight"].sum()
+    df["obs_adj"] = df["observed"] - league_avg
+
+    wr_matchups, def_matchups = defaultdict(list), defaultdict(list)
+    for _, row in df.iterrows():
+        wr_matchups[row["wr_id"]].append((row["obs_adj"], row["weight"], row["def_id"]))
+        def_matchups[row["def_id"]].append(
+            (row["obs_adj"], row["weight"], row["wr_id"])
+        )
+
+    wr_dev = dict.fromkeys(wr_matchups, 0.0)
+    def_dev = dict.fromkeys(def_matchups, 0.0)
+    for _ in range(max_iters):
+        for wr, games in wr_matchups.items():
+            num = sum(w * (y - def_dev[d]) for y, w, d in games)
+            wr_dev[wr] = num / (sum(w for _, w, _ in games) + prior_w_wr)
+        for d, games in def_matchups.items():
+            num = sum(w * (y - wr_dev[wr]) for y, w, wr in games)
+            def_dev[d] = num / (sum(w for _, w, _ in games) + prior_w_def)
+
+        total = {wr: sum(w for _, w, _ in games) for wr, games in wr_matchups.items()}
+        mean_wr = sum(wr_dev[wr] * t for wr, t in total.items()) / sum(total.values())
+        for wr in wr_dev:
+            wr_dev[wr] -= mean_wr
+        for d in def_dev:
+            def_dev[d] += mean_wr
+    return league_avg, wr_dev, def_dev
+
+
+def test_matches_the_per_player_loop(df_raw):
+    """Same deviations as the loop it replaced, where both solve one system.
+
+    The loop centered WR devs after the DEF update and shifted every DEF
+    by the same amount; the vectorized fit centers before the DEF update.
+    Without DEF shrinkage the two are identical. With it, the loop's DEF
+    devs carry an extra mean * k / (weight + k), so only WR devs are close.
+    """
+    settings = {"min_per_game": 5, "prior_w_wr": 30.0, "max_iters": 200}
+    league_avg, wr_dev, def_dev = per_player_loop(df_raw, prior_w_def=0.0, **settings)
+    wr_table, def_table = fit_adjusted_metric(
+        df_raw, min_targets=0, prior_w_def=0.0, tol=1e-13, **settings
+    )
+
+    fitted = wr_table.set_index("wr_id")
+    np.testing.assert_allclose(fitted["league_avg"], league_avg)
+    np.testing.assert_allclose(
+        fitted.loc[list(wr_dev), "wr_dev"], list(wr_dev.values()), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        def_table.set_index("def_id").loc[list(def_dev), "def_dev"],
+        list(def_dev.values()),
+        atol=1e-12,
+    )
+
+    _, wr_dev, _ = per_player_loop(df_raw, prior_w_def=80.0, **settings)
+    wr_table, _ = fit_adjusted_metric(df_raw, min_targets=0, tol=1e-13, **settings)
+    np.testing.assert_allclose(
+        wr_table.set_index("wr_id").loc[list(wr_dev), "wr_dev"],
+        list(wr_dev.values()),
+        atol=1e-4,
+    )
+
+
+def test_output_has_the_documented_columns(df_raw):
+    """wr_table follows docs/adjusted_metric_README.md, one row per qualified WR."""
+    wr_table, def_table = fit_adjusted_metric(df_raw, min_targets=60)
+
+    assert list(wr_table.columns) == OUTPUT_COLUMNS
+    assert list(def_table.columns) == ["def_id", "def_dev", "weight"]
+    assert wr_table["wr_id"].is_unique
+    assert wr_table["targets"].dtype == np.int64
+    assert wr_table["num_matchups"].dtype == np.int64
+    assert (wr_table["targets"] >= 60).all()
+    assert wr_table["adjusted_epa_per_target"].is_monotonic_decreasing
+    assert wr_table["percentile"].between(0, 100).all()
+    assert wr_table["percentile"].iloc[0] == 100
+
+    qualified = df_raw[df_raw["weight"] >= 5]
+    totals = qualified.groupby("wr_id")["weight"].sum()
+    row = wr_table.iloc[0]
+    games = qualified[qualified["wr_id"] == row["wr_id"]]
+    assert row["targets"] == totals[row["wr_id"]]
+    assert row["num_matchups"] == games["def_id"].nunique()
+    np.testing.assert_allclose(
+        row["raw_epa_per_target"],
+        (games["observed"] * games["weight"]).sum() / games["weight"].sum(),
+    )
+    np.testing.assert_allclose(
+        wr_table["adjusted_epa_per_target"],
+        wr_table["league_avg"] + wr_table["wr_dev"],
+    )
+
+
+def test_fractional_weights_are_not_truncated(df_raw):
+    """Non-integer weights keep their exact totals in the targets column."""
+    df_raw["weight"] = df_raw["weight"] + 0.5
+    wr_table, _ = fit_adjusted_metric(df_raw, min_targets=0)
+    totals = df_raw[df_raw["weight"] >= 5].groupby("wr_id")["weight"].sum()
+    np.testing.assert_allclose(
+        wr_table["targets"], totals.loc[wr_table["wr_id"]].to_numpy()
+    )
@@ -0,0 +1,83 @@
+"""Tests for the Bayesian cap-share model."""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.financial_model.cap_model import CapShareModel  # noqa: E402
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+
+
+def make_contracts(n: int = 400, seed: int = 0) -> pd.DataFrame:
+    """Synthetic contracts where cap share rises with length and falls with age."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "position": rng.choice(["QB", "WR"], n),
+            "age_at_signing": rng.integers(22, 34, n),
+            "years": rng.integers(1, 6, n),
+            "start_year": rng.integers(2018, 2025, n),
+        }
+    )
+    base = np.where(df["position"] == "QB", 0.15, 0.08)
+    df["avg_percent_of_cap"] = (
+        base
+        + 0.01 * (df["years"] - 3)
+        - 0.004 * (df["age_at_signing"] - 28)
+        + rng.normal(0, 0.02, n)
+    )
+    return df
+
+
+def test_posterior_recovers_coefficients():
+    """Posterior mean slopes match the generating process."""
+    df = make_contracts()
+    model = CapShareModel(n_draws=2000).fit(df)
+    post = model.posteriors["QB"]
+    # Back out raw-unit slopes from standardized coefficients
+    slopes = post.beta[:, 1:].mean(axis=0) / post.stds
+    np.testing.assert_allclose(slopes[:2], [-0.004, 0.01], atol=0.001)
+    assert post.sigma.mean() == pytest.approx(0.02, rel=0.2)
+
+
+def test_predict_returns_ordered_intervals():
+    """Every player gets lower <= median <= upper, in input order."""
+    model = CapShareModel(n_draws=500).fit(make_contracts())
+    players = make_contracts(50, seed=1).drop(columns="avg_percent_of_cap")
+    out = model.predict(players, interval=0.8)
+
+    assert len(out) == 50
+    assert (out["position"] == players["position"]).all()
+    assert (out["cap_share_lower"] <= out["cap_share_median"]).all()
+    assert (out["cap_share_median"] <= out["cap_share_upper"]).all()
+
+    with pytest.raises(ValueError):
+        model.predict(players.assign(position="K"))
+
+
+def test_load_or_fit_reuses_cached_draws(tmp_path):
+    """A second run against unchanged contracts loads the saved draws."""
+    db_path = tmp_path / "warehouse" / "test.duckdb"
+    db_path.parent.mkdir()
+    contracts = make_contracts(200).reset_index(names="rank")
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE SCHEMA main_bronze")
+        conn.execute("CREATE TABLE main_bronze.contracts AS SELECT * FROM contracts")
+
+    players = contracts.head(10)
+    with DuckDBConnector(db_path) as db:
+        first = CapShareModel(n_draws=300).load_or_fit(db)
+        second = CapShareModel(n_draws=300).load_or_fit(db)
+        changed = CapShareModel(n_draws=300, seed=1).load_or_fit(db)
+
+    assert not first.from_cache and second.from_cache and not changed.from_cache
+    assert len(list((tmp_path / "warehouse" / "posteriors").glob("*.npz"))) == 2
+    pd.testing.assert_frame_equal(first.predict(players), second.predict(players))
@@ -0,0 +1,100 @@
+"""Tests for mini-batch K-Means and the archetype engine."""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.clustering.archetypes import FEATURE_SETS, ArchetypeEngine  # noqa: E402
+from src.clustering.minibatch_kmeans import MiniBatchKMeans, elbow_k  # noqa: E402
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+
+BLOB_CENTERS = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+
+
+def make_blobs(n_per_blob: int, seed: int = 0) -> np.ndarray:
+    """Three well-separated Gaussian blobs, shuffled."""
+    rng = np.random.default_rng(seed)
+    x = np.concatenate([c + rng.normal(size=(n_per_blob, 2)) for c in BLOB_CENTERS])
+    return rng.permutation(x)
+
+
+def test_minibatch_recovers_blob_centers():
+    """Streaming small batches still finds the true centers."""
+    x = make_blobs(2000)
+    model = MiniBatchKMeans(3, seed=1)
+    for _ in range(3):
+        for batch in np.array_split(x, 30):
+            model.partial_fit(batch)
+
+    found = model.centers[np.lexsort(model.centers.T[::-1])]
+    expected = BLOB_CENTERS[np.lexsort(BLOB_CENTERS.T[::-1])]
+    np.testing.assert_allclose(found, expected, atol=0.2)
+
+
+def test_elbow_picks_true_cluster_count():
+    """The inertia curve of three blobs bends at k=3."""
+    x = make_blobs(500)
+    ks = list(range(1, 8))
+    inertias = []
+    for k in ks:
+        model = MiniBatchKMeans(k, seed=0)
+        for _ in range(5):
+            model.partial_fit(x)
+        inertias.append(model.inertia(x))
+    assert elbow_k(ks, inertias) == 3
+
+
+def test_engine_streams_and_writes_labels(tmp_path):
+    """Every player-season gets a label from the chosen k."""
+    db_path = tmp_path / "warehouse" / "test.duckdb"
+    db_path.parent.mkdir()
+    features = FEATURE_SETS["WR"].features
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE SCHEMA main_bronze")
+        # Two usage profiles: high-volume starters and depth receivers
+        cols = ", ".join(
+            f"CASE WHEN i % 2 = 0 THEN 100 ELSE 5 END + (i % 7) AS {c}"
+            for c in features
+        )
+        conn.execute(f"""
+            CREATE TABLE main_bronze.wr_season AS
+            SELECT CAST(i AS VARCHAR) AS player_id, 2020 + i % 4 AS season_year,
+                   'WR ' || i AS player_name, {cols}
+            FROM range(5000) t(i)
+        """)
+
+    with DuckDBConnector(db_path) as db:
+        engine = ArchetypeEngine(db, ks=range(2, 6), batch_rows=2048, epochs=2)
+        fits = engine.run(["WR"])
+        labels = db.query("SELECT * FROM main_gold.player_archetypes")
+        centroids = db.query("SELECT * FROM main_gold.archetype_centroids")
+
+        # Re-running replaces the position's rows rather than appending
+        engine.run(["WR"])
+        rerun = db.query("SELECT COUNT(*) AS n FROM main_gold.player_archetypes")
+
+    fit = fits["WR"]
+    assert fit.n_rows == 5000
+    assert set(fit.inertias) == {2, 3, 4, 5}
+    assert len(labels) == 5000 and rerun.loc[0, "n"] == 5000
+    assert labels["archetype"].between(0, fit.k - 1).all()
+    assert len(centroids) == fit.k * len(features)
+
+    # Starters and depth receivers never share an archetype
+    starters = labels["player_id"].astype(int) % 2 == 0
+    assert not set(labels.loc[starters, "archetype"]) & set(
+        labels.loc[~starters, "archetype"]
+    )
+
+
+def test_engine_rejects_batches_smaller_than_k():
+    """k-means++ needs at least k rows in the first batch."""
+    with pytest.raises(ValueError):
+        ArchetypeEngine(DuckDBConnector(":memory:"), ks=[2, 10], batch_rows=5)
@@ -0,0 +1,50 @@
+"""Tests for solving disconnected rating components independently."""
+
+import numpy as np
+from adj_helpers import adj, make_matchups, quiet
+
+
+def test_disconnected_schedule_is_solved_per_component():
+    """Two blocks that never meet get separate league averages."""
+    east = make_matchups(n_players=12, n_defenses=4, seed=1)
+    west = [
+        adj.Matchup(
+            m.player_id.replace("WR", "WWR"),
+            m.opponent_id.replace("DEF", "WDEF"),
+            "W" + m.game_id,
+            m.base_metric + 1.0,
+            m.volume,
+            m.weight,
+        )
+        for m in make_matchups(n_players=12, n_defenses=4, seed=2)
+    ]
+    serial = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(serial.fit, east + west, tol=1e-12, max_iter=5000)
+    threaded = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(threaded.fit, east + west, tol=1e-12, max_iter=5000, n_jobs=2)
+
+    assert serial.n_components == 2
+    assert len(set(serial.player_components.values())) == 2
+    c_east = serial.player_components["WR0"]
+    c_west = serial.player_components["WWR0"]
+    assert c_east != c_west
+    assert serial.opponent_components["DEF0"] == c_east
+    for block, c in [(east, c_east), (west, c_west)]:
+        w = np.array([m.weight for m in block])
+        y = np.array([m.base_metric for m in block])
+        np.testing.assert_allclose(
+            serial.component_league_avgs[c], (w * y).sum() / w.sum()
+        )
+    for player, opponent, c in [("WR0", "DEF0", c_east), ("WWR0", "WDEF0", c_west)]:
+        np.testing.assert_allclose(
+            serial.predict(player, opponent),
+            serial.component_league_avgs[c]
+            + serial.player_ratings[player]
+            - serial.opponent_ratings[opponent],
+        )
+
+    assert threaded.player_ratings == serial.player_ratings
+    assert threaded.opponent_ratings == serial.opponent_ratings
+    np.testing.assert_array_equal(
+        threaded.component_league_avgs, serial.component_league_avgs
+    )
@@ -0,0 +1,171 @@
+"""Connector query tests against a small temporary warehouse."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+
+
+@pytest.fixture
+def warehouse():
+    """Build a tiny warehouse with the silver contract facts table."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "warehouse" / "test.duckdb"
+        db_path.parent.mkdir()
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE SCHEMA main_silver")
+        conn.execute("""
+            CREATE TABLE main_silver.fact_contracts AS
+            SELECT * FROM (VALUES
+                (1, 'QB One', 'QB', 'KC', 2020::SMALLINT, 5, 20000, 4000, 10000, 20.0),
+                (2, 'QB Two', 'QB', 'BUF', 2021::SMALLINT, 4, 10000, 2500, 5000, 12.0),
+                (3, 'WR One', 'WR', 'KC', 2021::SMALLINT, 3, 6000, 2000, 3000, 9.0)
+            ) AS t(rank, player_name, position, team_signed_with, start_year,
+                   years, total_value_cents, average_salary_cents,
+                   guarantee_at_signing_cents, aav_pct_of_cap)
+        """)
+        conn.execute("CREATE SCHEMA main_gold")
+        measures = """
+            COUNT(*) AS contract_count,
+            COUNT(total_value_cents) AS n_total_value,
+            SUM(total_value_cents) AS sum_total_value_cents,
+            MIN(total_value_cents) AS min_total_value_cents,
+            MAX(total_value_cents) AS max_total_value_cents,
+            COUNT(average_salary_cents) AS n_average_salary,
+            SUM(average_salary_cents) AS sum_average_salary_cents,
+            COUNT(years) AS n_years,
+            SUM(years) AS sum_years,
+            COUNT(guarantee_at_signing_cents) AS n_guarantee_at_signing,
+            SUM(guarantee_at_signing_cents) AS sum_guarantee_at_signing_cents
+        """
+        conn.execute(f"""
+            CREATE TABLE main_gold.position_year_summary AS
+            SELECT position, start_year,
+                   total_value_cents IS NOT NULL AS has_total_value,
+                   {measures}
+            FROM main_silver.fact_contracts GROUP BY ALL
+        """)
+        conn.execute(f"""
+            CREATE TABLE main_gold.position_team_summary AS
+            SELECT position, team_signed_with AS team, {measures}
+            FROM main_silver.fact_contracts GROUP BY ALL
+        """)
+        conn.close()
+        yield db_path
+
+
+def test_get_contract_facts_filters(warehouse):
+    with DuckDBConnector(warehouse) as db:
+        qbs = db.get_contract_facts(position="QB")
+        assert sorted(qbs["player_name"]) == ["QB One", "QB Two"]
+
+        year_2021 = db.get_contract_facts(start_year=2021)
+        assert len(year_2021) == 2
+
+
+def test_top_contracts_read_silver_facts(warehouse):
+    with DuckDBConnector(warehouse) as db:
+        top = db.get_top_contracts(position="QB", n=1)
+        assert top["player_name"].tolist() == ["QB One"]
+
+
+def test_position_summary_rollup_matches_scan(warehouse):
+    with DuckDBConnector(warehouse) as db:
+        rollup = db.get_position_summary(start_year_min=2021)
+        assert rollup.set_index("position")["contract_count"].to_dict() == {
+            "QB": 1,
+            "WR": 1,
+        }
+
+        by_team = db.get_position_summary(team="KC")
+        assert sorted(by_team["position"]) == ["QB", "WR"]
+
+        # Team plus year range is not rolled up and scans the facts instead
+        scan = db.get_position_summary(start_year_min=2021, team="KC")
+        assert scan["position"].tolist() == ["WR"]
+        assert scan["avg_total_value"].tolist() == [60.0]
+
+
+def test_wr_career_lookups(warehouse):
+    # Two players share a display name; careers are keyed on player_id
+    with duckdb.connect(str(warehouse)) as conn:
+        conn.execute("""
+            CREATE TABLE main_gold.wr_careers AS
+            SELECT * FROM (VALUES
+                ('1', 2021, 'Same Name', 1, 3, 1000, FALSE, 1000),
+                ('1', 2022, 'Same Name', 2, 3, 1200, FALSE, 2200),
+                ('1', 2023, 'Same Name', 3, 3, 900, TRUE, 3100),
+                ('2', 2023, 'Same Name', 1, 1, 1500, TRUE, 1500),
+                ('3', 2022, 'Other Guy', 1, 1, 800, FALSE, 800),
+                ('3', 2023, 'Other Guy', 2, 1, 700, TRUE, 1500)
+            ) AS t(player_id, season_year, player_name, seasons_played,
+                   first_season, receiving_yards, is_latest_season,
+                   career_receiving_yards)
+        """)
+        conn.execute("""
+            ALTER TABLE main_gold.wr_careers ADD COLUMN career_receptions INTEGER;
+            ALTER TABLE main_gold.wr_careers ADD COLUMN career_receiving_td INTEGER;
+            ALTER TABLE main_gold.wr_careers ADD COLUMN career_targets INTEGER;
+        """)
+
+    with DuckDBConnector(warehouse) as db:
+        top = db.get_top_wr_careers(n=2)
+        assert top["player_id"].tolist() == ["1", "2"]
+        assert top["career_yards"].tolist() == [3100, 1500]
+
+        veterans = db.get_top_wr_careers(min_seasons=2)
+        assert veterans["player_id"].tolist() == ["1", "3"]
+
+        history = db.get_wr_career(1)
+        assert history["season_year"].tolist() == [2021, 2022, 2023]
+        assert history["career_receiving_yards"].tolist() == [1000, 2200, 3100]
+
+
+def test_contract_training_set_filters(warehouse):
+    with duckdb.connect(str(warehouse)) as conn:
+        conn.execute("""
+            CREATE TABLE main_gold.contract_stats_asof AS
+            SELECT * FROM (VALUES
+                (1, 'WR One', 'WR', 2021, 2020, 1, 900),
+                (2, 'WR Two', 'WR', 2022, 2018, 4, 700),
+                (3, 'WR New', 'WR', 2020, NULL, NULL, NULL),
+                (4, 'QB One', 'QB', 2020, NULL, NULL, NULL)
+            ) AS t(rank, player_name, position, start_year, stats_season,
+                   seasons_since_stats, receiving_yards_last_1)
+        """)
+
+    with DuckDBConnector(warehouse) as db:
+        wr = db.get_contract_training_set(position="WR")
+        assert wr["rank"].tolist() == [3, 1, 2]
+
+        recent = db.get_contract_training_set(max_seasons_since=1)
+        assert recent["player_name"].tolist() == ["WR One"]
+
+
+def test_wr_matchups_season_range(warehouse):
+    with duckdb.connect(str(warehouse)) as conn:
+        conn.execute("""
+            CREATE TABLE main_silver.wr_matchups AS
+            SELECT * FROM (VALUES
+                ('2', 'KC_2022', 2022, 2, 16.0, 160.0),
+                ('1', 'BUF_2021', 2021, 1, 8.0, 64.0),
+                ('1', 'KC_2022', 2022, 3, 10.0, 90.0)
+            ) AS t(player_id, defense_id, season_year, games, weight,
+                   weighted_metric)
+        """)
+
+    with DuckDBConnector(warehouse) as db:
+        all_rows = db.get_wr_matchups()
+        assert all_rows["player_id"].tolist() == ["1", "1", "2"]
+
+        recent = db.get_wr_matchups(season_min=2022)
+        assert recent["defense_id"].tolist() == ["KC_2022", "KC_2022"]
+        assert recent["games"].sum() == 5
@@ -0,0 +1,33 @@
+"""Tests for convergence reporting in fit() and the hyperparameter search."""
+
+import contextlib
+import io
+
+import pytest
+from adj_helpers import adj, make_matchups, quiet
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from adj_tuning import tune
+
+
+def test_fit_warns_when_max_iter_is_hit():
+    """Stopping at max_iter is flagged on the model and warned about."""
+    model = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=5))
+    with pytest.warns(adj.ConvergenceWarning, match="max_iter=2"):
+        quiet(model.fit, make_matchups(), max_iter=2, tol=1e-12)
+    assert not model.converged
+
+
+def test_tune_flags_candidates_that_did_not_converge():
+    """Non-converged candidates are marked and ranked after converged ones."""
+    matchups = make_matchups(weeks=8)
+    grid = {
+        "prior_strength": [10.0, 50.0],
+        "opponent_prior_ratio": [1.5],
+        "recency_decay": [1.0],
+    }
+    results = quiet(tune, "WR", matchups, grid=grid, n_folds=2)
+    assert results["converged"].all()
+
+    stalled = quiet(tune, "WR", matchups, grid=grid, n_folds=2, solver={"max_iter": 1})
+    assert not stalled["converged"].any()
@@ -0,0 +1,74 @@
+"""Tests for the offline/online feature store."""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+from src.utils.feature_store import FeatureStore, FeatureView  # noqa: E402
+
+VIEWS = {
+    "stats": FeatureView(
+        name="stats", relation="main_gold.stats", features=("yards", "games")
+    )
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store over a tiny gold table: three players, seasons 2020-2022."""
+    db_path = tmp_path / "warehouse" / "test.duckdb"
+    db_path.parent.mkdir()
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE SCHEMA main_gold")
+        # Player p<i> gains 100 * (i + 1) yards per season from 2020
+        conn.execute("""
+            CREATE TABLE main_gold.stats AS
+            SELECT 'p' || i AS player_id, s AS season_year,
+                   100 * (i + 1) * (s - 2019) AS yards, 17 AS games
+            FROM range(3) t(i), range(2020, 2023) u(s)
+        """)
+    with DuckDBConnector(db_path) as db:
+        yield FeatureStore(db, views=VIEWS)
+
+
+def test_historical_features_are_point_in_time(store):
+    """Rows only see feature values from their own season or earlier."""
+    entities = pd.DataFrame(
+        {"player_id": ["p1", "p0", "p1", "p2"], "season_year": [2021, 2025, 2019, 2022]}
+    )
+    out = store.get_historical_features(entities, ["stats"])
+
+    pd.testing.assert_frame_equal(out[["player_id", "season_year"]], entities)
+    # p1 in 2021 sees 2021; p0 in 2025 sees its last season; 2019 is too early
+    assert out["stats__yards"].tolist()[:2] == [400.0, 300.0]
+    assert np.isnan(out.loc[2, "stats__yards"])
+    assert out.loc[3, "stats__yards"] == 900.0
+
+
+def test_online_lookup_serves_latest_rows(store):
+    """Online lookups return each player's newest season, NaN for misses."""
+    store.materialize()
+    out = store.get_online_features(["p2", "missing", "p0"], ["stats"])
+
+    assert out["key"].tolist() == ["p2", "missing", "p0"]
+    assert out.loc[0, "stats__yards"] == 900.0
+    assert out.loc[2, "stats__yards"] == 300.0
+    assert out.loc[1, ["stats__yards", "stats__games"]].isna().all()
+
+    values, found = store.online.lookup("stats", ["p1"])
+    assert found.tolist() == [True] and values.tolist() == [[600.0, 17.0]]
+
+
+def test_online_lookup_requires_materialization(store):
+    """Serving never falls back to SQL."""
+    with pytest.raises(FileNotFoundError):
+        store.get_online_features(["p0"], ["stats"])
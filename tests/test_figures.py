@@ -0,0 +1,78 @@
+"""Tests for the cached figure pipeline."""
+
+import json
+import sys
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.figures import (  # noqa: E402
+    DRAFT_DIR,
+    DRAFT_DPI,
+    MANIFEST_NAME,
+    FigurePipeline,
+    FigureSpec,
+    data_hash,
+)
+
+
+def plot_line(df: pd.DataFrame) -> None:
+    """Plot y against x."""
+    plt.plot(df["x"], df["y"])
+
+
+def make_specs(offset: int = 0):
+    """Two independent charts; ``offset`` only changes the second one."""
+    a = pd.DataFrame({"x": [1, 2, 3], "y": [1, 4, 9]})
+    b = pd.DataFrame({"x": [1, 2, 3], "y": [2 + offset, 3, 5]})
+    return [FigureSpec("a", a, plot_line), FigureSpec("b", b, plot_line)]
+
+
+def test_data_hash_tracks_values_and_columns():
+    """Equal frames hash equally; changing a value or a name changes it."""
+    df = pd.DataFrame({"x": [1, 2], "y": [3.0, 4.0]})
+    assert data_hash(df) == data_hash(df.copy())
+    assert data_hash(df) != data_hash(df.assign(y=[3.0, 5.0]))
+    assert data_hash(df) != data_hash(df.rename(columns={"y": "z"}))
+
+
+def test_unchanged_charts_are_skipped(tmp_path):
+    """Only the chart whose data changed is re-rendered."""
+    pipeline = FigurePipeline(tmp_path, max_workers=2)
+
+    assert pipeline.render(make_specs()) == {"a.png": "rendered", "b.png": "rendered"}
+    assert (tmp_path / "a.png").exists() and (tmp_path / "b.png").exists()
+
+    assert pipeline.render(make_specs()) == {"a.png": "cached", "b.png": "cached"}
+    assert pipeline.render(make_specs(offset=1)) == {
+        "a.png": "cached",
+        "b.png": "rendered",
+    }
+
+    # A deleted image is re-rendered even though the manifest knows its key
+    (tmp_path / "a.png").unlink()
+    assert pipeline.render(make_specs(offset=1))["a.png"] == "rendered"
+
+
+def test_draft_mode_renders_separately_from_final(tmp_path):
+    """Draft renders go to their own directory and leave final images alone."""
+    FigurePipeline(tmp_path).render(make_specs())
+    final_bytes = (tmp_path / "a.png").read_bytes()
+    final_manifest = (tmp_path / MANIFEST_NAME).read_text()
+
+    draft = FigurePipeline(tmp_path, draft=True)
+    assert draft.dpi == DRAFT_DPI
+    assert draft.out_dir == tmp_path / DRAFT_DIR
+    assert set(draft.render(make_specs()).values()) == {"rendered"}
+    assert (tmp_path / DRAFT_DIR / "a.png").stat().st_size < len(final_bytes)
+    assert json.loads((tmp_path / DRAFT_DIR / MANIFEST_NAME).read_text())
+
+    # The final render and its cache are untouched
+    assert (tmp_path / "a.png").read_bytes() == final_bytes
+    assert (tmp_path / MANIFEST_NAME).read_text() == final_manifest
+    assert set(FigurePipeline(tmp_path).render(make_specs()).values()) == {"cached"}
@@ -0,0 +1,125 @@
+"""Tests for source fingerprinting and change detection."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import fingerprint  # noqa: E402
+from src.utils.fingerprint import SourceFingerprinter, cache_version  # noqa: E402
+
+
+@pytest.fixture
+def project():
+    """A minimal raw tree and dbt project with a bronze and a silver model."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        raw = root / "raw"
+        raw.mkdir()
+        (raw / "NFL_Contracts.csv").write_text("title\nRank,Player\n1,A\n")
+
+        models = root / "dbt" / "models"
+        (models / "bronze").mkdir(parents=True)
+        (models / "silver").mkdir()
+        (root / "dbt" / "macros").mkdir()
+        (models / "bronze" / "contracts.sql").write_text("SELECT 1")
+        (models / "silver" / "fact_contracts.sql").write_text(
+            "SELECT * FROM {{ ref('contracts') }}"
+        )
+        yield (
+            SourceFingerprinter(
+                db_path=root / "test.duckdb", raw_root=raw, dbt_dir=root / "dbt"
+            ),
+            raw,
+            models,
+        )
+
+
+def record_build(fingerprinter):
+    """Stand in for a dbt build: create the tables and store fingerprints."""
+    files, models, _, _ = fingerprinter.compute()
+    with duckdb.connect(str(fingerprinter.db_path)) as conn:
+        for model in models:
+            conn.execute(f"CREATE OR REPLACE TABLE {model} AS SELECT 1 AS x")
+    fingerprinter.save(files, models)
+
+
+def test_everything_changed_before_first_build(project):
+    fingerprinter, _, _ = project
+    assert fingerprinter.changed_models() == ["contracts", "fact_contracts"]
+    assert fingerprinter.run(dry_run=True) == ["contracts", "fact_contracts"]
+
+
+def test_unchanged_inputs_are_skipped(project):
+    fingerprinter, raw, _ = project
+    record_build(fingerprinter)
+    assert fingerprinter.changed_models() == []
+    version = cache_version(fingerprinter.db_path)
+    assert version is not None
+
+    # Raw content change propagates downstream
+    (raw / "NFL_Contracts.csv").write_text("title\nRank,Player\n1,B\n")
+    assert fingerprinter.changed_models() == ["contracts", "fact_contracts"]
+    record_build(fingerprinter)
+    assert cache_version(fingerprinter.db_path) != version
+
+
+def test_sql_change_only_rebuilds_that_model(project):
+    fingerprinter, _, models = project
+    record_build(fingerprinter)
+    (models / "silver" / "fact_contracts.sql").write_text(
+        "SELECT 2 FROM {{ ref('contracts') }}"
+    )
+    assert fingerprinter.changed_models() == ["fact_contracts"]
+
+
+def test_dropped_table_is_rebuilt(project):
+    fingerprinter, _, _ = project
+    record_build(fingerprinter)
+    with duckdb.connect(str(fingerprinter.db_path)) as conn:
+        conn.execute("DROP TABLE fact_contracts")
+    assert fingerprinter.changed_models() == ["fact_contracts"]
+
+
+def test_dry_run_does_not_write_to_the_warehouse(project):
+    fingerprinter, _, _ = project
+    with duckdb.connect(str(fingerprinter.db_path)) as conn:
+        conn.execute("CREATE TABLE contracts AS SELECT 1 AS x")
+    assert fingerprinter.run(dry_run=True) == ["contracts", "fact_contracts"]
+    with duckdb.connect(str(fingerprinter.db_path), read_only=True) as conn:
+        schemas = conn.execute(
+            "SELECT schema_name FROM information_schema.schemata"
+        ).fetchall()
+    assert ("main_meta",) not in schemas
+
+
+@pytest.mark.parametrize("name", ["dbt_project.yml", "profiles.yml"])
+def test_project_config_change_rebuilds_everything(project, name):
+    fingerprinter, _, models = project
+    config = models.parent / name
+    config.write_text("name: nfl\n")
+    record_build(fingerprinter)
+    assert fingerprinter.changed_models() == []
+    config.write_text("name: nfl\nvars: {season: 2024}\n")
+    assert fingerprinter.changed_models() == ["contracts", "fact_contracts"]
+
+
+def test_deleted_raw_files_are_pruned(project, monkeypatch):
+    fingerprinter, raw, _ = project
+    monkeypatch.setitem(fingerprint.MODEL_SOURCES, "contracts", ["NFL_Contracts*.csv"])
+    (raw / "NFL_Contracts_2024.csv").write_text("title\nRank,Player\n1,C\n")
+    record_build(fingerprinter)
+    (raw / "NFL_Contracts_2024.csv").unlink()
+    record_build(fingerprinter)
+
+    with duckdb.connect(str(fingerprinter.db_path), read_only=True) as conn:
+        paths = conn.execute(
+            "SELECT path FROM main_meta.source_fingerprints"
+        ).fetchall()
+    assert paths == [("NFL_Contracts.csv",)]
@@ -0,0 +1,80 @@
+"""Tests for saving, loading and publishing fitted rating models."""
+
+import json
+
+import duckdb
+import numpy as np
+import pytest
+from adj_helpers import adj, make_matchups, quiet
+
+
+def test_saved_model_round_trips(tmp_path):
+    """save -> load restores the subclass, its settings and its scores."""
+    model = quiet(
+        adj.EnhancedMutualOpponentModel,
+        adj.WRModel(prior_strength=30),
+        recency_decay=0.9,
+        quality_weight=False,
+        opponent_prior_ratio=2.0,
+    )
+    quiet(model.fit_with_quality_weighting, make_matchups(), tol=1e-10)
+    quiet(model.save, tmp_path / "wr")
+    loaded = quiet(adj.MutualOpponentModel.load, tmp_path / "wr")
+
+    assert type(loaded) is adj.EnhancedMutualOpponentModel
+    assert isinstance(loaded.position, adj.WRModel)
+    assert loaded.position.prior_strength == 30
+    assert loaded._hyperparameters() == model._hyperparameters()
+    assert loaded.fingerprint == model.fingerprint
+    assert loaded.converged and loaded.n_iter == model.n_iter
+
+    players = ["WR0", "WR5", "new"]
+    opponents = ["DEF1", "new", "DEF3"]
+    np.testing.assert_array_equal(
+        loaded.predict_many(players, opponents), model.predict_many(players, opponents)
+    )
+    assert loaded.player_components == model.player_components
+
+    rows = quiet(model.write_table, tmp_path / "ratings.duckdb")
+    assert rows == len(model.player_ratings) + len(model.opponent_ratings)
+    with duckdb.connect(str(tmp_path / "ratings.duckdb"), read_only=True) as conn:
+        table = conn.execute(
+            "SELECT entity_id, rating, fingerprint FROM main_gold.wr_adjusted_ratings"
+            " WHERE entity = 'player'"
+        ).df()
+    assert dict(zip(table["entity_id"], table["rating"])) == model.player_ratings
+    assert set(table["fingerprint"]) == {model.fingerprint}
+
+
+class SlotWRModel(adj.WRModel):
+    """Position model two levels down whose settings are not prior_strength."""
+
+    def __init__(self, slot_share=0.5):
+        super().__init__(prior_strength=40 / slot_share)
+        self.slot_share = slot_share
+
+    def get_settings(self):
+        return {"slot_share": self.slot_share}
+
+
+class TunedModel(adj.EnhancedMutualOpponentModel):
+    """Rating model two levels below MutualOpponentModel."""
+
+
+def test_load_finds_indirect_subclasses(tmp_path):
+    """Models and positions deeper than one level round-trip their settings."""
+    model = quiet(TunedModel, SlotWRModel(slot_share=0.25), recency_decay=0.8)
+    quiet(model.fit, make_matchups(weeks=2))
+    quiet(model.save, tmp_path / "tuned")
+    loaded = quiet(adj.MutualOpponentModel.load, tmp_path / "tuned")
+
+    assert type(loaded) is TunedModel and loaded.recency_decay == 0.8
+    assert type(loaded.position) is SlotWRModel
+    assert loaded.position.slot_share == 0.25
+    assert loaded.position.prior_strength == 160
+
+    meta_path = tmp_path / "tuned" / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps({**meta, "model": "GoneModel"}))
+    with pytest.raises(ValueError, match="GoneModel, which is not loaded"):
+        adj.MutualOpponentModel.load(tmp_path / "tuned")
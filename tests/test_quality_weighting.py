@@ -0,0 +1,36 @@
+"""Tests for opponent-quality weighting inside the rating sweeps."""
+
+import numpy as np
+from adj_helpers import adj, make_matchups, quiet
+
+
+def test_joint_quality_weighting_is_a_fixed_point_of_plain_refits():
+    """IRLS leaves inputs alone and matches a refit at its converged weights."""
+    matchups = make_matchups()
+    before = [m.weight for m in matchups]
+    model = quiet(adj.EnhancedMutualOpponentModel, adj.WRModel(prior_strength=20))
+    quiet(model.fit_with_quality_weighting, matchups, max_iter=5000, tol=1e-12)
+    assert model.converged
+    assert [m.weight for m in matchups] == before
+
+    # Freeze the multipliers implied by the converged opponent ratings
+    opponent = np.array([model.opponent_ratings[m.opponent_id] for m in matchups])
+    quality = model._quality_multipliers(opponent)
+    np.testing.assert_allclose(model.weights, np.array(before) * quality)
+    reweighted = [
+        adj.Matchup(m.player_id, m.opponent_id, m.game_id, m.base_metric, m.volume, w)
+        for m, w in zip(matchups, model.weights)
+    ]
+
+    refit = quiet(adj.MutualOpponentModel, adj.WRModel(prior_strength=20))
+    refit.player_ratings = dict(model.player_ratings)
+    refit.opponent_ratings = dict(model.opponent_ratings)
+    quiet(refit.fit, reweighted, max_iter=5000, tol=1e-12, warm_start=True)
+    assert refit.n_iter <= 2
+    for ratings, expected in [
+        (refit.player_ratings, model.player_ratings),
+        (refit.opponent_ratings, model.opponent_ratings),
+    ]:
+        np.testing.assert_allclose(
+            [ratings[k] for k in expected], list(expected.values()), atol=1e-9
+        )
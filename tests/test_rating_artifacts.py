@@ -0,0 +1,55 @@
+"""Tests for the memory-mapped rating artifacts."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.rating_artifacts import RatingArtifact, write_artifact  # noqa: E402
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    """Two components: players A/B against D1, player C against D2."""
+    tables = {
+        "player": pd.DataFrame(
+            {
+                "key": ["C", "A", "B"],
+                "rating": [0.0, 0.5, -0.5],
+                "weight": [3.0, 10.0, 8.0],
+                "component": [1, 0, 0],
+            }
+        ),
+        "opponent": pd.DataFrame(
+            {"key": ["D2", "D1"], "rating": [0.0, 0.25], "weight": [3.0, 18.0]}
+        ),
+    }
+    arrays = {"component_league_avgs": np.array([1.0, 2.0])}
+    path = write_artifact(tmp_path / "wr", tables, arrays, {"league_avg": 1.2})
+    return RatingArtifact(path)
+
+
+def test_scores_match_stored_ratings(artifact):
+    """Known IDs use their component average; unknown IDs are rated 0."""
+    pred = artifact.predict_many(["A", "C", "new"], ["D1", "D2", "D1"])
+    np.testing.assert_allclose(pred, [1.0 + 0.5 - 0.25, 2.0, 1.2 - 0.25])
+    np.testing.assert_allclose(artifact.adjusted_metric(["B", "new"]), [0.5, 1.2])
+
+    assert artifact.array("player__key").tolist() == ["A", "B", "C"]
+    assert isinstance(artifact.array("player__rating"), np.memmap)
+    assert artifact.meta["columns"]["opponent"] == ["rating", "weight"]
+
+
+def test_rejects_unknown_format(artifact):
+    meta_path = artifact.path / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps({**meta, "format": 99}))
+    with pytest.raises(ValueError, match="Unsupported artifact format"):
+        RatingArtifact(artifact.path)
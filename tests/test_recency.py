@@ -0,0 +1,57 @@
+"""Tests for recency weighting on the absolute week index."""
+
+import numpy as np
+import pytest
+from adj_helpers import adj, quiet
+
+
+def game(season, week, game_id=None):
+    """A unit-weight matchup played in the given season and week."""
+    game_id = game_id or f"{season}_{week}"
+    return adj.Matchup(
+        "WR1", "DEF1", game_id, 0.1, 5.0, season_year=season, week_number=week
+    )
+
+
+@pytest.fixture
+def model():
+    """Enhanced model halving the weight per week slot."""
+    return quiet(adj.EnhancedMutualOpponentModel, adj.WRModel(), recency_decay=0.5)
+
+
+def test_decay_runs_across_seasons_through_the_unused_playoff_slots(model):
+    """Week 1 follows week 22 by one slot and week 18 by five."""
+    matchups = [game(2022, 18), game(2022, 22), game(2023, 1), game(2023, 2)]
+    quiet(model.compute_game_weights, matchups)
+    np.testing.assert_allclose([m.weight for m in matchups], [0.5**6, 0.5**2, 0.5, 1.0])
+    assert model.game_weights == {m.game_id: m.weight for m in matchups}
+
+
+def test_default_reference_is_the_latest_week_of_the_reference_season(model):
+    """Unordered input still decays from the last week played."""
+    matchups = [game(2023, 3), game(2022, 17), game(2023, 5), game(2023, 4)]
+    quiet(model.compute_game_weights, matchups)
+    np.testing.assert_allclose([m.weight for m in matchups], [0.25, 0.5**10, 1.0, 0.5])
+
+    earlier = [game(2022, 16), game(2022, 17), game(2023, 1)]
+    quiet(model.compute_game_weights, earlier, reference_season=2022)
+    np.testing.assert_allclose([m.weight for m in earlier], [0.5, 1.0, 0.5**-6])
+
+
+def test_explicit_reference_week(model):
+    """A reference week past the data decays every game."""
+    matchups = [game(2023, 1), game(2023, 2)]
+    quiet(model.compute_game_weights, matchups, reference_week=4)
+    np.testing.assert_allclose([m.weight for m in matchups], [0.125, 0.25])
+
+
+@pytest.mark.parametrize("field", ["season_year", "week_number"])
+def test_missing_season_or_week_is_rejected(model, field):
+    """Undated matchups raise before any weight is changed."""
+    matchups = [game(2023, 1), game(2023, 2)]
+    setattr(matchups[1], field, None)
+    with pytest.raises(ValueError, match="1 matchups have no season_year"):
+        adj.matchup_week_index(matchups)
+    with pytest.raises(ValueError, match="no season_year/week_number"):
+        quiet(model.compute_game_weights, matchups)
+    assert [m.weight for m in matchups] == [1.0, 1.0]
@@ -0,0 +1,113 @@
+"""Tests for the report engine against a small temporary warehouse."""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.reports.catalog import BRONZE_CHECK, CONTRACTS  # noqa: E402
+from src.reports.engine import QuerySpec, ReportEngine  # noqa: E402
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Connector over a warehouse with silver facts and bronze contracts."""
+    db_path = tmp_path / "warehouse" / "test.duckdb"
+    db_path.parent.mkdir()
+    conn = duckdb.connect(str(db_path))
+    conn.execute("CREATE SCHEMA main_silver")
+    conn.execute("""
+        CREATE TABLE main_silver.fact_contracts AS
+        SELECT * FROM (VALUES
+            ('QB One', 'QB', 'KC', 2020::SMALLINT, 5, 20000, 4000, 10000, 50.0, 20.0),
+            ('QB Two', 'QB', 'BUF', 2021::SMALLINT, 4, 10000, 2500, 2500, 25.0, 12.0),
+            ('WR One', 'WR', 'KC', 2021::SMALLINT, 3, 6000, 2000, 3000, 50.0, 9.0)
+        ) AS t(player_name, position, team_signed_with, start_year, years,
+               total_value_cents, average_salary_cents,
+               guarantee_at_signing_cents, pct_guaranteed_at_signing,
+               aav_pct_of_cap)
+    """)
+    conn.execute("CREATE SCHEMA main_bronze")
+    conn.execute("""
+        CREATE TABLE main_bronze.contracts AS
+        SELECT 1 AS rank, player_name, position, team_signed_with, years,
+               total_value_cents, average_salary_cents
+        FROM main_silver.fact_contracts
+    """)
+    conn.close()
+    with DuckDBConnector(db_path) as connector:
+        yield connector
+
+
+def test_render_applies_only_declared_filters():
+    """Filters a query does not declare are ignored."""
+    query = QuerySpec(
+        name="q",
+        sql="SELECT * FROM t {where}",
+        conditions=("x IS NOT NULL",),
+        filters={"season": "start_year"},
+    )
+    sql, params = query.render(position="QB", season=2021)
+    assert "WHERE x IS NOT NULL AND start_year = $season" in sql
+    assert params == {"season": 2021}
+
+    sql, params = query.render()
+    assert sql.strip().endswith("WHERE x IS NOT NULL")
+    assert params == {}
+
+
+def test_fetch_runs_every_query_with_derived_columns(db):
+    """A slice returns every query's frame with filters and derived columns."""
+    with ReportEngine(db) as engine:
+        frames = engine.fetch(CONTRACTS, position="QB")
+
+    assert set(frames) == {"contracts", "summary", "by_year"}
+    contracts = frames["contracts"]
+    assert contracts["player_name"].tolist() == ["QB One", "QB Two"]
+    assert contracts["guarantee_pct"].tolist() == [50.0, 25.0]
+    assert frames["summary"].loc[0, "total"] == 2
+    assert frames["summary"].loc[0, "max_value"] == 200.0
+    assert frames["by_year"]["start_year"].tolist() == [2020, 2021]
+
+
+def test_run_writes_every_slice(db, tmp_path):
+    """Every position/season slice of every report is written per format."""
+    out_dir = tmp_path / "reports"
+    with ReportEngine(db, max_workers=3) as engine:
+        positions = engine.available_positions()
+        seasons = engine.available_seasons()
+        outputs = engine.run(
+            [CONTRACTS, BRONZE_CHECK],
+            out_dir,
+            positions,
+            seasons,
+            formats=("csv", "parquet"),
+        )
+
+    assert positions == ["QB", "WR"] and seasons == [2020, 2021]
+    # 4 contract slices x 3 queries + 1 unfiltered bronze slice x 2 queries
+    assert len(outputs) == (4 * 3 + 2) * 2
+    assert all(o.path.exists() for o in outputs)
+
+    by_key = {
+        (o.report, o.query, o.position, o.season, o.path.suffix): o for o in outputs
+    }
+    qb_2021 = by_key[("contracts", "contracts", "QB", 2021, ".parquet")]
+    assert qb_2021.rows == 1
+    assert duckdb.sql(f"SELECT player_name FROM '{qb_2021.path}'").fetchall() == [
+        ("QB Two",)
+    ]
+    assert by_key[("contracts", "contracts", "WR", 2020, ".csv")].rows == 0
+    assert by_key[("bronze_check", "sample", None, None, ".csv")].rows == 3
+
+
+def test_run_rejects_unknown_format(db, tmp_path):
+    """Only CSV and Parquet outputs are supported."""
+    with ReportEngine(db) as engine, pytest.raises(ValueError):
+        engine.run([CONTRACTS], tmp_path, formats=("xlsx",))
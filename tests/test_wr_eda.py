@@ -0,0 +1,145 @@
+"""Tests for the WR report's filters and profile (eda/wr_eda.py)."""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import matplotlib
+import pandas as pd
+import pytest
+
+matplotlib.use("Agg")
+
+# Add project root and eda/ to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "eda"))
+
+import wr_eda  # noqa: E402
+
+from src.utils.duckdb_connector import DuckDBConnector  # noqa: E402
+
+SEASONS = pd.DataFrame(
+    {
+        "player_id": ["1", "2", "3", "1", "2", "4", "1"],
+        "player_name": [
+            "Alan Smith",
+            "Ben Jones",
+            "Cal Smithers",
+            "Alan Smith",
+            "Ben Jones",
+            "Dan Brown",
+            "Alan Smith",
+        ],
+        "team": ["KC", "BUF", "DAL", "KC", "BUF", "NYG", "KC"],
+        "season_year": [2022, 2022, 2022, 2023, 2023, 2023, 2024],
+        "receiving_yards": [1200, 800, 450, 1350, 700, 990, 1100],
+        "receptions": [90, 60, 35, 101, 55, 70, 85],
+        "targets": [130, 95, 50, 150, 85, 110, 125],
+        "receiving_td": [9, 5, 2, 12, 4, 7, 8],
+    }
+)
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    """Warehouse holding only main_bronze.wr_season."""
+    db_path = tmp_path / "warehouse" / "test.duckdb"
+    db_path.parent.mkdir()
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE SCHEMA main_bronze")
+        conn.register("seasons", SEASONS)
+        conn.execute("CREATE TABLE main_bronze.wr_season AS SELECT * FROM seasons")
+    return db_path
+
+
+def test_build_filter_and_tag():
+    """Filters become named parameters, and the tag is safe as a path part."""
+    assert wr_eda.build_filter() == ("", {})
+    assert wr_eda.filter_tag() == ""
+
+    where, params = wr_eda.build_filter(2023, "O'Brien Jr.")
+    assert where == "WHERE season_year = $season AND player_name ILIKE $player"
+    assert params == {"season": 2023, "player": "%O'Brien Jr.%"}
+    assert wr_eda.filter_tag(2023, "O'Brien Jr.") == "season2023_player-o-brien-jr"
+    assert wr_eda.filter_tag(player="Smith") == "player-smith"
+
+
+@pytest.mark.parametrize(
+    "season, player", [(None, None), (2023, None), (None, "smith"), (2022, "SMITH")]
+)
+def test_season_profile_matches_per_group_aggregates(warehouse, season, player):
+    """The GROUPING SETS scan equals separate per-season and overall queries."""
+    where, params = wr_eda.build_filter(season, player)
+    with DuckDBConnector(warehouse) as db:
+        seasonal, totals = wr_eda.season_profile(db, where, params)
+
+    rows = SEASONS
+    if season is not None:
+        rows = rows[rows["season_year"] == season]
+    if player:
+        rows = rows[rows["player_name"].str.contains(player, case=False)]
+
+    def profile(group):
+        return pd.Series(
+            {
+                "unique_players": group["player_id"].nunique(),
+                "total_records": len(group),
+                "avg_rec_yards": group["receiving_yards"].mean(),
+                "avg_receptions": group["receptions"].mean(),
+                "avg_targets": group["targets"].mean(),
+                "avg_td": group["receiving_td"].mean(),
+                "max_rec_yards": group["receiving_yards"].max(),
+                "max_td": group["receiving_td"].max(),
+            }
+        )
+
+    expected = rows.groupby("season_year").apply(profile, include_groups=False)
+    pd.testing.assert_frame_equal(
+        seasonal.set_index("season_year")[expected.columns],
+        expected,
+        check_dtype=False,
+        check_index_type=False,
+    )
+    pd.testing.assert_series_equal(
+        totals[expected.columns],
+        profile(rows),
+        check_dtype=False,
+        check_names=False,
+    )
+    assert totals["first_season"] == rows["season_year"].min()
+    assert totals["last_season"] == rows["season_year"].max()
+
+
+def test_season_profile_with_no_matching_rows(warehouse):
+    """An empty filter result has no seasons and a zero-count total."""
+    where, params = wr_eda.build_filter(1999)
+    with DuckDBConnector(warehouse) as db:
+        seasonal, totals = wr_eda.season_profile(db, where, params)
+    assert seasonal.empty
+    assert totals["total_records"] == 0
+
+
+def test_filtered_run_writes_tagged_outputs(warehouse, tmp_path, monkeypatch):
+    """A filtered report leaves the published league-wide outputs alone."""
+    figs_dir = tmp_path / "docs" / "figures" / "wr"
+    published = figs_dir.parent / "wr_summary_stats.csv"
+    published.parent.mkdir(parents=True)
+    published.write_text("Metric,Value\npublished,1\n")
+    monkeypatch.setattr(wr_eda, "FIGS_DIR", figs_dir)
+    monkeypatch.setattr(wr_eda, "DuckDBConnector", lambda: DuckDBConnector(warehouse))
+    wr_eda.main(["--season", "2023", "--player", "Smith", "--draft"])
+
+    tag = "season2023_player-smith"
+    summary = pd.read_csv(figs_dir.parent / f"wr_summary_stats_{tag}.csv")
+    values = dict(zip(summary["Metric"], summary["Value"]))
+    assert values["Total WR seasons"] == "1"
+    assert values["Years covered"] == "2023-2023"
+    assert published.read_text() == "Metric,Value\npublished,1\n"
+
+    drafts = figs_dir / tag / "draft"
+    assert sorted(p.stem for p in drafts.glob("*.png")) == [
+        "top_wr_career_yards",
+        "wr_seasonal_trends",
+    ]
+    assert not any(figs_dir.glob("*.png"))